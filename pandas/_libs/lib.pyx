@@ -9,7 +9,7 @@ import cython
 from cython import Py_ssize_t
 
 from cpython cimport (Py_INCREF, PyTuple_SET_ITEM,
-                      PyTuple_New,
+                      PyTuple_New, PyBytes_FromStringAndSize,
                       Py_EQ,
                       PyObject_RichCompareBool)
 
@@ -359,6 +359,107 @@ def fast_zip(list ndarrays):
     return result
 
 
+cdef Py_ssize_t _check_columns(list columns) except -1:
+    # the common length of the columns
+    cdef:
+        Py_ssize_t n = 0
+        list col
+
+    if columns:
+        n = len(columns[0])
+    for col in columns:
+        if len(col) != n:
+            raise ValueError('all columns must be same length')
+    return n
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def to_tuples(list columns, object klass=None) -> list:
+    """
+    Materialize the rows of a list of columns as tuples.
+
+    Parameters
+    ----------
+    columns : list of lists
+        The boxed values of the columns, of the same length.
+    klass : tuple subclass, optional
+        The type of the rows, e.g. a namedtuple class.
+
+    Returns
+    -------
+    list of tuples
+    """
+    cdef:
+        Py_ssize_t i, j, k, n
+        list result
+        object row, val
+
+    k = len(columns)
+    n = _check_columns(columns)
+
+    result = [None] * n
+    for i in range(n):
+        row = PyTuple_New(k)
+        for j in range(k):
+            val = (<list>columns[j])[i]
+            PyTuple_SET_ITEM(row, j, val)
+            Py_INCREF(val)
+        if klass is not None:
+            row = tuple.__new__(klass, row)
+        result[i] = row
+
+    return result
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def to_dicts(list columns, list keys, object into=dict) -> list:
+    """
+    Materialize the rows of a list of columns as mappings of the keys to
+    the values of the row.
+
+    Parameters
+    ----------
+    columns : list of lists
+        The boxed values of the columns, of the same length.
+    keys : list
+        The key of each column.
+    into : class, default dict
+        The mapping type of the rows, called without arguments.
+
+    Returns
+    -------
+    list of mappings
+    """
+    cdef:
+        Py_ssize_t i, j, k, n
+        list result
+        dict d
+        object row
+
+    k = len(columns)
+    if len(keys) != k:
+        raise ValueError('keys and columns must be same length')
+    n = _check_columns(columns)
+
+    result = [None] * n
+    if into is dict:
+        for i in range(n):
+            d = {}
+            for j in range(k):
+                d[keys[j]] = (<list>columns[j])[i]
+            result[i] = d
+    else:
+        for i in range(n):
+            row = into()
+            for j in range(k):
+                row[keys[j]] = (<list>columns[j])[i]
+            result[i] = row
+
+    return result
+
+
 def get_reverse_indexer(ndarray[int64_t] indexer, Py_ssize_t length):
     """
     Reverse indexing operation.
@@ -2298,6 +2399,84 @@ def to_object_array_tuples(rows: list):
     return result
 
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def decode_fixed_width(const uint8_t[:, :] values, object encoding=None,
+                       bint nul_terminated=False, bint strip_spaces=False,
+                       bint blank_missing=False):
+    """
+    Convert a matrix of fixed-width byte strings into an object array.
+
+    Trailing NUL bytes (and spaces with `strip_spaces`) are removed from
+    each row before it is decoded. Repeated values are decoded only once
+    and share the same string object in the result.
+
+    Parameters
+    ----------
+    values : 2-d uint8 array (N, width)
+        One string per row.
+    encoding : str or None
+        Encoding of the strings. If None, bytes are returned.
+    nul_terminated : bool, default False
+        Whether each string ends at its first NUL byte.
+    strip_spaces : bool, default False
+        Whether to strip trailing spaces as well.
+    blank_missing : bool, default False
+        Whether empty strings are returned as NaN.
+
+    Returns
+    -------
+    result : ndarray[object]
+    """
+    cdef:
+        Py_ssize_t i, j, end, n = values.shape[0], width = values.shape[1]
+        const uint8_t *row
+        bytes raw
+        object val
+        dict memo = {}
+        ndarray[object] result = np.empty(n, dtype=object)
+
+    if width == 0:
+        if blank_missing:
+            result[:] = NaN
+        elif encoding is None:
+            result[:] = b''
+        else:
+            result[:] = u''
+        return result
+
+    if values.strides[1] != 1:
+        values = np.ascontiguousarray(values)
+
+    for i in range(n):
+        row = &values[i, 0]
+        end = width
+        if nul_terminated:
+            for j in range(width):
+                if row[j] == 0:
+                    end = j
+                    break
+        while end > 0 and (row[end - 1] == 0 or
+                           (strip_spaces and row[end - 1] == 32)):
+            end -= 1
+
+        if end == 0 and blank_missing:
+            result[i] = NaN
+            continue
+
+        raw = PyBytes_FromStringAndSize(<char *>row, end)
+        val = memo.get(raw)
+        if val is None:
+            if encoding is None:
+                val = raw
+            else:
+                val = raw.decode(encoding)
+            memo[raw] = val
+        result[i] = val
+
+    return result
+
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def fast_multiget(dict mapping, ndarray keys, default=np.nan):
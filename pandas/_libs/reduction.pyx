@@ -18,6 +18,9 @@ cnp.import_array()
 cimport util
 from lib import maybe_convert_objects
 
+cdef extern from "Python.h":
+    Py_ssize_t Py_REFCNT(object o)
+
 
 cdef _get_result_array(object obj, Py_ssize_t size, Py_ssize_t cnt):
 
@@ -544,6 +547,79 @@ def apply_frame_axis0(object frame, object f, object names,
     return results, mutated
 
 
+def apply_frame_axis1(object f, ndarray values, object index, list names,
+                      list results, list successes=None):
+    """
+    Apply a function to the rows of a 2-d ndarray as Series, while avoiding
+    Series construction overhead.
+
+    A single Series is reused for the rows: between the calls, the values
+    of its block are replaced by a view on the next row. If the function
+    keeps a reference to the Series, its manager or its block (e.g. returns
+    the row or a Series built from it) or replaces its index or internals,
+    the next row gets a new Series.
+
+    Parameters
+    ----------
+    f : function
+    values : ndarray
+        The rows.
+    index : Index
+        The index of the Series.
+    names : list
+        The name of the Series of each row.
+    results : list
+        The results are appended to it. If the function raises, its length
+        is the position of the row.
+    successes : list, optional
+        If given, the exceptions raised by the function are ignored and
+        the positions of the rows it succeeded on are appended to it.
+    """
+    cdef:
+        Py_ssize_t i, n = len(values)
+        Py_ssize_t row_refs, mgr_refs, block_refs
+        bint ignore_failures = successes is not None
+        object row = None, mgr = None, block = None, res
+
+    from pandas.core.series import Series
+
+    for i in range(n):
+        if row is None:
+            row = Series(values[i], index=index, name=names[i])
+            mgr = row._data
+            block = mgr._block
+            index = mgr.axes[0]
+            if block.values.dtype != values.dtype:
+                # converted by the constructor, no reuse
+                block = None
+        else:
+            object.__setattr__(block, 'values', values[i])
+            object.__setattr__(row, '_name', names[i])
+            row._reset_cache()
+
+        row_refs = Py_REFCNT(row)
+        mgr_refs = Py_REFCNT(mgr)
+        block_refs = Py_REFCNT(block)
+        try:
+            res = f(row)
+        except Exception:
+            if not ignore_failures:
+                raise
+        else:
+            results.append(res)
+            if ignore_failures:
+                successes.append(i)
+        res = None
+
+        # a Series sharing the manager or the block of the row (e.g.
+        # Series(row) or row.astype(row.dtype, copy=False)) would see the
+        # values of the next row
+        if (Py_REFCNT(row) != row_refs or Py_REFCNT(mgr) != mgr_refs or
+                Py_REFCNT(block) != block_refs or row._data is not mgr or
+                mgr._block is not block or mgr.axes[0] is not index):
+            row = None
+
+
 cdef class BlockSlider:
     """
     Only capable of sliding on axis=0
@@ -65,6 +65,17 @@ except ImportError:
 
 from pandas.compat.chainmap import DeepChainMap
 
+# pickle protocol 5 with out-of-band buffers (PEP 574), from the standard
+# library (Python >= 3.8) or the pickle5 backport
+if sys.version_info >= (3, 8):
+    import pickle as pickle5
+else:
+    try:
+        import pickle5
+    except ImportError:
+        pickle5 = None
+PickleBuffer = getattr(pickle5, 'PickleBuffer', None)
+
 
 if PY3:
     def isidentifier(s):
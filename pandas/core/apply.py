@@ -367,6 +367,38 @@ class FrameColumnApply(FrameApply):
                 for i, (arr, name) in enumerate(zip(self.values,
                                                     self.index)))
 
+    def apply_series_generator(self):
+        from pandas import Series
+        if self.obj._constructor_sliced is not Series:
+            return super(FrameColumnApply, self).apply_series_generator()
+
+        # apply to a single Series whose values are swapped for each row,
+        # see reduction.apply_frame_axis1
+        res_index = self.result_index
+        results = []
+        successes = [] if self.ignore_failures else None
+        try:
+            reduction.apply_frame_axis1(self.f, self.values, self.columns,
+                                        list(self.index), results, successes)
+        except Exception as e:
+            if hasattr(e, 'args'):
+                k = res_index[len(results)]
+                e.args = e.args + ('occurred at index %s' %
+                                   pprint_thing(k), )
+            raise
+
+        if successes is None:
+            self.results = dict(enumerate(results))
+        else:
+            self.results = dict(zip(successes, results))
+
+            # so will work with MultiIndex
+            if len(successes) < len(res_index):
+                res_index = res_index.take(successes)
+
+        self.res_index = res_index
+        self.res_columns = self.result_columns
+
     @property
     def result_index(self):
         return self.index
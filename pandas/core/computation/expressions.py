@@ -32,6 +32,10 @@ _ALLOWED_DTYPES = {
 # the minimum prod shape that we will use numexpr
 _MIN_ELEMENTS = 10000
 
+# the ops that can be evaluated into the left operand
+_INPLACE_UFUNCS = {'+': np.add, '-': np.subtract, '*': np.multiply,
+                   '/': np.true_divide}
+
 
 def set_use_numexpr(v=True):
     # set/unset to use numexpr
@@ -207,6 +211,39 @@ def evaluate(op, op_str, a, b, use_numexpr=True,
     return _evaluate_standard(op, op_str, a, b)
 
 
+def evaluate_inplace(op_str, a, b, use_numexpr=True):
+    """ evaluate the expression of the op on a and b into a, without
+        allocating a result
+
+        Parameters
+        ----------
+
+        op_str: the string version of the op, one of the keys of
+                _INPLACE_UFUNCS
+        a :     left operand, an ndarray with the dtype of the result
+        b :     right operand
+        use_numexpr : whether to try to use numexpr (default True)
+        """
+
+    if (use_numexpr and _USE_NUMEXPR and
+            _can_use_numexpr(None, op_str, a, b, 'evaluate')):
+        try:
+            ne.evaluate('a_value {op} b_value'.format(op=op_str),
+                        local_dict={'a_value': a, 'b_value': b},
+                        out=a, casting='safe', truediv=True)
+            if _TEST_MODE:
+                _store_test_result(True)
+            return a
+        except (TypeError, ValueError):
+            # the result can not be stored in a by numexpr
+            pass
+
+    if _TEST_MODE:
+        _store_test_result(False)
+    with np.errstate(all='ignore'):
+        return _INPLACE_UFUNCS[op_str](a, b, out=a)
+
+
 def where(cond, a, b, use_numexpr=True):
     """ evaluate the where condition cond on a and b
 
@@ -9,6 +9,10 @@ If you need to make sure options are available even before a certain
 module is imported, register them here rather then in the module.
 
 """
+import re
+
+from pandas.compat import integer_types, string_types
+
 import pandas.core.config as cf
 from pandas.core.config import (
     is_bool, is_callable, is_instance_factory, is_int, is_one_of_factory,
@@ -45,11 +49,45 @@ def use_numexpr_cb(key):
     expressions.set_use_numexpr(cf.get_option(key))
 
 
+inplace_arithmetic_doc = """
+: bool
+    Evaluate the inplace operators +=, -=, *= and /= of Series and
+    DataFrames into their values, without allocating a result, when all
+    blocks are numeric and keep their dtype, the default is False.
+    Views, shallow copies and the arrays an object was built from without
+    copying then see the change as well.
+    Valid values: False,True
+"""
+
+
+def inplace_arithmetic_cb(key):
+    from pandas.core import ops
+    ops.set_use_inplace(cf.get_option(key))
+
+
+reduction_threads_doc = """
+: int
+    Number of threads to reduce the columns of large DataFrames along the
+    index with, e.g. in df.sum(), df.mean() or df.std(); the blocks are
+    split in ranges of columns. 0 or 1 reduce on the calling thread, the
+    default is 0.
+"""
+
+
+def reduction_threads_cb(key):
+    from pandas.core.internals.managers import _set_reduction_threads
+    _set_reduction_threads(cf.get_option(key))
+
+
 with cf.config_prefix('compute'):
     cf.register_option('use_bottleneck', True, use_bottleneck_doc,
                        validator=is_bool, cb=use_bottleneck_cb)
     cf.register_option('use_numexpr', True, use_numexpr_doc,
                        validator=is_bool, cb=use_numexpr_cb)
+    cf.register_option('inplace_arithmetic', False, inplace_arithmetic_doc,
+                       validator=is_bool, cb=inplace_arithmetic_cb)
+    cf.register_option('reduction_threads', 0, reduction_threads_doc,
+                       validator=is_int, cb=reduction_threads_cb)
 #
 # options from the "display" namespace
 
@@ -433,6 +471,66 @@ with cf.config_prefix('mode'):
     cf.register_option('chained_assignment', 'warn', chained_assignment,
                        validator=is_one_of_factory([None, 'warn', 'raise']))
 
+copy_on_write_doc = """
+: boolean
+    True means that copies and slices of DataFrames and Series share the
+    data with the original object, which is only copied on the first write
+    to either of them (copy-on-write).
+"""
+
+
+def copy_on_write_cb(key):
+    from pandas.core.internals.blocks import _use_copy_on_write
+    _use_copy_on_write(key)
+
+
+with cf.config_prefix('mode'):
+    cf.register_option('copy_on_write', False, copy_on_write_doc,
+                       validator=is_bool, cb=copy_on_write_cb)
+
+consolidation_doc = """
+: 'eager', 'lazy', int or str
+    When the blocks of the same dtype of a DataFrame are merged
+    (consolidated) before operations that can also work block by block,
+    e.g. reductions, fillna or reindex. 'eager' always consolidates, 'lazy'
+    never does. An int consolidates once there are more blocks than that,
+    a size in bytes such as '64MB' when the blocks to be merged hold at
+    most that many bytes. The default is 'eager'.
+"""
+
+_size_units = {'B': 1, 'KB': 2 ** 10, 'MB': 2 ** 20, 'GB': 2 ** 30}
+
+
+def _parse_consolidation(value):
+    """ return (policy, threshold) for a value of mode.consolidation """
+    if value in ('eager', 'lazy'):
+        return value, None
+    if (isinstance(value, integer_types) and not isinstance(value, bool) and
+            value >= 0):
+        return 'blocks', value
+    if isinstance(value, string_types):
+        match = re.match(r'^\s*(\d+(?:\.\d*)?)\s*([KMG]?B)\s*$', value.upper())
+        if match:
+            size, unit = match.groups()
+            return 'bytes', int(float(size) * _size_units[unit])
+    raise ValueError("Value must be 'eager', 'lazy', a non-negative number "
+                     "of blocks or a size such as '64MB'")
+
+
+def is_consolidation_policy(value):
+    _parse_consolidation(value)
+
+
+def consolidation_cb(key):
+    from pandas.core.internals.managers import _set_consolidation_policy
+    _set_consolidation_policy(*_parse_consolidation(cf.get_option(key)))
+
+
+with cf.config_prefix('mode'):
+    cf.register_option('consolidation', 'eager', consolidation_doc,
+                       validator=is_consolidation_policy,
+                       cb=consolidation_cb)
+
 # Set up the io.excel specific configuration.
 writer_engine_doc = """
 : string
@@ -480,6 +578,43 @@ with cf.config_prefix('io.parquet'):
         'engine', 'auto', parquet_engine_doc,
         validator=is_one_of_factory(['auto', 'pyarrow', 'fastparquet']))
 
+# Set up the io.remote specific configuration.
+remote_threads_doc = """
+: int
+    Number of threads fetching byte ranges of s3 and gcs files in parallel
+    while they are read. If 0 (the default) and no cache directory is set,
+    the file objects of s3fs and gcsfs are used directly.
+"""
+
+remote_block_size_doc = """
+: int
+    Size in bytes of the ranges fetched from s3 and gcs files.
+"""
+
+remote_readahead_doc = """
+: int
+    Number of blocks fetched ahead of the read position of s3 and gcs
+    files. Bounds the memory held per file to (readahead + 1) blocks.
+"""
+
+remote_cache_dir_doc = """
+: str
+    Directory of a local cache of the blocks read from s3 and gcs files,
+    keyed by url, etag and byte range, so that repeated reads of an
+    unchanged object are served from disk. None (the default) disables
+    the cache.
+"""
+
+with cf.config_prefix('io.remote'):
+    cf.register_option('threads', 0, remote_threads_doc, validator=is_int)
+    cf.register_option('block_size', 8 * 1024 ** 2, remote_block_size_doc,
+                       validator=is_int)
+    cf.register_option('readahead', 4, remote_readahead_doc,
+                       validator=is_int)
+    cf.register_option('cache_dir', None, remote_cache_dir_doc,
+                       validator=is_instance_factory(
+                           (type(None),) + string_types))
+
 # --------
 # Plotting
 # ---------
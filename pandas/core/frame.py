@@ -22,7 +22,7 @@ from textwrap import dedent
 import numpy as np
 import numpy.ma as ma
 
-from pandas._libs import lib, algos as libalgos
+from pandas._libs import lib, algos as libalgos, tslib, tslibs
 
 from pandas.util._decorators import (Appender, Substitution,
                                      rewrite_axis_style_signature,
@@ -306,8 +306,14 @@ class DataFrame(NDFrame):
         RangeIndex (0, 1, 2, ..., n) if no column labels are provided
     dtype : dtype, default None
         Data type to force. Only a single dtype is allowed. If None, infer
-    copy : boolean, default False
-        Copy data from inputs. Only affects DataFrame / 2d ndarray input
+    copy : boolean, default None
+        Copy data from inputs. For dict input, None behaves like True;
+        ``copy=False`` wraps each array in a block of its own without
+        copying and defers the consolidation of the blocks. For DataFrame /
+        2d ndarray input, None behaves like False.
+
+        .. versionchanged:: 0.24.0
+           ``copy=False`` avoids the copy of dict input.
 
     Examples
     --------
@@ -371,12 +377,16 @@ class DataFrame(NDFrame):
     # Constructors
 
     def __init__(self, data=None, index=None, columns=None, dtype=None,
-                 copy=False):
+                 copy=None):
         if data is None:
             data = {}
         if dtype is not None:
             dtype = self._validate_dtype(dtype)
 
+        # dict input is copied unless copy=False is passed explicitly
+        copy_dict = copy is None or bool(copy)
+        copy = bool(copy)
+
         if isinstance(data, DataFrame):
             data = data._data
 
@@ -384,7 +394,8 @@ class DataFrame(NDFrame):
             mgr = self._init_mgr(data, axes=dict(index=index, columns=columns),
                                  dtype=dtype, copy=copy)
         elif isinstance(data, dict):
-            mgr = init_dict(data, index, columns, dtype=dtype)
+            mgr = init_dict(data, index, columns, dtype=dtype,
+                            copy=copy_dict)
         elif isinstance(data, ma.MaskedArray):
             import numpy.ma.mrecords as mrecords
             # masked recarray
@@ -897,29 +908,42 @@ class DataFrame(NDFrame):
         Animal(Index='dog', num_legs=4, num_wings=0)
         Animal(Index='hawk', num_legs=2, num_wings=2)
         """
-        arrays = []
+        columns = []
         fields = []
         if index:
-            arrays.append(self.index)
+            columns.append(list(self.index))
             fields.append("Index")
-
-        # use integer indexing because of possible duplicate column names
-        arrays.extend(self.iloc[:, k] for k in range(len(self.columns)))
+        columns.extend(self._column_lists())
 
         # Python 3 supports at most 255 arguments to constructor, and
         # things get slow with this many fields in Python 2
+        itertuple = None
         if name is not None and len(self.columns) + index < 256:
             # `rename` is unsupported in Python 2.6
             try:
                 itertuple = collections.namedtuple(name,
                                                    fields + list(self.columns),
                                                    rename=True)
-                return map(itertuple._make, zip(*arrays))
             except Exception:
                 pass
 
         # fallback to regular tuples
-        return zip(*arrays)
+        return _iter_rows(columns, itertuple)
+
+    def _column_lists(self):
+        """
+        Return the values of each column as a list of scalars, as
+        ``Series.tolist`` does, read from the blocks directly.
+        """
+        lists = [None] * len(self.columns)
+        for blk in self._data.blocks:
+            if isinstance(blk.values, np.ndarray) and blk.values.ndim == 2:
+                for i, loc in enumerate(blk.mgr_locs.indexer):
+                    lists[loc] = _boxed_list(blk.values[i])
+            else:
+                # one column per block
+                lists[blk.mgr_locs.indexer[0]] = _boxed_list(blk.values)
+        return lists
 
     items = iteritems
 
@@ -1227,10 +1251,11 @@ class DataFrame(NDFrame):
             return into_c((k, com.maybe_box_datetimelike(v))
                           for k, v in compat.iteritems(self))
         elif orient.lower().startswith('r'):
-            return [
-                into_c((k, com.maybe_box_datetimelike(v))
-                       for k, v in compat.iteritems(row._asdict()))
-                for row in self.itertuples(index=False)]
+            columns = self._column_lists()
+            for i, dtype in enumerate(self.dtypes):
+                if is_object_dtype(dtype):
+                    columns[i] = lmap(com.maybe_box_datetimelike, columns[i])
+            return lib.to_dicts(columns, list(self.columns), into_c)
         elif orient.lower().startswith('i'):
             if not self.index.is_unique:
                 raise ValueError(
@@ -1664,8 +1689,64 @@ class DataFrame(NDFrame):
             raise ValueError("'orient' must be either 'columns' or 'index'")
 
     @classmethod
-    def _from_arrays(cls, arrays, columns, index, dtype=None):
-        mgr = arrays_to_mgr(arrays, columns, index, columns, dtype=dtype)
+    def from_arrays(cls, arrays, columns=None, index=None, dtype=None,
+                    consolidate=True):
+        """
+        Construct a DataFrame from a list of arrays.
+
+        .. versionadded:: 0.24.0
+
+        Parameters
+        ----------
+        arrays : list of array-like or Series
+            The columns of the frame.
+        columns : sequence of column labels, optional
+            Defaults to RangeIndex (0, 1, 2, ..., n).
+        index : Index or array-like, optional
+            Defaults to the index of the Series, or a RangeIndex.
+        dtype : dtype, default None
+            Data type to force. Only a single dtype is allowed.
+        consolidate : boolean, default True
+            Stack the arrays of the same dtype into consolidated blocks. If
+            False, each array is wrapped in a block of its own without
+            copying, and the consolidation is deferred until an operation
+            requires it. The frame then shares memory with the arrays.
+
+        Returns
+        -------
+        DataFrame
+
+        See Also
+        --------
+        DataFrame.from_dict : From dicts of Series, arrays, or dicts.
+
+        Examples
+        --------
+        >>> a = np.arange(3)
+        >>> df = pd.DataFrame.from_arrays([a, a * 0.5], columns=['a', 'b'],
+        ...                               consolidate=False)
+        >>> df
+           a    b
+        0  0  0.0
+        1  1  0.5
+        2  2  1.0
+        >>> np.shares_memory(df['a'].values, a)
+        True
+        """
+        if columns is None:
+            columns = ibase.default_index(len(arrays))
+        columns = ensure_index(columns)
+        if len(columns) != len(arrays):
+            raise ValueError('{0} columns passed, passed data had {1} '
+                             'columns'.format(len(columns), len(arrays)))
+        return cls._from_arrays(arrays, columns, index, dtype=dtype,
+                                consolidate=consolidate)
+
+    @classmethod
+    def _from_arrays(cls, arrays, columns, index, dtype=None,
+                     consolidate=True):
+        mgr = arrays_to_mgr(arrays, columns, index, columns, dtype=dtype,
+                            consolidate=consolidate)
         return cls(mgr)
 
     @classmethod
@@ -1965,6 +2046,28 @@ class DataFrame(NDFrame):
         from pandas.io.feather_format import to_feather
         to_feather(self, fname)
 
+    def to_blocks(self, path):
+        """
+        Write out the DataFrame in the native block format.
+
+        Each block of the DataFrame is stored as a raw array together with
+        its dtype and placement, so that :func:`read_blocks` can rebuild the
+        blocks directly over a memory map of the file.
+
+        .. versionadded:: 0.24.0
+
+        Parameters
+        ----------
+        path : str
+            string file path
+
+        See Also
+        --------
+        read_blocks : Load a DataFrame from the native block format.
+        """
+        from pandas.io.blocks import to_blocks
+        to_blocks(self, path)
+
     def to_parquet(self, fname, engine='auto', compression='snappy',
                    index=None, partition_cols=None, **kwargs):
         """
@@ -2633,6 +2736,9 @@ class DataFrame(NDFrame):
         return self._set_value(index, col, value, takeable=takeable)
 
     def _set_value(self, index, col, value, takeable=False):
+        if self._data._unshare():
+            # the cached columns are views on the shared values
+            self._clear_item_cache()
         try:
             if takeable is True:
                 series = self._iget_item_cache(col)
@@ -7164,17 +7270,26 @@ class DataFrame(NDFrame):
         if axis == 1 and self._is_mixed_type and self._is_datelike_mixed_type:
             numeric_only = True
 
+        def blockwise(data):
+            # reduce the columns of each block separately, instead of
+            # consolidating or interleaving the blocks first
+            if axis == 0:
+                return data._data.reduce_blocks(f)
+            return None
+
         if numeric_only is None:
             try:
-                values = self.values
-                result = f(values)
-
-                if (filter_type == 'bool' and is_object_dtype(values) and
-                        axis is None):
-                    # work around https://github.com/numpy/numpy/issues/10489
-                    # TODO: combine with hasattr(result, 'dtype') further down
-                    # hard since we don't have `values` down there.
-                    result = np.bool_(result)
+                result = blockwise(self)
+                if result is None:
+                    values = self.values
+                    result = f(values)
+
+                    if (filter_type == 'bool' and is_object_dtype(values) and
+                            axis is None):
+                        # work around numpy/numpy#10489
+                        # TODO: combine with hasattr(result, 'dtype') further
+                        # down hard since we don't have `values` down there.
+                        result = np.bool_(result)
             except Exception as e:
 
                 # try by-column first
@@ -7223,11 +7338,12 @@ class DataFrame(NDFrame):
                     msg = ("Generating numeric_only data with filter_type {f}"
                            "not supported.".format(f=filter_type))
                     raise NotImplementedError(msg)
-                values = data.values
                 labels = data._get_agg_axis(axis)
             else:
-                values = self.values
-            result = f(values)
+                data = self
+            result = blockwise(data)
+            if result is None:
+                result = f(data.values)
 
         if hasattr(result, 'dtype') and is_object_dtype(result.dtype):
             try:
@@ -7725,6 +7841,30 @@ ops.add_flex_arithmetic_methods(DataFrame)
 ops.add_special_arithmetic_methods(DataFrame)
 
 
+def _boxed_list(values):
+    # the values of a column as a list of scalars, like Series.tolist;
+    # datetimes and timedeltas are boxed in a single call
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind == 'M':
+            values = tslib.ints_to_pydatetime(values.view('i8'),
+                                              box='timestamp')
+        elif values.dtype.kind == 'm':
+            values = tslibs.ints_to_pytimedelta(values.view('i8'), box=True)
+        return values.tolist()
+    return list(values)
+
+
+def _iter_rows(columns, klass=None, chunksize=10000):
+    # the rows of lists of column values as tuples (of class klass),
+    # materialized in chunks so that they are not all held at once
+    n = len(columns[0]) if columns else 0
+    for start in range(0, n, chunksize):
+        rows = lib.to_tuples([col[start:start + chunksize] for col in columns],
+                             klass)
+        for row in rows:
+            yield row
+
+
 def _from_nested_dict(data):
     # TODO: this should be seriously cythonized
     new_data = OrderedDict()
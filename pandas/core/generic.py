@@ -44,6 +44,7 @@ import pandas.core.indexing as indexing
 from pandas.core.internals import BlockManager
 from pandas.core.ops import _align_method_FRAME
 
+from pandas.io.common import _IOReport
 from pandas.io.formats.format import DataFrameFormatter, format_percentiles
 from pandas.io.formats.printing import pprint_thing
 from pandas.tseries.frequencies import to_offset
@@ -1063,7 +1064,7 @@ class NDFrame(PandasObject, SelectionMixin):
         if com.count_not_none(*axes.values()) == 0:
             raise TypeError('must pass an index to rename')
 
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
         result = self if inplace else self.copy(deep=copy)
 
         # start in the axis order to eliminate too many copies
@@ -2109,9 +2110,11 @@ class NDFrame(PandasObject, SelectionMixin):
                                    index_label=index_label,
                                    merge_cells=merge_cells,
                                    inf_rep=inf_rep)
-        formatter.write(excel_writer, sheet_name=sheet_name, startrow=startrow,
-                        startcol=startcol, freeze_panes=freeze_panes,
-                        engine=engine)
+        with _IOReport('to_excel', excel_writer, 'w') as report:
+            report(df)
+            formatter.write(excel_writer, sheet_name=sheet_name,
+                            startrow=startrow, startcol=startcol,
+                            freeze_panes=freeze_panes, engine=engine)
 
     def to_json(self, path_or_buf=None, orient=None, date_format=None,
                 double_precision=10, force_ascii=True, date_unit='ms',
@@ -2385,7 +2388,7 @@ class NDFrame(PandasObject, SelectionMixin):
                                   **kwargs)
 
     def to_sql(self, name, con, schema=None, if_exists='fail', index=True,
-               index_label=None, chunksize=None, dtype=None):
+               index_label=None, chunksize=None, dtype=None, method=None):
         """
         Write records stored in a DataFrame to a SQL database.
 
@@ -2423,6 +2426,19 @@ class NDFrame(PandasObject, SelectionMixin):
             Specifying the datatype for columns. The keys should be the column
             names and the values should be the SQLAlchemy types or strings for
             the sqlite3 legacy mode.
+        method : {None, 'multi', callable}, default None
+            Controls the SQL insertion clause used:
+
+            * None : Uses standard SQL ``INSERT`` clause (one per row).
+            * 'multi': Pass multiple values in a single ``INSERT`` clause.
+              Without `chunksize`, rows are batched to stay within the
+              bound parameter limit of the driver.
+            * callable with signature ``(pd_table, conn, keys, data_iter)``.
+
+            Details and a sample callable implementation can be found in the
+            section :ref:`insert method <io.sql.method>`.
+
+            .. versionadded:: 0.24.0
 
         Raises
         ------
@@ -2504,10 +2520,57 @@ class NDFrame(PandasObject, SelectionMixin):
         from pandas.io import sql
         sql.to_sql(self, name, con, schema=schema, if_exists=if_exists,
                    index=index, index_label=index_label, chunksize=chunksize,
-                   dtype=dtype)
+                   dtype=dtype, method=method)
+
+    def to_sql_async(self, name, con, schema=None, if_exists='fail',
+                     index=True, index_label=None, chunksize=None, dtype=None,
+                     method=None):
+        """
+        Write records stored in a DataFrame to a SQL database without
+        blocking the event loop.
+
+        Awaitable variant of :meth:`DataFrame.to_sql` for asyncio
+        applications, requires Python 3.6 or later.
+
+        .. versionadded:: 0.24.0
+
+        Parameters
+        ----------
+        name : string
+            Name of SQL table.
+        con : async DB-API connection or sqlalchemy AsyncConnection
+            For async DB-API connections (e.g. aiosqlite) only the SQLite
+            flavor is supported, as with sqlite3 connections in
+            :meth:`DataFrame.to_sql`.
+        schema, if_exists, index, index_label, chunksize, dtype, method
+            See :meth:`DataFrame.to_sql`. A callable `method` may be a
+            coroutine function.
+
+        Returns
+        -------
+        coroutine
+
+        See Also
+        --------
+        DataFrame.to_sql : Write records to a SQL database.
+        pandas.io.sql.read_sql_query_async : Awaitable read of a SQL query.
+
+        Examples
+        --------
+        >>> async with aiosqlite.connect('data.db') as con:  # doctest: +SKIP
+        ...     await df.to_sql_async('data', con, if_exists='append')
+        """
+        if not compat.PY36:
+            raise NotImplementedError("to_sql_async requires Python 3.6 or "
+                                      "later")
+        from pandas.io import sql
+        return sql.to_sql_async(self, name, con, schema=schema,
+                                if_exists=if_exists, index=index,
+                                index_label=index_label, chunksize=chunksize,
+                                dtype=dtype, method=method)
 
     def to_pickle(self, path, compression='infer',
-                  protocol=pkl.HIGHEST_PROTOCOL):
+                  protocol=pkl.HIGHEST_PROTOCOL, out_of_band=False):
         """
         Pickle (serialize) object to file.
 
@@ -2532,6 +2595,14 @@ class NDFrame(PandasObject, SelectionMixin):
 
             .. [1] https://docs.python.org/3/library/pickle.html
             .. versionadded:: 0.21.0
+        out_of_band : bool, default False
+            Write the data buffers of the object out-of-band after the
+            pickle stream, aligned so that ``read_pickle(path, mmap=True)``
+            can memory-map them. Such files can only be read with
+            :func:`read_pickle`. Requires pickle protocol 5 (Python 3.8+ or
+            the ``pickle5`` package).
+
+            .. versionadded:: 0.24.0
 
         See Also
         --------
@@ -2566,7 +2637,7 @@ class NDFrame(PandasObject, SelectionMixin):
         """
         from pandas.io.pickle import to_pickle
         return to_pickle(self, path, compression=compression,
-                         protocol=protocol)
+                         protocol=protocol, out_of_band=out_of_band)
 
     def to_clipboard(self, excel=True, sep=None, **kwargs):
         r"""
@@ -2992,7 +3063,9 @@ class NDFrame(PandasObject, SelectionMixin):
                                  date_format=date_format,
                                  doublequote=doublequote,
                                  escapechar=escapechar, decimal=decimal)
-        formatter.save()
+        with _IOReport('to_csv', path_or_buf, 'w', compression) as report:
+            report(df)
+            formatter.save()
 
         if path_or_buf is None:
             return formatter.path_or_buf.getvalue()
@@ -3327,7 +3400,7 @@ class NDFrame(PandasObject, SelectionMixin):
         numpy.ndarray.take
         numpy.take
         """
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         new_data = self._data.take(indices,
                                    axis=self._get_block_manager_axis(axis),
@@ -3550,7 +3623,7 @@ class NDFrame(PandasObject, SelectionMixin):
         if axis == 1:
             return self[key]
 
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         index = self.index
         if isinstance(index, MultiIndex):
@@ -4309,7 +4382,7 @@ class NDFrame(PandasObject, SelectionMixin):
             raise TypeError('reindex() got an unexpected keyword '
                             'argument "{0}"'.format(list(kwargs.keys())[0]))
 
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         # if all axes that are requested to reindex are equal, then only copy
         # if indicated must have index names equal here as well as values
@@ -4420,7 +4493,7 @@ class NDFrame(PandasObject, SelectionMixin):
                      limit=None, fill_value=None):
         msg = ("'.reindex_axis' is deprecated and will be removed in a future "
                "version. Use '.reindex' instead.")
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         axis_name = self._get_axis_name(axis)
         axis_values = self._get_axis(axis_name)
@@ -5098,6 +5171,14 @@ class NDFrame(PandasObject, SelectionMixin):
 
         self._protect_consolidate(f)
 
+    def _maybe_consolidate_inplace(self):
+        """
+        Consolidate data in place if the ``mode.consolidation`` policy asks
+        for it, and return None
+        """
+        if self._data._should_consolidate():
+            self._consolidate_inplace()
+
     def _consolidate(self, inplace=False):
         """
         Compute NDFrame with "consolidated" internals (data of each dtype
@@ -5114,6 +5195,10 @@ class NDFrame(PandasObject, SelectionMixin):
         """
         inplace = validate_bool_kwarg(inplace, 'inplace')
         if inplace:
+            # also release the spare capacity of the blocks grown by
+            # inserting items one at a time
+            if self._data._trim_growable():
+                self._clear_item_cache()
             self._consolidate_inplace()
         else:
             f = lambda: self._data.consolidate()
@@ -5204,7 +5289,7 @@ class NDFrame(PandasObject, SelectionMixin):
         """
         warnings.warn("Method .as_matrix will be removed in a future version. "
                       "Use .values instead.", FutureWarning, stacklevel=2)
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
         return self._data.as_array(transpose=self._AXIS_REVERSED,
                                    items=columns)
 
@@ -5282,7 +5367,7 @@ class NDFrame(PandasObject, SelectionMixin):
         pandas.DataFrame.index : Retrieve the index labels.
         pandas.DataFrame.columns : Retrieving the column names.
         """
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
         return self._data.as_array(transpose=self._AXIS_REVERSED)
 
     @property
@@ -6003,7 +6088,7 @@ class NDFrame(PandasObject, SelectionMixin):
         inplace = validate_bool_kwarg(inplace, 'inplace')
         value, method = validate_fillna_kwargs(value, method)
 
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         # set the default here, so functions examining the signaure
         # can detect if something was set (e.g. in groupby) (GH9221)
@@ -6404,7 +6489,7 @@ class NDFrame(PandasObject, SelectionMixin):
             raise AssertionError("'to_replace' must be 'None' if 'regex' is "
                                  "not a bool")
 
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         if value is None:
             # passing a single value that is scalar like
@@ -642,6 +642,10 @@ class _NDFrameIndexer(_NDFrameIndexerBase):
             if isinstance(value, ABCPanel):
                 value = self._align_panel(indexer, value)
 
+            if isinstance(self.obj, ABCSeries):
+                # copy-on-write: a copied column does not update its frame
+                self.obj._unshare()
+
             # check for chained assignment
             self.obj._check_is_chained_assignment_possible()
 
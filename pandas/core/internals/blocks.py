@@ -4,6 +4,7 @@ import functools
 import inspect
 import re
 import warnings
+import weakref
 
 import numpy as np
 
@@ -43,6 +44,25 @@ import pandas.core.missing as missing
 
 from pandas.io.formats.printing import pprint_thing
 
+# copy-on-write mode (the 'mode.copy_on_write' option): copies and slices of
+# a BlockManager share the block values, which are copied on the first write
+_COPY_ON_WRITE = False
+
+
+def _use_copy_on_write(key):
+    """Option change callback for the copy-on-write mode"""
+    from pandas.core.config import get_option
+    global _COPY_ON_WRITE
+    _COPY_ON_WRITE = get_option(key)
+
+
+def _may_share_values(left, right):
+    """ whether the values of two blocks possibly share memory """
+    if isinstance(left, np.ndarray) and isinstance(right, np.ndarray):
+        return np.may_share_memory(left, right)
+    # conservatively assume that other containers do
+    return True
+
 
 class Block(PandasObject):
     """
@@ -51,7 +71,7 @@ class Block(PandasObject):
 
     Index-ignorant; let the container take care of that
     """
-    __slots__ = ['_mgr_locs', 'values', 'ndim']
+    __slots__ = ['_mgr_locs', 'values', 'ndim', '_refs']
     is_numeric = False
     is_float = False
     is_integer = False
@@ -76,6 +96,7 @@ class Block(PandasObject):
         self.ndim = self._check_ndim(values, ndim)
         self.mgr_locs = placement
         self.values = values
+        self._refs = None
 
         if (self._validate_ndim and self.ndim and
                 len(self.mgr_locs) != len(self.values)):
@@ -234,8 +255,38 @@ class Block(PandasObject):
                           "in a future release.", DeprecationWarning)
         if placement is None:
             placement = self.mgr_locs
-        return make_block(values, placement=placement, ndim=ndim,
-                          klass=self.__class__, dtype=dtype)
+        block = make_block(values, placement=placement, ndim=ndim,
+                           klass=self.__class__, dtype=dtype)
+        if self._refs is not None and _may_share_values(values, self.values):
+            self._add_ref(block)
+        return block
+
+    def _add_ref(self, block):
+        """
+        Record that ``block`` shares the values of this block; the first
+        write to any of the blocks sharing the values copies them
+        (copy-on-write). Returns ``block``.
+        """
+        if self._refs is None:
+            self._refs = weakref.WeakSet([self])
+        self._refs.add(block)
+        block._refs = self._refs
+        return block
+
+    def _unshare(self):
+        """
+        Copy the values in-place if they are shared with other live blocks,
+        before writing to them. Returns whether the values were copied.
+        """
+        refs = self._refs
+        if refs is None:
+            return False
+        self._refs = None
+        refs.discard(self)
+        if not len(refs):
+            return False
+        self.values = self.copy().values
+        return True
 
     def __unicode__(self):
 
@@ -265,6 +316,7 @@ class Block(PandasObject):
         self.mgr_locs = libinternals.BlockPlacement(state[0])
         self.values = state[1]
         self.ndim = self.values.ndim
+        self._refs = None
 
     def _slice(self, slicer):
         """ return a slice of my values """
@@ -302,7 +354,10 @@ class Block(PandasObject):
         if self._validate_ndim and new_values.ndim != self.ndim:
             raise ValueError("Only same dim slicing is allowed")
 
-        return self.make_block_same_class(new_values, new_mgr_locs)
+        block = self.make_block_same_class(new_values, new_mgr_locs)
+        if _COPY_ON_WRITE:
+            self._add_ref(block)
+        return block
 
     @property
     def shape(self):
@@ -343,6 +398,7 @@ class Block(PandasObject):
         -------
         None
         """
+        self._unshare()
         self.values[locs] = values
 
     def delete(self, loc):
@@ -819,6 +875,8 @@ class Block(PandasObject):
         `indexer` is a direct slice/positional indexer. `value` must
         be a compatible shape.
         """
+        self._unshare()
+
         # coerce None values, if appropriate
         if value is None:
             if self.is_numeric:
@@ -948,6 +1006,8 @@ class Block(PandasObject):
         -------
         a list of new blocks, the result of the putmask
         """
+        if inplace:
+            self._unshare()
 
         new_values = self.values if inplace else self.values.copy()
 
@@ -1589,6 +1649,7 @@ class ScalarBlock(Block):
         self.ndim = 0
         self.mgr_locs = [0]
         self.values = values
+        self._refs = None
 
     @property
     def dtype(self):
@@ -1682,6 +1743,8 @@ class NonConsolidatableMixIn(object):
         a new block, the result of the putmask
         """
         inplace = validate_bool_kwarg(inplace, 'inplace')
+        if inplace:
+            self._unshare()
 
         # use block's copy logic.
         # .values may be an Index which does shallow copy by default
@@ -1858,6 +1921,7 @@ class ExtensionBlock(NonConsolidatableMixIn, Block):
             indexer = indexer[0]
 
         check_setitem_lengths(indexer, value, self.values)
+        self._unshare()
         self.values[indexer] = value
         return self
 
@@ -2346,6 +2410,7 @@ class ObjectBlock(Block):
                     return
             except (IndexError, ValueError):
                 pass
+        self._unshare()
         try:
             self.values[locs] = values
         except (ValueError):
@@ -2786,6 +2851,7 @@ class DatetimeBlock(DatetimeLikeBlockMixin, Block):
         """
         values = conversion.ensure_datetime64ns(values, copy=False)
 
+        self._unshare()
         self.values[locs] = values
 
 
@@ -39,11 +39,14 @@ from pandas.core.internals import (
 # BlockManager Interface
 
 
-def arrays_to_mgr(arrays, arr_names, index, columns, dtype=None):
+def arrays_to_mgr(arrays, arr_names, index, columns, dtype=None,
+                  consolidate=True):
     """
     Segregate Series based on type and coerce into matrices.
 
-    Needs to handle a lot of exceptional cases.
+    Needs to handle a lot of exceptional cases. With ``consolidate=False``
+    each array is wrapped in a block of its own without copying, and the
+    consolidation is deferred.
     """
     # figure out the index, if necessary
     if index is None:
@@ -57,7 +60,8 @@ def arrays_to_mgr(arrays, arr_names, index, columns, dtype=None):
     # from BlockManager perspective
     axes = [ensure_index(columns), index]
 
-    return create_block_manager_from_arrays(arrays, arr_names, axes)
+    return create_block_manager_from_arrays(arrays, arr_names, axes,
+                                            consolidate=consolidate)
 
 
 def masked_rec_array_to_mgr(data, index, columns, dtype, copy):
@@ -166,10 +170,11 @@ def init_ndarray(values, index, columns, dtype=None, copy=False):
     return create_block_manager_from_blocks([values], [columns, index])
 
 
-def init_dict(data, index, columns, dtype=None):
+def init_dict(data, index, columns, dtype=None, copy=True):
     """
     Segregate Series based on type and coerce into matrices.
-    Needs to handle a lot of exceptional cases.
+    Needs to handle a lot of exceptional cases. With ``copy=False`` the
+    arrays are not copied into consolidated blocks.
     """
     if columns is not None:
         from pandas.core.series import Series
@@ -208,7 +213,8 @@ def init_dict(data, index, columns, dtype=None):
         columns = data_names = Index(keys)
         arrays = [data[k] for k in keys]
 
-    return arrays_to_mgr(arrays, data_names, index, columns, dtype=dtype)
+    return arrays_to_mgr(arrays, data_names, index, columns, dtype=dtype,
+                         consolidate=copy)
 
 
 # ---------------------------------------------------------------------
@@ -8,7 +8,7 @@ import re
 import numpy as np
 
 from pandas._libs import internals as libinternals, lib
-from pandas.compat import map, range, zip
+from pandas.compat import PickleBuffer, map, range, zip
 from pandas.util._validators import validate_bool_kwarg
 
 from pandas.core.dtypes.cast import (
@@ -22,13 +22,15 @@ from pandas.core.dtypes.generic import ABCExtensionArray, ABCSeries
 from pandas.core.dtypes.missing import isna
 
 import pandas.core.algorithms as algos
+from pandas.core.arrays import Categorical
 from pandas.core.arrays.sparse import _maybe_to_sparse
 from pandas.core.base import PandasObject
-from pandas.core.index import Index, MultiIndex, ensure_index
+from pandas.core.index import DatetimeIndex, Index, MultiIndex, ensure_index
 from pandas.core.indexing import maybe_convert_indices
 
 from pandas.io.formats.printing import pprint_thing
 
+from . import blocks as _blocks
 from .blocks import (
     Block, CategoricalBlock, DatetimeTZBlock, ExtensionBlock, _extend_blocks,
     _merge_blocks, _safe_reshape, get_block_type, make_block)
@@ -38,6 +40,29 @@ from .concat import (  # all for concatenate_block_managers
 
 # TODO: flexible with index=None and/or items=None
 
+# policy of the implicit consolidation of the blocks before operations, set
+# through the 'mode.consolidation' option: ('eager', None), ('lazy', None),
+# ('blocks', max number of blocks) or ('bytes', max bytes to copy)
+_CONSOLIDATION = ('eager', None)
+
+# number of threads of reduce_blocks, set through the
+# 'compute.reduction_threads' option, and the minimum number of values of a
+# manager to use them
+_REDUCTION_THREADS = 0
+_PARALLEL_MIN_ELEMENTS = 1000000
+
+
+def _set_consolidation_policy(policy, threshold=None):
+    """Set the policy of the implicit consolidation, see _CONSOLIDATION"""
+    global _CONSOLIDATION
+    _CONSOLIDATION = (policy, threshold)
+
+
+def _set_reduction_threads(threads):
+    """Set the number of threads of reduce_blocks, see _REDUCTION_THREADS"""
+    global _REDUCTION_THREADS
+    _REDUCTION_THREADS = threads
+
 
 class BlockManager(PandasObject):
     """
@@ -91,11 +116,12 @@ class BlockManager(PandasObject):
     This is *not* a public API class
     """
     __slots__ = ['axes', 'blocks', '_ndim', '_shape', '_known_consolidated',
-                 '_is_consolidated', '_blknos', '_blklocs']
+                 '_is_consolidated', '_blknos', '_blklocs', '_growable']
 
     def __init__(self, blocks, axes, do_integrity_check=True):
         self.axes = [ensure_index(ax) for ax in axes]
         self.blocks = tuple(blocks)
+        self._growable = {}
 
         for block in blocks:
             if block.is_sparse:
@@ -208,7 +234,7 @@ class BlockManager(PandasObject):
 
     def _get_counts(self, f):
         """ return a dict of the counts of the function in BlockManager """
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
         counts = dict()
         for b in self.blocks:
             v = f(b)
@@ -246,6 +272,25 @@ class BlockManager(PandasObject):
         # compatibility with 0.13.1.
         return axes_array, block_values, block_items, extra_state
 
+    def __reduce_ex__(self, protocol):
+        rv = super(BlockManager, self).__reduce_ex__(protocol)
+        if protocol < 5 or PickleBuffer is None:
+            return rv
+
+        # With protocol 5, the values of numeric, datetime and categorical
+        # blocks are handed to the pickler as PickleBuffers, which can be
+        # kept out-of-band by passing a buffer_callback.
+        axes_array, _, block_items, extra_state = rv[2]
+        # don't hand over the spare capacity of blocks grown by insert
+        grown = set(id(b) for b in self._grown_blocks())
+        block_values = [_OutOfBandValues.wrap(b, copy=id(b) in grown)
+                        for b in self.blocks]
+        extra_state['0.14.1']['blocks'] = [
+            dict(values=values, mgr_locs=b.mgr_locs.indexer)
+            for values, b in zip(block_values, self.blocks)]
+        state = axes_array, block_values, block_items, extra_state
+        return rv[:2] + (state,) + rv[3:]
+
     def __setstate__(self, state):
         def unpickle_block(values, mgr_locs):
             return make_block(values, placement=mgr_locs)
@@ -285,6 +330,7 @@ class BlockManager(PandasObject):
     def _post_setstate(self):
         self._is_consolidated = False
         self._known_consolidated = False
+        self._growable = {}
         self._rebuild_blknos_and_blklocs()
 
     def __len__(self):
@@ -348,7 +394,7 @@ class BlockManager(PandasObject):
                 kwargs['filter'] = filter_locs
 
         if consolidate:
-            self._consolidate_inplace()
+            self._maybe_consolidate_inplace()
 
         if f == 'where':
             align_copy = True
@@ -391,6 +437,9 @@ class BlockManager(PandasObject):
                     kwargs[k] = obj.reindex(b_items, axis=axis,
                                             copy=align_copy)
 
+            if kwargs.get('inplace'):
+                b._unshare()
+
             applied = getattr(b, f)(**kwargs)
             result_blocks = _extend_blocks(applied, result_blocks)
 
@@ -398,7 +447,7 @@ class BlockManager(PandasObject):
             return self.make_empty(axes or self.axes)
         bm = self.__class__(result_blocks, axes or self.axes,
                             do_integrity_check=do_integrity_check)
-        bm._consolidate_inplace()
+        bm._maybe_consolidate_inplace()
         return bm
 
     def reduction(self, f, axis=0, consolidate=True, transposed=False,
@@ -424,7 +473,7 @@ class BlockManager(PandasObject):
         """
 
         if consolidate:
-            self._consolidate_inplace()
+            self._maybe_consolidate_inplace()
 
         axes, blocks = [], []
         for b in self.blocks:
@@ -573,7 +622,7 @@ class BlockManager(PandasObject):
             result_blocks.extend(rb)
 
         bm = self.__class__(result_blocks, self.axes)
-        bm._consolidate_inplace()
+        bm._maybe_consolidate_inplace()
         return bm
 
     def reshape_nd(self, axes, **kwargs):
@@ -602,13 +651,13 @@ class BlockManager(PandasObject):
     @property
     def is_numeric_mixed_type(self):
         # Warning, consolidation needs to get checked upstairs
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
         return all(block.is_numeric for block in self.blocks)
 
     @property
     def is_datelike_mixed_type(self):
         # Warning, consolidation needs to get checked upstairs
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
         return any(block.is_datelike for block in self.blocks)
 
     @property
@@ -638,7 +687,7 @@ class BlockManager(PandasObject):
         copy : boolean, default False
             Whether to copy the blocks
         """
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
         return self.combine([b for b in self.blocks if b.is_bool], copy)
 
     def get_numeric_data(self, copy=False):
@@ -648,9 +697,90 @@ class BlockManager(PandasObject):
         copy : boolean, default False
             Whether to copy the blocks
         """
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
         return self.combine([b for b in self.blocks if b.is_numeric], copy)
 
+    def reduce_blocks(self, func):
+        """
+        Reduce the items of the blocks separately, without consolidating or
+        interleaving them.
+
+        ``func`` is a reduction along axis 0 of the transposed values, like
+        ``func(self.as_array(transpose=True))``. It is called with the
+        transposed values of each block, cast to the dtype the blocks
+        would be interleaved to, so that the result is the same.
+
+        With the ``compute.reduction_threads`` option, the blocks of large
+        managers are split in ranges of items that are reduced on a pool of
+        threads (numpy and bottleneck release the GIL). Each item is still
+        reduced by a single call, so the result does not change.
+
+        Parameters
+        ----------
+        func : callable
+
+        Returns
+        -------
+        result : ndarray aligned with the items, or None if the blocks can
+            not be reduced separately (a single block that is not reduced on
+            threads, extension blocks or an object interleaved dtype)
+        """
+        if self.ndim != 2 or not self.blocks:
+            return None
+        threads = _REDUCTION_THREADS
+        parallel = (threads > 1 and len(self.items) > 1 and
+                    np.prod(self.shape) >= _PARALLEL_MIN_ELEMENTS)
+        if len(self.blocks) < 2 and not parallel:
+            return None
+        if not all(isinstance(blk.values, np.ndarray) for blk in self.blocks):
+            return None
+        dtype = _interleaved_dtype(self.blocks)
+        if not isinstance(dtype, np.dtype) or dtype == np.object_:
+            return None
+
+        # (block, slice of its items) to reduce
+        tasks = []
+        for blk in self.blocks:
+            n = len(blk.mgr_locs)
+            step = -(-len(self.items) // threads) if parallel else n
+            tasks.extend((blk, slice(start, start + step))
+                         for start in range(0, n, step))
+
+        def reduce_task(task):
+            blk, slicer = task
+            values = blk.get_values(dtype)[slicer].astype(dtype, copy=False)
+            result = func(values.T)
+            if (not isinstance(result, np.ndarray) or
+                    result.shape != (len(values),)):
+                return None
+            return result
+
+        if parallel and len(tasks) > 1:
+            from multiprocessing.pool import ThreadPool
+
+            # the floating point error handling is set per thread
+            errstate = np.geterr()
+
+            def reduce_in_thread(task):
+                with np.errstate(**errstate):
+                    return reduce_task(task)
+
+            pool = ThreadPool(min(threads, len(tasks)))
+            try:
+                results = pool.map(reduce_in_thread, tasks)
+            finally:
+                pool.terminate()
+        else:
+            results = [reduce_task(task) for task in tasks]
+        if any(result is None for result in results):
+            return None
+
+        dtype = find_common_type([result.dtype for result in results])
+        out = np.empty(len(self.items), dtype=dtype)
+        for (blk, slicer), result in zip(tasks, results):
+            out[blk.mgr_locs.indexer[slicer]] = result
+        return out
+
     def combine(self, blocks, copy=True):
         """ return a new manager with the blocks """
         if len(blocks) == 0:
@@ -689,7 +819,7 @@ class BlockManager(PandasObject):
         new_axes[axis] = new_axes[axis][slobj]
 
         bm = self.__class__(new_blocks, new_axes, do_integrity_check=False)
-        bm._consolidate_inplace()
+        bm._maybe_consolidate_inplace()
         return bm
 
     def __contains__(self, item):
@@ -712,6 +842,11 @@ class BlockManager(PandasObject):
         Returns
         -------
         copy : BlockManager
+
+        Notes
+        -----
+        In copy-on-write mode, the data of a deep copy is shared with this
+        manager and only copied on the first write to either of them.
         """
         # this preserves the notion of view copying of axes
         if deep:
@@ -722,9 +857,36 @@ class BlockManager(PandasObject):
             new_axes = [copy(ax) for ax in self.axes]
         else:
             new_axes = list(self.axes)
+
+        if deep and _blocks._COPY_ON_WRITE:
+            # don't share the spare capacity of the blocks grown by insert
+            grown = set(id(b) for b in self._grown_blocks())
+            new_blocks = [blk.copy() if id(blk) in grown
+                          else blk._add_ref(blk.copy(deep=False))
+                          for blk in self.blocks]
+            bm = self.__class__(new_blocks, new_axes,
+                                do_integrity_check=False)
+            # consolidate the copy only, the merged blocks get new values
+            bm._maybe_consolidate_inplace()
+            return bm
+
         return self.apply('copy', axes=new_axes, deep=deep,
                           do_integrity_check=False)
 
+    def _unshare(self):
+        """
+        Copy the values of the blocks that are shared with other managers
+        (copy-on-write), before writing to them directly.
+
+        Returns
+        -------
+        bool : whether any values were copied
+        """
+        copied = False
+        for blk in self.blocks:
+            copied = blk._unshare() or copied
+        return copied
+
     def as_array(self, transpose=False, items=None):
         """Convert the blockmanager data into an numpy array.
 
@@ -749,7 +911,8 @@ class BlockManager(PandasObject):
         else:
             mgr = self
 
-        if self._is_single_block or not self.is_mixed_type:
+        if self._is_single_block or (self.is_consolidated() and
+                                     not self.is_mixed_type):
             arr = mgr.blocks[0].get_values()
         else:
             arr = mgr._interleave()
@@ -801,7 +964,7 @@ class BlockManager(PandasObject):
         -----
         This consolidates based on str(dtype)
         """
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         bd = {}
         for b in self.blocks:
@@ -861,7 +1024,12 @@ class BlockManager(PandasObject):
         single block
         """
         if len(self.blocks) == 1:
-            return self.blocks[0].iget((slice(None), loc))
+            values = self.blocks[0].iget((slice(None), loc))
+            if _blocks._COPY_ON_WRITE and isinstance(values, np.ndarray):
+                # the caller wraps the row in a new Series, which could not
+                # share the values of the block
+                values = values.copy()
+            return values
 
         items = self.items
 
@@ -911,6 +1079,36 @@ class BlockManager(PandasObject):
         bm._consolidate_inplace()
         return bm
 
+    def _should_consolidate(self):
+        """
+        Whether operations that work block by block should consolidate
+        first, following the 'mode.consolidation' policy: always ('eager'),
+        never ('lazy'), when there are more blocks than a threshold, or when
+        the blocks to be merged hold at most a threshold of bytes.
+        """
+        if self.is_consolidated():
+            return False
+
+        policy, threshold = _CONSOLIDATION
+        if policy == 'eager':
+            return True
+        elif policy == 'lazy':
+            return False
+        elif policy == 'blocks':
+            return len(self.blocks) > threshold
+
+        counts = defaultdict(int)
+        for blk in self.blocks:
+            counts[blk._consolidate_key] += 1
+        nbytes = sum(blk.values.nbytes for blk in self.blocks
+                     if blk._can_consolidate and
+                     counts[blk._consolidate_key] > 1)
+        return nbytes <= threshold
+
+    def _maybe_consolidate_inplace(self):
+        if self._should_consolidate():
+            self._consolidate_inplace()
+
     def _consolidate_inplace(self):
         if not self.is_consolidated():
             self.blocks = tuple(_consolidate(self.blocks))
@@ -918,6 +1116,11 @@ class BlockManager(PandasObject):
             self._known_consolidated = True
             self._rebuild_blknos_and_blklocs()
 
+            # release the spare capacity of merged growable blocks
+            self._growable = {dtype: entry
+                              for dtype, entry in self._growable.items()
+                              if entry[0] in self.blocks}
+
     def get(self, item, fastpath=True):
         """
         Return values for selected item (ndarray or BlockManager).
@@ -959,11 +1162,11 @@ class BlockManager(PandasObject):
             return values
 
         # fastpath shortcut for select a single-dim from a 2-dim BM
-        return SingleBlockManager(
-            [block.make_block_same_class(values,
-                                         placement=slice(0, len(values)),
-                                         ndim=1)],
-            self.axes[1])
+        new_block = block.make_block_same_class(
+            values, placement=slice(0, len(values)), ndim=1)
+        if _blocks._COPY_ON_WRITE:
+            block._add_ref(new_block)
+        return SingleBlockManager([new_block], self.axes[1])
 
     def delete(self, item):
         """
@@ -1154,22 +1357,110 @@ class BlockManager(PandasObject):
                 new_mgr_locs[new_mgr_locs >= loc] += 1
                 blk.mgr_locs = new_mgr_locs
 
+        blkno, blkloc = self._append_to_growable(block)
+        if blkno is None:
+            blkno, blkloc = len(self.blocks), 0
+            self.blocks += (block,)
+            self._known_consolidated = False
+            if self._is_growable(block):
+                self._growable[block.dtype] = (block, None)
+
         if loc == self._blklocs.shape[0]:
             # np.append is a lot faster, let's use it if we can.
-            self._blklocs = np.append(self._blklocs, 0)
-            self._blknos = np.append(self._blknos, len(self.blocks))
+            self._blklocs = np.append(self._blklocs, blkloc)
+            self._blknos = np.append(self._blknos, blkno)
         else:
-            self._blklocs = np.insert(self._blklocs, loc, 0)
-            self._blknos = np.insert(self._blknos, loc, len(self.blocks))
+            self._blklocs = np.insert(self._blklocs, loc, blkloc)
+            self._blknos = np.insert(self._blknos, loc, blkno)
 
         self.axes[0] = new_axis
-        self.blocks += (block,)
         self._shape = None
 
-        self._known_consolidated = False
-
         if len(self.blocks) > 100:
-            self._consolidate_inplace()
+            self._maybe_consolidate_inplace()
+
+    def _is_growable(self, block):
+        values = block.values
+        return (self.ndim == 2 and block._can_consolidate and
+                isinstance(values, np.ndarray) and values.ndim == 2)
+
+    def _append_to_growable(self, block):
+        """
+        Append the single item ``block`` to the block of its dtype that was
+        created by a previous :meth:`insert`, instead of adding a new block.
+
+        The values of such a block are the leading rows of a buffer whose
+        capacity is doubled when it is full, so that inserting items one at
+        a time copies each value a constant number of times (amortized) and
+        leaves a single block per dtype to consolidate.
+
+        Returns
+        -------
+        blkno, blkloc : the number of the block holding the item and the
+            position of the item in it, or (None, None) if there is no
+            block to append to
+        """
+        if not self._is_growable(block) or block.dtype not in self._growable:
+            return None, None
+
+        blk, buf = self._growable[block.dtype]
+        try:
+            blkno = self.blocks.index(blk)
+        except ValueError:
+            # the block was consolidated away
+            del self._growable[block.dtype]
+            return None, None
+        if type(blk) is not type(block):
+            return None, None
+
+        values = blk.values
+        n = len(values)
+        if buf is None or values.base is not buf or len(buf) == n:
+            # no (more) spare capacity, reallocate
+            buf = np.empty((2 * n,) + values.shape[1:], dtype=values.dtype)
+            buf[:n] = values
+        buf[n] = block.values[0]
+
+        placement = np.append(blk.mgr_locs.as_array, block.mgr_locs.as_array)
+        new_blk = blk.make_block_same_class(buf[:n + 1], placement=placement)
+        self.blocks = (self.blocks[:blkno] + (new_blk,) +
+                       self.blocks[blkno + 1:])
+        self._growable[block.dtype] = (new_blk, buf)
+        return blkno, n
+
+    def _grown_blocks(self):
+        """
+        The blocks grown by :meth:`insert` whose values are the leading rows
+        of a buffer with spare capacity.
+        """
+        return [blk for blk, buf in self._growable.values()
+                if buf is not None and blk.values.base is buf and
+                len(blk.values) < len(buf) and
+                any(b is blk for b in self.blocks)]
+
+    def _trim_growable(self):
+        """
+        Release the spare capacity of the blocks grown by :meth:`insert`,
+        copying their values to an array of the exact size.
+
+        Returns
+        -------
+        trimmed : bool
+            Whether any block was replaced
+        """
+        grown = self._grown_blocks()
+        if not grown:
+            return False
+
+        blocks = list(self.blocks)
+        for blk in grown:
+            blkno = next(i for i, b in enumerate(blocks) if b is blk)
+            new_blk = blk.make_block_same_class(blk.values.copy(),
+                                                placement=blk.mgr_locs)
+            blocks[blkno] = new_blk
+            self._growable[blk.dtype] = (new_blk, None)
+        self.blocks = tuple(blocks)
+        return True
 
     def reindex_axis(self, new_index, axis, method=None, limit=None,
                      fill_value=None, copy=True):
@@ -1205,7 +1496,7 @@ class BlockManager(PandasObject):
             result.axes[axis] = new_axis
             return result
 
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         # some axes don't allow reindexing with dups
         if not allow_dups:
@@ -1318,7 +1609,7 @@ class BlockManager(PandasObject):
         """
         Take items along any axis.
         """
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
         indexer = (np.arange(indexer.start, indexer.stop, indexer.step,
                              dtype='int64')
                    if isinstance(indexer, slice)
@@ -1473,6 +1764,12 @@ class SingleBlockManager(BlockManager):
     def _post_setstate(self):
         pass
 
+    def _grown_blocks(self):
+        return []
+
+    def _trim_growable(self):
+        return False
+
     @property
     def _block(self):
         return self.blocks[0]
@@ -1495,8 +1792,12 @@ class SingleBlockManager(BlockManager):
         if axis >= self.ndim:
             raise IndexError("Requested axis not found in manager")
 
-        return self.__class__(self._block._slice(slobj),
-                              self.index[slobj], fastpath=True)
+        blk = self._block
+        bm = self.__class__(blk._slice(slobj), self.index[slobj],
+                            fastpath=True)
+        if _blocks._COPY_ON_WRITE or blk._refs is not None:
+            blk._add_ref(bm._block)
+        return bm
 
     @property
     def index(self):
@@ -1625,6 +1926,63 @@ class SingleBlockManager(BlockManager):
 # --------------------------------------------------------------------
 # Constructor Helpers
 
+class _OutOfBandValues(object):
+    """
+    Pickles the values of a block through PickleBuffers (protocol 5).
+
+    Unpickling yields the values themselves, not the wrapper.
+    """
+    __slots__ = ('values',)
+
+    def __init__(self, values):
+        self.values = values
+
+    @classmethod
+    def wrap(cls, block, copy=False):
+        values = block.values
+        if block.is_categorical or block.is_datetimetz:
+            return cls(values)
+        if copy:
+            values = values.copy()
+        return cls._wrap_array(values)
+
+    @classmethod
+    def _wrap_array(cls, values):
+        if (isinstance(values, np.ndarray) and not values.dtype.hasobject
+                and values.size):
+            return cls(values)
+        return values
+
+    def __reduce_ex__(self, protocol):
+        values = self.values
+        if isinstance(values, Categorical):
+            return (_categorical_from_buffer,
+                    (self._wrap_array(values._codes), values.dtype))
+        if isinstance(values, DatetimeIndex):
+            return (_datetimetz_from_buffer,
+                    (self._wrap_array(values.asi8), values.tz))
+
+        order = 'C'
+        if values.flags.f_contiguous and not values.flags.c_contiguous:
+            order = 'F'
+        elif not values.flags.c_contiguous:
+            values = np.ascontiguousarray(values)
+        return (_array_from_buffer,
+                (PickleBuffer(values), values.dtype, values.shape, order))
+
+
+def _array_from_buffer(buffer, dtype, shape, order):
+    return np.frombuffer(buffer, dtype=dtype).reshape(shape, order=order)
+
+
+def _categorical_from_buffer(codes, dtype):
+    return Categorical(codes, dtype=dtype, fastpath=True)
+
+
+def _datetimetz_from_buffer(values, tz):
+    return DatetimeIndex._simple_new(values, tz=tz)
+
+
 def create_block_manager_from_blocks(blocks, axes):
     try:
         if len(blocks) == 1 and not isinstance(blocks[0], Block):
@@ -1648,12 +2006,13 @@ def create_block_manager_from_blocks(blocks, axes):
         construction_error(tot_items, blocks[0].shape[1:], axes, e)
 
 
-def create_block_manager_from_arrays(arrays, names, axes):
+def create_block_manager_from_arrays(arrays, names, axes, consolidate=True):
 
     try:
-        blocks = form_blocks(arrays, names, axes)
+        blocks = form_blocks(arrays, names, axes, consolidate=consolidate)
         mgr = BlockManager(blocks, axes)
-        mgr._consolidate_inplace()
+        if consolidate:
+            mgr._consolidate_inplace()
         return mgr
     except ValueError as e:
         construction_error(len(arrays), arrays[0].shape, axes, e)
@@ -1673,9 +2032,15 @@ def construction_error(tot_items, block_shape, axes, e=None):
 
 # -----------------------------------------------------------------------
 
-def form_blocks(arrays, names, axes):
+def form_blocks(arrays, names, axes, consolidate=True):
     # put "leftover" items in float bucket, where else?
     # generalize?
+    if not consolidate:
+        # one block per array, wrapping the arrays without copying
+        multi_blockify = simple_blockify = _split_blockify
+    else:
+        multi_blockify, simple_blockify = _multi_blockify, _simple_blockify
+
     items_dict = defaultdict(list)
     extra_locs = []
 
@@ -1699,24 +2064,24 @@ def form_blocks(arrays, names, axes):
 
     blocks = []
     if len(items_dict['FloatBlock']):
-        float_blocks = _multi_blockify(items_dict['FloatBlock'])
+        float_blocks = multi_blockify(items_dict['FloatBlock'])
         blocks.extend(float_blocks)
 
     if len(items_dict['ComplexBlock']):
-        complex_blocks = _multi_blockify(items_dict['ComplexBlock'])
+        complex_blocks = multi_blockify(items_dict['ComplexBlock'])
         blocks.extend(complex_blocks)
 
     if len(items_dict['TimeDeltaBlock']):
-        timedelta_blocks = _multi_blockify(items_dict['TimeDeltaBlock'])
+        timedelta_blocks = multi_blockify(items_dict['TimeDeltaBlock'])
         blocks.extend(timedelta_blocks)
 
     if len(items_dict['IntBlock']):
-        int_blocks = _multi_blockify(items_dict['IntBlock'])
+        int_blocks = multi_blockify(items_dict['IntBlock'])
         blocks.extend(int_blocks)
 
     if len(items_dict['DatetimeBlock']):
-        datetime_blocks = _simple_blockify(items_dict['DatetimeBlock'],
-                                           _NS_DTYPE)
+        datetime_blocks = simple_blockify(items_dict['DatetimeBlock'],
+                                          _NS_DTYPE)
         blocks.extend(datetime_blocks)
 
     if len(items_dict['DatetimeTZBlock']):
@@ -1727,11 +2092,11 @@ def form_blocks(arrays, names, axes):
         blocks.extend(dttz_blocks)
 
     if len(items_dict['BoolBlock']):
-        bool_blocks = _simple_blockify(items_dict['BoolBlock'], np.bool_)
+        bool_blocks = simple_blockify(items_dict['BoolBlock'], np.bool_)
         blocks.extend(bool_blocks)
 
     if len(items_dict['ObjectBlock']) > 0:
-        object_blocks = _simple_blockify(items_dict['ObjectBlock'], np.object_)
+        object_blocks = simple_blockify(items_dict['ObjectBlock'], np.object_)
         blocks.extend(object_blocks)
 
     if len(items_dict['SparseBlock']) > 0:
@@ -1796,6 +2161,22 @@ def _multi_blockify(tuples, dtype=None):
     return new_blocks
 
 
+def _split_blockify(tuples, dtype=None):
+    """ return a block for each array, as a view on the array if it already
+    has the dtype; if dtype is not None, coerce to this dtype
+    """
+    new_blocks = []
+    for i, names, array in tuples:
+        values = _asarray_compat(array)
+        if dtype is not None and values.dtype != dtype:
+            values = values.astype(dtype)
+        block = make_block(values.reshape((1,) + values.shape),
+                           placement=[i])
+        new_blocks.append(block)
+
+    return new_blocks
+
+
 def _sparse_blockify(tuples, dtype=None):
     """ return an array of blocks that potentially have different dtypes (and
     are sparse)
@@ -1810,15 +2191,16 @@ def _sparse_blockify(tuples, dtype=None):
     return new_blocks
 
 
+def _asarray_compat(x):
+    if isinstance(x, ABCSeries):
+        return x._values
+    else:
+        return np.asarray(x)
+
+
 def _stack_arrays(tuples, dtype):
 
     # fml
-    def _asarray_compat(x):
-        if isinstance(x, ABCSeries):
-            return x._values
-        else:
-            return np.asarray(x)
-
     def _shape_compat(x):
         if isinstance(x, ABCSeries):
             return len(x),
@@ -25,17 +25,29 @@ from pandas.core.dtypes.cast import (
 from pandas.core.dtypes.common import (
     ensure_object, is_bool_dtype, is_categorical_dtype, is_datetime64_dtype,
     is_datetime64tz_dtype, is_datetimelike_v_numeric, is_extension_array_dtype,
-    is_integer_dtype, is_list_like, is_object_dtype, is_period_dtype,
-    is_scalar, is_timedelta64_dtype, needs_i8_conversion)
+    is_integer_dtype, is_list_like, is_numeric_dtype, is_object_dtype,
+    is_period_dtype, is_scalar, is_timedelta64_dtype, needs_i8_conversion)
 from pandas.core.dtypes.generic import (
     ABCDataFrame, ABCIndex, ABCIndexClass, ABCPanel, ABCSeries, ABCSparseArray,
-    ABCSparseSeries)
+    ABCSparseDataFrame, ABCSparseSeries)
 from pandas.core.dtypes.missing import isna, notna
 
 import pandas as pd
 import pandas.core.common as com
+from pandas.core.config import get_option
 import pandas.core.missing as missing
 
+_USE_INPLACE = False
+
+
+def set_use_inplace(v=True):
+    # set/unset the evaluation of the inplace operators into the values
+    global _USE_INPLACE
+    _USE_INPLACE = v
+
+
+set_use_inplace(get_option('compute.inplace_arithmetic'))
+
 # -----------------------------------------------------------------------------
 # Ops Wrapping Utilities
 
@@ -1150,7 +1162,7 @@ def dispatch_to_series(left, right, func, str_rep=None, axis=None):
 
     new_data = expressions.evaluate(column_op, str_rep, left, right)
 
-    result = left._constructor(new_data, index=left.index, copy=False)
+    result = left._constructor(new_data, index=left.index)
     # Pin columns instead of passing to constructor for compat with
     # non-unique columns case
     result.columns = left.columns
@@ -1359,6 +1371,91 @@ def add_methods(cls, new_methods):
 
 # ----------------------------------------------------------------------
 # Arithmetic
+def _arith_inplace(left, right, op_str):
+    """
+    Evaluate ``left <op>= right`` into the values of the blocks of `left`,
+    without allocating a result.
+
+    Parameters
+    ----------
+    left : Series or DataFrame
+    right : object
+    op_str : str
+        One of the ops of ``expressions._INPLACE_UFUNCS``.
+
+    Returns
+    -------
+    done : bool
+        False if the op can not be done in place, and `left` is unchanged:
+        `left` was taken from another object (see ``_is_copy``), `right` is
+        not a number or a Series / DataFrame aligned with `left`, a block is
+        not numeric, or a result would need another dtype than its block
+        (e.g. an upcast).
+    """
+    import pandas.core.computation.expressions as expressions
+
+    if (not isinstance(left, (ABCSeries, ABCDataFrame)) or
+            isinstance(left, (ABCSparseSeries, ABCSparseDataFrame))):
+        return False
+
+    # an object taken from another one (or a cached column of such an
+    # object) may be a view on it: do not write through to it, and keep
+    # the SettingWithCopy checks of the regular path
+    cacher = getattr(left, '_cacher', None)
+    parent = cacher[1]() if cacher is not None else None
+    if left._is_copy is not None or (parent is not None and
+                                     parent._is_copy is not None):
+        return False
+
+    if isinstance(right, (ABCSeries, ABCDataFrame)):
+        if (type(right) is not type(left) or
+                isinstance(right, (ABCSparseSeries, ABCSparseDataFrame)) or
+                not left._indexed_same(right)):
+            return False
+    elif not (is_scalar(right) and lib.is_number(right)):
+        return False
+
+    # the (values, other) pairs to evaluate
+    pairs = []
+    for blk in left._data.blocks:
+        if (not blk.is_numeric or blk.is_bool or
+                not isinstance(blk.values, np.ndarray)):
+            return False
+        if isinstance(right, ABCDataFrame):
+            pairs.extend((blk.values[i], right._ixs(loc, axis=1)._values)
+                         for i, loc in enumerate(blk.mgr_locs.indexer))
+        elif isinstance(right, ABCSeries):
+            pairs.append((blk.values, right._values))
+        else:
+            pairs.append((blk.values, right))
+
+    ufunc = expressions._INPLACE_UFUNCS[op_str]
+    for values, other in pairs:
+        if isinstance(other, np.ndarray):
+            if not (is_numeric_dtype(other) and not is_bool_dtype(other)):
+                return False
+            other = other[:0]
+        elif not is_scalar(other):
+            return False
+        try:
+            with np.errstate(all='ignore'):
+                result = ufunc(values[..., :0], other)
+        except (TypeError, OverflowError):
+            return False
+        if result.dtype != values.dtype:
+            return False
+
+    if left._data._unshare():
+        # copy-on-write: the values were replaced by a copy
+        left._clear_item_cache()
+        return _arith_inplace(left, right, op_str)
+
+    for values, other in pairs:
+        expressions.evaluate_inplace(op_str, values, other)
+    left._maybe_update_cacher(verify_is_copy=False)
+    return True
+
+
 def add_special_arithmetic_methods(cls):
     """
     Adds the full suite of special arithmetic methods (``__add__``,
@@ -1375,12 +1472,17 @@ def add_special_arithmetic_methods(cls):
     # inplace operators (I feel like these should get passed an `inplace=True`
     # or just be removed
 
-    def _wrap_inplace_method(method):
+    def _wrap_inplace_method(method, op_str=None):
         """
-        return an inplace wrapper for this method
+        return an inplace wrapper for this method; with op_str, the op is
+        evaluated into the values if possible (compute.inplace_arithmetic)
         """
 
         def f(self, other):
+            if (_USE_INPLACE and op_str is not None and
+                    _arith_inplace(self, other, op_str)):
+                return self
+
             result = method(self, other)
 
             # this makes sure that we are aligned like the input
@@ -1393,10 +1495,11 @@ def add_special_arithmetic_methods(cls):
         return f
 
     new_methods.update(
-        dict(__iadd__=_wrap_inplace_method(new_methods["__add__"]),
-             __isub__=_wrap_inplace_method(new_methods["__sub__"]),
-             __imul__=_wrap_inplace_method(new_methods["__mul__"]),
-             __itruediv__=_wrap_inplace_method(new_methods["__truediv__"]),
+        dict(__iadd__=_wrap_inplace_method(new_methods["__add__"], '+'),
+             __isub__=_wrap_inplace_method(new_methods["__sub__"], '-'),
+             __imul__=_wrap_inplace_method(new_methods["__mul__"], '*'),
+             __itruediv__=_wrap_inplace_method(new_methods["__truediv__"],
+                                               '/'),
              __ifloordiv__=_wrap_inplace_method(new_methods["__floordiv__"]),
              __imod__=_wrap_inplace_method(new_methods["__mod__"]),
              __ipow__=_wrap_inplace_method(new_methods["__pow__"])))
@@ -969,11 +969,27 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
             self._set_with(key, value)
 
         # do the setitem
+        self._unshare()
         cacher_needs_updating = self._check_is_chained_assignment_possible()
         setitem(key, value)
         if cacher_needs_updating:
             self._maybe_update_cacher()
 
+    def _unshare(self):
+        """
+        Copy the values if they are shared with other objects
+        (copy-on-write), before writing to them. A cached column of a
+        DataFrame whose values are copied no longer belongs to the frame.
+        """
+        if not self._data._unshare():
+            return
+        cacher = getattr(self, '_cacher', None)
+        if cacher is not None:
+            ref = cacher[1]()
+            if ref is not None and ref._item_cache.get(cacher[0]) is self:
+                del ref._item_cache[cacher[0]]
+            del self._cacher
+
     def _set_with_engine(self, key, value):
         values = self._values
         try:
@@ -1109,6 +1125,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         return self._set_value(label, value, takeable=takeable)
 
     def _set_value(self, label, value, takeable=False):
+        self._unshare()
         try:
             if takeable:
                 self._values[label] = value
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+Awaitable variants of the SQL readers and writers for asyncio applications.
+
+Supported connections are
+
+- async DB-API connections, whose ``cursor()`` returns a cursor with
+  awaitable ``execute`` and ``fetchmany`` methods (e.g. aiosqlite, aiopg,
+  aiomysql). As in the sqlite3 fallback mode of :func:`to_sql`, writing
+  through such a connection uses the SQLite flavor.
+- SQLAlchemy ``AsyncConnection`` objects (SQLAlchemy >= 1.4).
+
+This module uses ``async def`` generators and is only imported on Python 3.6
+and later; the functions are exposed through :mod:`pandas.io.sql`.
+"""
+
+import inspect
+
+from pandas.compat import string_types
+
+from pandas.core.dtypes.common import is_dict_like
+
+from pandas.core.api import DataFrame, Series
+
+from pandas.io.sql import (
+    _FETCH_BATCH_SIZE, SQLiteTable, _ColumnBuffers, _convert_params,
+    _get_valid_sqlite_name, _wrap_frame, _wrap_result, to_sql)
+
+
+async def _maybe_await(value):
+    # cursor()/close() are coroutines for some drivers and plain calls for
+    # others
+    if inspect.isawaitable(value):
+        value = await value
+    return value
+
+
+def _is_sqlalchemy_async(con):
+    try:
+        from sqlalchemy.ext.asyncio import AsyncConnection
+    except ImportError:
+        return False
+    return isinstance(con, AsyncConnection)
+
+
+async def _execute(con, sql, params=None):
+    """
+    Execute the query, return ``(columns, fetchmany, close)`` where
+    ``fetchmany`` is a coroutine function.
+    """
+    if _is_sqlalchemy_async(con):
+        from sqlalchemy import text
+        if isinstance(sql, string_types):
+            sql = text(sql)
+        if params is None:
+            result = await con.stream(sql)
+        else:
+            result = await con.stream(sql, params)
+        return list(result.keys()), result.fetchmany, result.close
+
+    cursor = await _maybe_await(con.cursor())
+    await cursor.execute(*_convert_params(sql, params))
+    columns = [col_desc[0] for col_desc in cursor.description]
+    return columns, cursor.fetchmany, cursor.close
+
+
+def read_sql_query_async(sql, con, index_col=None, coerce_float=True,
+                         params=None, parse_dates=None, chunksize=None):
+    """Read SQL query into a DataFrame without blocking the event loop.
+
+    Awaitable variant of :func:`pandas.read_sql_query`. The result set is
+    fetched in batches with ``fetchmany`` and appended to the frame's
+    columns as the batches arrive.
+
+    .. versionadded:: 0.24.0
+
+    Only the database calls are awaited: appending the batches and
+    converting the columns to build the frame run synchronously on the
+    event loop. With `chunksize`, each chunk is converted in turn, which
+    bounds the time the loop is blocked.
+
+    Parameters
+    ----------
+    sql : string or SQLAlchemy Selectable (select or text object)
+        SQL query to be executed.
+    con : async DB-API connection or sqlalchemy AsyncConnection
+        E.g. an ``aiosqlite.Connection``.
+    index_col : string or list of strings, optional, default: None
+        Column(s) to set as index(MultiIndex).
+    coerce_float : boolean, default True
+        Attempts to convert values of non-string, non-numeric objects (like
+        decimal.Decimal) to floating point. Useful for SQL result sets.
+    params : list, tuple or dict, optional, default: None
+        List of parameters to pass to execute method. The syntax used
+        to pass parameters is database driver dependent.
+    parse_dates : list or dict, default: None
+        Columns to parse as dates, see :func:`pandas.read_sql_query`.
+    chunksize : int, default None
+        If specified, return an asynchronous iterator where `chunksize` is
+        the number of rows to include in each chunk.
+
+    Returns
+    -------
+    coroutine resolving to a DataFrame, or an asynchronous iterator of
+    DataFrames if `chunksize` is given.
+
+    See Also
+    --------
+    read_sql_query : Read SQL query into a DataFrame.
+
+    Examples
+    --------
+    >>> async with aiosqlite.connect('data.db') as con:  # doctest: +SKIP
+    ...     df = await read_sql_query_async('SELECT * FROM data', con)
+    ...     async for chunk in read_sql_query_async('SELECT * FROM data',
+    ...                                             con, chunksize=1000):
+    ...         process(chunk)
+    """
+    if chunksize is not None:
+        return _query_iterator(sql, con, chunksize, index_col=index_col,
+                               coerce_float=coerce_float, params=params,
+                               parse_dates=parse_dates)
+    return _read_query(sql, con, index_col=index_col,
+                       coerce_float=coerce_float, params=params,
+                       parse_dates=parse_dates)
+
+
+async def _read_query(sql, con, index_col=None, coerce_float=True,
+                      params=None, parse_dates=None):
+    columns, fetchmany, close = await _execute(con, sql, params)
+    buffers = _ColumnBuffers(columns, coerce_float=coerce_float)
+    try:
+        while True:
+            data = await fetchmany(_FETCH_BATCH_SIZE)
+            if not data:
+                break
+            buffers.append(data)
+    finally:
+        await _maybe_await(close())
+
+    frame = buffers.to_frame()
+    return _wrap_frame(frame, index_col=index_col, parse_dates=parse_dates)
+
+
+async def _query_iterator(sql, con, chunksize, index_col=None,
+                          coerce_float=True, params=None, parse_dates=None):
+    """Return asynchronous generator through chunked result set"""
+    columns, fetchmany, close = await _execute(con, sql, params)
+    try:
+        while True:
+            data = await fetchmany(chunksize)
+            if not data:
+                break
+            yield _wrap_result([data], columns, index_col=index_col,
+                               coerce_float=coerce_float,
+                               parse_dates=parse_dates)
+    finally:
+        await _maybe_await(close())
+
+
+async def to_sql_async(frame, name, con, schema=None, if_exists='fail',
+                       index=True, index_label=None, chunksize=None,
+                       dtype=None, method=None):
+    """
+    Write records stored in a DataFrame to a SQL database without blocking
+    the event loop.
+
+    Awaitable variant of :func:`pandas.io.sql.to_sql`, see there for the
+    description of the parameters. With an SQLAlchemy ``AsyncConnection``
+    the write runs through :meth:`AsyncConnection.run_sync`; an async DB-API
+    connection is written to with the SQLite flavor of the fallback mode,
+    and a callable `method` may be a coroutine function.
+
+    .. versionadded:: 0.24.0
+
+    With an async DB-API connection and no `chunksize`, the rows are
+    inserted in chunks of at most 10000 rows, so that no list of all the
+    rows is built. Converting the frame to rows still runs synchronously on
+    the event loop, as does the whole write through an SQLAlchemy
+    ``AsyncConnection`` (in its greenlet); for large frames, consider
+    running :meth:`DataFrame.to_sql` in an executor instead.
+    """
+    if if_exists not in ('fail', 'replace', 'append'):
+        raise ValueError("'{0}' is not valid for if_exists".format(if_exists))
+
+    if isinstance(frame, Series):
+        frame = frame.to_frame()
+    elif not isinstance(frame, DataFrame):
+        raise NotImplementedError("'frame' argument should be either a "
+                                  "Series or a DataFrame")
+
+    if _is_sqlalchemy_async(con):
+        def write(sync_con):
+            to_sql(frame, name, sync_con, schema=schema,
+                   if_exists=if_exists, index=index,
+                   index_label=index_label, chunksize=chunksize,
+                   dtype=dtype, method=method)
+        await con.run_sync(write)
+        return
+
+    if dtype is not None:
+        if not is_dict_like(dtype):
+            dtype = {col_name: dtype for col_name in frame}
+        for col, my_type in dtype.items():
+            if not isinstance(my_type, str):
+                raise ValueError('%s (%s) not a string' % (
+                    col, str(my_type)))
+
+    if chunksize is None and method != 'multi':
+        # stream the rows, 'multi' already keeps within the parameter limit
+        chunksize = _FETCH_BATCH_SIZE
+
+    if method is None:
+        exec_insert = _execute_insert
+    elif method == 'multi':
+        exec_insert = _execute_insert_multi
+    elif callable(method):
+        exec_insert = method
+    else:
+        raise ValueError('Invalid parameter `method`: {}'.format(method))
+
+    # only statements are generated by the table, no database access
+    table = SQLiteTable(name, None, frame=frame, index=index,
+                        if_exists=if_exists, index_label=index_label,
+                        dtype=dtype)
+
+    cursor = await _maybe_await(con.cursor())
+    try:
+        await cursor.execute("SELECT name FROM sqlite_master "
+                             "WHERE type='table' AND name=?;", [name])
+        exists = len(await cursor.fetchall()) > 0
+
+        create = not exists
+        if exists and if_exists == 'fail':
+            raise ValueError("Table '%s' already exists." % name)
+        elif exists and if_exists == 'replace':
+            await cursor.execute("DROP TABLE %s" %
+                                 _get_valid_sqlite_name(name))
+            create = True
+
+        if create:
+            for stmt in table.table:
+                await cursor.execute(stmt)
+
+        for keys, chunk_iter in table.insert_chunks(chunksize, method):
+            await _maybe_await(exec_insert(table, cursor, keys, chunk_iter))
+
+        await _maybe_await(con.commit())
+    except Exception:
+        await _maybe_await(con.rollback())
+        raise
+    finally:
+        await _maybe_await(cursor.close())
+
+
+async def _execute_insert(table, cursor, keys, data_iter):
+    await cursor.executemany(table.insert_statement(), list(data_iter))
+
+
+async def _execute_insert_multi(table, cursor, keys, data_iter):
+    data_list = list(data_iter)
+    flattened_data = [x for row in data_list for x in row]
+    await cursor.execute(table.insert_statement(num_rows=len(data_list)),
+                         flattened_data)
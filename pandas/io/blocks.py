@@ -0,0 +1,183 @@
+""" native block file format """
+
+import struct
+
+import numpy as np
+
+from pandas.compat import cPickle as pkl, range, zip
+
+from pandas.core.dtypes.dtypes import CategoricalDtype
+
+from pandas import DataFrame, DatetimeIndex
+from pandas.core.arrays import Categorical
+from pandas.core.internals import BlockManager, make_block
+
+from pandas.io.common import _stringify_path
+
+# Layout of a block file: the magic, the length of the header and the number
+# of blocks, the (offset, length) of the values of each block, the header (a
+# pickled dict with the axes and the dtype, shape and placement of each
+# block) and the raw values of the blocks, each starting at a multiple of
+# _BLOCK_ALIGNMENT.
+_BLOCKS_MAGIC = b'\x93PDBLK1\x00'
+_BLOCK_ALIGNMENT = 64
+_BLOCKS_VERSION = 1
+
+
+def _block_values(block):
+    """
+    Return ``(meta, values)`` for a block, where ``values`` is a contiguous
+    ndarray that is written raw, or bytes of the pickled block values for
+    blocks that have no raw representation.
+    """
+    values = block.values
+    if block.is_categorical:
+        meta = dict(kind='categorical', categories=values.categories,
+                    ordered=values.ordered)
+        values = values._codes
+    elif block.is_datetimetz:
+        meta = dict(kind='datetimetz', tz=values.tz)
+        values = values.asi8
+    elif isinstance(values, np.ndarray) and not values.dtype.hasobject:
+        meta = dict(kind='array')
+    else:
+        return dict(kind='pickle'), pkl.dumps(values, pkl.HIGHEST_PROTOCOL)
+
+    order = 'C'
+    if values.flags.f_contiguous and not values.flags.c_contiguous:
+        order = 'F'
+        # the transpose of a fortran ordered array is C-contiguous
+        raw = values.T
+    else:
+        raw = np.ascontiguousarray(values)
+    meta.update(dtype=values.dtype.str, shape=values.shape, order=order)
+    return meta, raw.reshape(-1).view(np.uint8)
+
+
+def to_blocks(df, path):
+    """
+    Write a DataFrame to the native block format.
+
+    Parameters
+    ----------
+    df : DataFrame
+    path : string file path
+    """
+    path = _stringify_path(path)
+    if not isinstance(df, DataFrame):
+        raise ValueError("to_blocks only supports IO with DataFrames")
+
+    mgr = df._data
+    metas = []
+    payloads = []
+    for block in mgr.blocks:
+        meta, payload = _block_values(block)
+        meta['placement'] = block.mgr_locs.indexer
+        metas.append(meta)
+        payloads.append(payload)
+
+    header = pkl.dumps(dict(version=_BLOCKS_VERSION, axes=mgr.axes,
+                            blocks=metas), pkl.HIGHEST_PROTOCOL)
+
+    pos = len(_BLOCKS_MAGIC) + 16 * (len(payloads) + 1) + len(header)
+    offsets = []
+    for payload in payloads:
+        pos += -pos % _BLOCK_ALIGNMENT
+        offsets.append(pos)
+        pos += len(payload)
+
+    with open(path, 'wb') as f:
+        f.write(_BLOCKS_MAGIC)
+        f.write(struct.pack('<QQ', len(header), len(payloads)))
+        for offset, payload in zip(offsets, payloads):
+            f.write(struct.pack('<QQ', offset, len(payload)))
+        f.write(header)
+        pos = len(_BLOCKS_MAGIC) + 16 * (len(payloads) + 1) + len(header)
+        for offset, payload in zip(offsets, payloads):
+            f.write(b'\x00' * (offset - pos))
+            f.write(payload.data if isinstance(payload, np.ndarray)
+                    else payload)
+            pos = offset + len(payload)
+
+
+def _make_block(meta, raw):
+    placement = meta['placement']
+
+    kind = meta['kind']
+    if kind == 'pickle':
+        return make_block(pkl.loads(raw.tobytes()), placement=placement,
+                          ndim=2)
+
+    values = raw.view(meta['dtype'])
+    shape = meta['shape']
+    if meta['order'] == 'F':
+        values = values.reshape(shape[::-1]).T
+    else:
+        values = values.reshape(shape)
+
+    if kind == 'categorical':
+        dtype = CategoricalDtype(meta['categories'], meta['ordered'])
+        values = Categorical(values, dtype=dtype, fastpath=True)
+    elif kind == 'datetimetz':
+        values = DatetimeIndex._simple_new(values, tz=meta['tz'])
+    return make_block(values, placement=placement, ndim=2)
+
+
+def read_blocks(path, mmap=True):
+    """
+    Load a DataFrame from the native block format.
+
+    The blocks of the frame are rebuilt directly over the stored values,
+    without any conversion.
+
+    .. versionadded:: 0.24.0
+
+    Parameters
+    ----------
+    path : string file path
+    mmap : bool, default True
+        Memory-map the file. The values of numeric, datetime, categorical
+        and datetime-tz blocks are then views on the mapped file; modifying
+        them does not change the file (copy-on-write). Object blocks are
+        always read into memory.
+
+    Returns
+    -------
+    DataFrame
+
+    See Also
+    --------
+    DataFrame.to_blocks : Write a DataFrame to the native block format.
+
+    Examples
+    --------
+    >>> df = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+    >>> df.to_blocks('frame.blocks')  # doctest: +SKIP
+    >>> pd.read_blocks('frame.blocks')  # doctest: +SKIP
+       a  b
+    0  1  x
+    1  2  y
+    """
+    path = _stringify_path(path)
+
+    with open(path, 'rb') as f:
+        if f.read(len(_BLOCKS_MAGIC)) != _BLOCKS_MAGIC:
+            raise ValueError("{path} is not a block file".format(path=path))
+        header_length, nblocks = struct.unpack('<QQ', f.read(16))
+        layout = [struct.unpack('<QQ', f.read(16)) for _ in range(nblocks)]
+        header = pkl.loads(f.read(header_length))
+        if header['version'] > _BLOCKS_VERSION:
+            raise ValueError("block file version {version} is not supported"
+                             .format(version=header['version']))
+        if mmap:
+            # the views keep the mapping alive after the file is closed
+            contents = np.memmap(f, dtype=np.uint8, mode='c')
+            contents = contents.view(np.ndarray)
+        else:
+            f.seek(0)
+            contents = np.frombuffer(bytearray(f.read()), dtype=np.uint8)
+
+    blocks = [_make_block(meta, contents[offset:offset + length])
+              for meta, (offset, length) in zip(header['blocks'], layout)]
+    mgr = BlockManager(blocks, header['axes'], do_integrity_check=False)
+    return DataFrame(mgr)
@@ -1,10 +1,13 @@
 """Common IO api utilities"""
 
 import codecs
+from collections import namedtuple
 from contextlib import closing, contextmanager
 import csv
 import mmap
 import os
+import threading
+import time
 import zipfile
 
 import pandas.compat as compat
@@ -16,6 +19,7 @@ from pandas.errors import (  # noqa
 from pandas.core.dtypes.common import is_file_like, is_number
 
 from pandas.io.formats.printing import pprint_thing
+from pandas.io.remote import RemoteFile
 
 # gh-12665: Alias for now and remove later.
 CParserError = ParserError
@@ -73,6 +77,276 @@ if not compat.PY3:
     BaseIterator.next = lambda self: self.__next__()
 
 
+class IOEvent(namedtuple('IOEvent', ['event', 'operation', 'path', 'mode',
+                                     'compression', 'nbytes', 'elapsed',
+                                     'shape'])):
+    """
+    Event passed to the listeners registered with
+    :func:`register_io_listener`.
+
+    Attributes
+    ----------
+    event : {'open', 'close', 'read', 'write'}
+        'open' and 'close' are reported for each file handle opened by
+        pandas, 'read' and 'write' once a reader or writer returns.
+    operation : str or None
+        Name of the reader or writer, e.g. 'read_csv'.
+    path : str or file-like
+        Path or buffer the reader or writer was called with.
+    mode : str
+        Mode of the handle ('read' and 'write' events: 'r' or 'w').
+    compression : str or None
+    nbytes : int or None
+        Bytes (characters for text handles) read or written; for 'read' and
+        'write' the total over the handles of the call, or the size of the file
+        if it was read by a parser directly. None if unknown.
+    elapsed : float
+        Seconds between opening and closing the handle, or spent in the reader
+        or writer call.
+    shape : tuple or None
+        Shape of the frame read or written.
+    """
+    __slots__ = ()
+
+
+_io_listeners = []
+_io_state = threading.local()
+
+
+def register_io_listener(listener):
+    """
+    Register a callable to be called with an :class:`IOEvent` for each file
+    handle opened and closed by pandas and each call of a reader or writer.
+
+    .. versionadded:: 0.24.0
+
+    Parameters
+    ----------
+    listener : callable
+        Called with a single :class:`IOEvent`, in the thread doing the I/O.
+
+    Returns
+    -------
+    listener
+        So that this can be used as a decorator.
+
+    See Also
+    --------
+    unregister_io_listener
+
+    Examples
+    --------
+    >>> from pandas.io.common import register_io_listener
+    >>> @register_io_listener
+    ... def log_io(event):
+    ...     if event.event in ('read', 'write'):
+    ...         print(event.operation, event.nbytes, event.elapsed)
+    """
+    if listener not in _io_listeners:
+        _io_listeners.append(listener)
+    return listener
+
+
+def unregister_io_listener(listener):
+    """
+    Remove a listener registered with :func:`register_io_listener`.
+
+    .. versionadded:: 0.24.0
+    """
+    _io_listeners.remove(listener)
+
+
+def _notify_io(**kwargs):
+    event = IOEvent(**kwargs)
+    for listener in list(_io_listeners):
+        listener(event)
+
+
+def _current_io_operations():
+    try:
+        return _io_state.operations
+    except AttributeError:
+        _io_state.operations = []
+        return _io_state.operations
+
+
+def _file_size(path):
+    path = _expand_user(_stringify_path(path))
+    if not isinstance(path, string_types):
+        return None
+    try:
+        if os.path.isfile(path):
+            return os.path.getsize(path)
+    except (OSError, TypeError, ValueError):
+        pass
+    return None
+
+
+class _IOReport(object):
+    """
+    Context manager reporting a call of a reader or writer to the I/O
+    listeners when the block exits without an exception.
+
+    Calling the report with the frame read or written records its shape
+    and returns the frame.
+
+    Parameters
+    ----------
+    operation : str
+        Name of the reader or writer.
+    path : str or file-like
+        Path or buffer the reader or writer was called with.
+    mode : {'r', 'w'}
+    compression : str, optional
+    local_path : bool, default True
+        Whether `path` may name a local file, whose size is reported when
+        no handle was opened through :func:`_get_handle` (e.g. the C parser
+        reads files itself).
+
+    Examples
+    --------
+    >>> with _IOReport('read_csv', path, 'r') as report:  # doctest: +SKIP
+    ...     return report(_read(path, kwds))
+    """
+
+    def __init__(self, operation, path, mode='r', compression=None,
+                 local_path=True):
+        self.operation = operation
+        self.path = path
+        self.mode = mode
+        self.compression = compression
+        self.local_path = local_path
+        self.shape = None
+
+    def __call__(self, obj):
+        self.shape = getattr(obj, 'shape', None)
+        return obj
+
+    def __enter__(self):
+        self._active = bool(_io_listeners)
+        if self._active:
+            self._state = dict(operation=self.operation, nbytes=0, handles=0)
+            _current_io_operations().append(self._state)
+            self._start = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if not self._active:
+            return
+        elapsed = time.time() - self._start
+        operations = _current_io_operations()
+        if operations and operations[-1] is self._state:
+            operations.pop()
+        if exc_type is not None:
+            return
+
+        path = _stringify_path(self.path)
+        if self._state['handles']:
+            nbytes = self._state['nbytes']
+        elif self.local_path:
+            nbytes = _file_size(path)
+        else:
+            nbytes = None
+        compression = self.compression
+        if compression == 'infer':
+            compression = _infer_compression(path, compression)
+
+        _notify_io(event='read' if self.mode == 'r' else 'write',
+                   operation=self.operation, path=path, mode=self.mode,
+                   compression=compression, nbytes=nbytes, elapsed=elapsed,
+                   shape=self.shape)
+
+
+class _MonitoredHandle(BaseIterator):
+    """
+    Proxy of a handle opened by :func:`_get_handle`, counting the data read
+    and written through it and reporting its open and close to the I/O
+    listeners.
+
+    All the methods reading or writing data are defined here, so that they
+    are counted; only the other attributes are looked up on the handle.
+    """
+
+    def __init__(self, handle, path, mode, compression):
+        self._handle = handle
+        self._path = path
+        self._mode = mode
+        self._compression = compression
+        self._operations = list(_current_io_operations())
+        self._operation = (self._operations[-1]['operation']
+                           if self._operations else None)
+        self._closed = False
+        self.nbytes = 0
+        self._start = time.time()
+        self._notify('open', elapsed=0.)
+
+    def _notify(self, event, elapsed):
+        _notify_io(event=event, operation=self._operation, path=self._path,
+                   mode=self._mode, compression=self._compression,
+                   nbytes=self.nbytes, elapsed=elapsed, shape=None)
+
+    def __getattr__(self, name):
+        return getattr(self._handle, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def read(self, *args):
+        data = self._handle.read(*args)
+        self.nbytes += len(data)
+        return data
+
+    def read1(self, *args):
+        data = self._handle.read1(*args)
+        self.nbytes += len(data)
+        return data
+
+    def readinto(self, buffer):
+        n = self._handle.readinto(buffer)
+        self.nbytes += n or 0
+        return n
+
+    def readinto1(self, buffer):
+        n = self._handle.readinto1(buffer)
+        self.nbytes += n or 0
+        return n
+
+    def readline(self, *args):
+        line = self._handle.readline(*args)
+        self.nbytes += len(line)
+        return line
+
+    def readlines(self, *args):
+        lines = self._handle.readlines(*args)
+        self.nbytes += sum(len(line) for line in lines)
+        return lines
+
+    def __next__(self):
+        line = next(self._handle)
+        self.nbytes += len(line)
+        return line
+
+    def write(self, data):
+        self.nbytes += len(data)
+        return self._handle.write(data)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def close(self):
+        self._handle.close()
+        if not self._closed:
+            self._closed = True
+            for state in self._operations:
+                state['nbytes'] += self.nbytes
+                state['handles'] += 1
+            self._notify('close', elapsed=time.time() - self._start)
+
+
 def _is_url(url):
     """Check to see if a URL has a valid protocol.
 
@@ -342,9 +616,9 @@ def _get_handle(path_or_buf, mode, encoding=None, compression=None,
     """
     try:
         from s3fs import S3File
-        need_text_wrapping = (BytesIO, S3File)
+        need_text_wrapping = (BytesIO, RemoteFile, S3File)
     except ImportError:
-        need_text_wrapping = (BytesIO,)
+        need_text_wrapping = (BytesIO, RemoteFile)
 
     handles = list()
     f = path_or_buf
@@ -449,6 +723,12 @@ def _get_handle(path_or_buf, mode, encoding=None, compression=None,
             # leave the file handler as is then
             pass
 
+    # report the handles opened here (not buffers passed in) to the listeners
+    if _io_listeners and any(f is h for h in handles):
+        monitored = _MonitoredHandle(f, path_or_buf, mode, compression)
+        handles = [monitored if h is f else h for h in handles]
+        f = monitored
+
     return f, handles
 
 
@@ -28,8 +28,8 @@ from pandas.core import config
 from pandas.core.frame import DataFrame
 
 from pandas.io.common import (
-    _NA_VALUES, _is_url, _stringify_path, _urlopen, _validate_header_arg,
-    get_filepath_or_buffer)
+    _NA_VALUES, _IOReport, _is_url, _stringify_path, _urlopen,
+    _validate_header_arg, get_filepath_or_buffer)
 from pandas.io.formats.printing import pprint_thing
 from pandas.io.parsers import TextParser
 
@@ -331,31 +331,32 @@ def read_excel(io,
         raise TypeError("read_excel() got an unexpected keyword argument "
                         "`sheet`")
 
-    if not isinstance(io, ExcelFile):
-        io = ExcelFile(io, engine=engine)
-
-    return io.parse(
-        sheet_name=sheet_name,
-        header=header,
-        names=names,
-        index_col=index_col,
-        usecols=usecols,
-        squeeze=squeeze,
-        dtype=dtype,
-        converters=converters,
-        true_values=true_values,
-        false_values=false_values,
-        skiprows=skiprows,
-        nrows=nrows,
-        na_values=na_values,
-        parse_dates=parse_dates,
-        date_parser=date_parser,
-        thousands=thousands,
-        comment=comment,
-        skipfooter=skipfooter,
-        convert_float=convert_float,
-        mangle_dupe_cols=mangle_dupe_cols,
-        **kwds)
+    with _IOReport('read_excel', io, 'r') as report:
+        if not isinstance(io, ExcelFile):
+            io = ExcelFile(io, engine=engine)
+
+        return report(io.parse(
+            sheet_name=sheet_name,
+            header=header,
+            names=names,
+            index_col=index_col,
+            usecols=usecols,
+            squeeze=squeeze,
+            dtype=dtype,
+            converters=converters,
+            true_values=true_values,
+            false_values=false_values,
+            skiprows=skiprows,
+            nrows=nrows,
+            na_values=na_values,
+            parse_dates=parse_dates,
+            date_parser=date_parser,
+            thousands=thousands,
+            comment=comment,
+            skipfooter=skipfooter,
+            convert_float=convert_float,
+            mangle_dupe_cols=mangle_dupe_cols,
+            **kwds))
 
 
 class ExcelFile(object):
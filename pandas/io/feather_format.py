@@ -5,7 +5,8 @@ from distutils.version import LooseVersion
 from pandas.compat import range
 from pandas.util._decorators import deprecate_kwarg
 
-from pandas import DataFrame, Int64Index, RangeIndex
+from pandas import DataFrame, Index, Int64Index, RangeIndex
+from pandas.core.internals import BlockManager, make_block
 
 from pandas.io.common import _stringify_path
 
@@ -84,7 +85,7 @@ def to_feather(df, path):
 
 
 @deprecate_kwarg(old_arg_name='nthreads', new_arg_name='use_threads')
-def read_feather(path, columns=None, use_threads=True):
+def read_feather(path, columns=None, use_threads=True, memory_map=False):
     """
     Load a feather-format object from the file path
 
@@ -106,6 +107,14 @@ def read_feather(path, columns=None, use_threads=True):
         Whether to parallelize reading using multiple threads
 
        .. versionadded 0.24.0
+    memory_map : bool, default False
+        Memory-map the file instead of reading it into memory. Numeric
+        and datetime columns without missing values are returned as
+        read-only views on the mapped file rather than being copied; the
+        remaining columns are converted as usual. Requires pyarrow >= 0.17.0
+        and a local file path.
+
+       .. versionadded 0.24.0
 
     Returns
     -------
@@ -116,6 +125,13 @@ def read_feather(path, columns=None, use_threads=True):
     feather, pyarrow = _try_import()
     path = _stringify_path(path)
 
+    if memory_map:
+        if LooseVersion(pyarrow.__version__) < LooseVersion('0.17.0'):
+            raise ImportError("pyarrow >= 0.17.0 is required for "
+                              "memory_map=True")
+        table = feather.read_table(path, columns=columns, memory_map=True)
+        return _table_to_frame(table, pyarrow, use_threads=bool(use_threads))
+
     if LooseVersion(pyarrow.__version__) < LooseVersion('0.11.0'):
         int_use_threads = int(use_threads)
         if int_use_threads < 1:
@@ -125,3 +141,53 @@ def read_feather(path, columns=None, use_threads=True):
 
     return feather.read_feather(path, columns=columns,
                                 use_threads=bool(use_threads))
+
+
+def _zero_copy_column(column, pyarrow):
+    """
+    Return a numpy view on the single chunk of ``column`` or None if the
+    column can not be represented without a copy.
+    """
+    if column.num_chunks != 1 or column.null_count:
+        return None
+    arr_type = column.type
+    if not (pyarrow.types.is_integer(arr_type) or
+            pyarrow.types.is_floating(arr_type) or
+            (pyarrow.types.is_timestamp(arr_type) and
+             arr_type.unit == 'ns' and arr_type.tz is None)):
+        return None
+    try:
+        return column.chunk(0).to_numpy(zero_copy_only=True)
+    except (pyarrow.ArrowInvalid, NotImplementedError):
+        return None
+
+
+def _table_to_frame(table, pyarrow, use_threads=True):
+    """
+    Convert a (memory-mapped) arrow table to a DataFrame, keeping the
+    zero-copy columns as views in blocks of their own.
+
+    The blocks are not consolidated, consolidating them would copy the
+    mapped data into memory.
+    """
+    names = table.schema.names
+    blocks = []
+    others = []
+    for i, name in enumerate(names):
+        values = _zero_copy_column(table.column(i), pyarrow)
+        if values is None:
+            others.append(i)
+        else:
+            blocks.append(make_block(values.reshape(1, -1), placement=[i]))
+
+    if others:
+        rest = pyarrow.Table.from_arrays([table.column(i) for i in others],
+                                         names=[names[i] for i in others])
+        rest = rest.to_pandas(use_threads=use_threads)
+        for blk in rest._data.blocks:
+            placement = [others[j] for j in blk.mgr_locs.indexer]
+            blocks.append(blk.make_block_same_class(blk.values,
+                                                    placement=placement))
+
+    axes = [Index(names), RangeIndex(table.num_rows)]
+    return DataFrame(BlockManager(blocks, axes, do_integrity_check=False))
@@ -4,6 +4,8 @@ try:
 except ImportError:
     raise ImportError("The gcsfs library is required to handle GCS files")
 
+from pandas.io.remote import open_remote
+
 
 def get_filepath_or_buffer(filepath_or_buffer, encoding=None,
                            compression=None, mode=None):
@@ -12,5 +14,6 @@ def get_filepath_or_buffer(filepath_or_buffer, encoding=None,
         mode = 'rb'
 
     fs = gcsfs.GCSFileSystem()
-    filepath_or_buffer = fs.open(filepath_or_buffer, mode)
+    filepath_or_buffer = open_remote(fs, filepath_or_buffer,
+                                     filepath_or_buffer, mode)
     return filepath_or_buffer, None, compression, True
@@ -15,8 +15,8 @@ from pandas import DataFrame, MultiIndex, Series, compat, isna, to_datetime
 from pandas.core.reshape.concat import concat
 
 from pandas.io.common import (
-    BaseIterator, _get_handle, _infer_compression, _stringify_path,
-    get_filepath_or_buffer)
+    BaseIterator, _IOReport, _get_handle, _infer_compression,
+    _stringify_path, get_filepath_or_buffer)
 from pandas.io.formats.printing import pprint_thing
 from pandas.io.parsers import _validate_integer
 
@@ -55,25 +55,28 @@ def to_json(path_or_buf, obj, orient=None, date_format='epoch',
     else:
         raise NotImplementedError("'obj' should be a Series or a DataFrame")
 
-    s = writer(
-        obj, orient=orient, date_format=date_format,
-        double_precision=double_precision, ensure_ascii=force_ascii,
-        date_unit=date_unit, default_handler=default_handler,
-        index=index).write()
-
-    if lines:
-        s = _convert_to_line_delimits(s)
-
-    if isinstance(path_or_buf, compat.string_types):
-        fh, handles = _get_handle(path_or_buf, 'w', compression=compression)
-        try:
-            fh.write(s)
-        finally:
-            fh.close()
-    elif path_or_buf is None:
-        return s
-    else:
-        path_or_buf.write(s)
+    with _IOReport('to_json', path_or_buf, 'w', compression) as report:
+        report(obj)
+        s = writer(
+            obj, orient=orient, date_format=date_format,
+            double_precision=double_precision, ensure_ascii=force_ascii,
+            date_unit=date_unit, default_handler=default_handler,
+            index=index).write()
+
+        if lines:
+            s = _convert_to_line_delimits(s)
+
+        if isinstance(path_or_buf, compat.string_types):
+            fh, handles = _get_handle(path_or_buf, 'w',
+                                      compression=compression)
+            try:
+                fh.write(s)
+            finally:
+                fh.close()
+        elif path_or_buf is None:
+            return s
+        else:
+            path_or_buf.write(s)
 
 
 class Writer(object):
@@ -413,23 +416,25 @@ def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
         path_or_buf, encoding=encoding, compression=compression,
     )
 
-    json_reader = JsonReader(
-        filepath_or_buffer, orient=orient, typ=typ, dtype=dtype,
-        convert_axes=convert_axes, convert_dates=convert_dates,
-        keep_default_dates=keep_default_dates, numpy=numpy,
-        precise_float=precise_float, date_unit=date_unit, encoding=encoding,
-        lines=lines, chunksize=chunksize, compression=compression,
-    )
+    with _IOReport('read_json', path_or_buf, 'r', compression) as report:
+        json_reader = JsonReader(
+            filepath_or_buffer, orient=orient, typ=typ, dtype=dtype,
+            convert_axes=convert_axes, convert_dates=convert_dates,
+            keep_default_dates=keep_default_dates, numpy=numpy,
+            precise_float=precise_float, date_unit=date_unit,
+            encoding=encoding, lines=lines, chunksize=chunksize,
+            compression=compression,
+        )
 
-    if chunksize:
-        return json_reader
+        if chunksize:
+            return json_reader
 
-    result = json_reader.read()
-    if should_close:
-        try:
-            filepath_or_buffer.close()
-        except:  # noqa: flake8
-            pass
+        result = report(json_reader.read())
+        if should_close:
+            try:
+                filepath_or_buffer.close()
+            except:  # noqa: flake8
+                pass
     return result
 
 
@@ -38,8 +38,11 @@ THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
+from multiprocessing import cpu_count
 import os
+import struct
 from textwrap import dedent
 import warnings
 
@@ -96,6 +99,8 @@ try:
     def _check_blosc():
         pass
 except ImportError:
+    blosc = None
+
     def _check_blosc():
         raise ImportError('blosc is not installed')
 
@@ -110,6 +115,26 @@ _check_blosc.__doc__ = dedent(
     """,
 )
 
+
+@contextmanager
+def _blosc_threads(use_threads):
+    """
+    Let blosc use `use_threads` threads (True for the number of CPUs) for
+    the duration of the block, restoring the previous setting afterwards.
+    """
+    if use_threads is True:
+        use_threads = cpu_count()
+    if not use_threads or blosc is None:
+        yield
+        return
+
+    previous = blosc.set_nthreads(int(use_threads))
+    try:
+        yield
+    finally:
+        blosc.set_nthreads(previous)
+
+
 # until we can pass this into our conversion functions,
 # this is pretty hacky
 compressor = None
@@ -132,11 +157,16 @@ def to_msgpack(path_or_buf, *args, **kwargs):
              (default is False)
     compress : type of compressor (zlib or blosc), default to None (no
                compression)
+    use_threads : boolean or int, number of threads blosc compresses with
+                  (True for the number of CPUs), default to False
+
+                  .. versionadded:: 0.24.0
     """
     global compressor
     compressor = kwargs.pop('compress', None)
     if compressor:
         compressor = u(compressor)
+    use_threads = kwargs.pop('use_threads', False)
     append = kwargs.pop('append', None)
     if append:
         mode = 'a+b'
@@ -144,8 +174,9 @@ def to_msgpack(path_or_buf, *args, **kwargs):
         mode = 'wb'
 
     def writer(fh):
-        for a in args:
-            fh.write(pack(a, **kwargs))
+        with _blosc_threads(use_threads):
+            for a in args:
+                fh.write(pack(a, **kwargs))
 
     path_or_buf = _stringify_path(path_or_buf)
     if isinstance(path_or_buf, compat.string_types):
@@ -159,7 +190,8 @@ def to_msgpack(path_or_buf, *args, **kwargs):
         writer(path_or_buf)
 
 
-def read_msgpack(path_or_buf, encoding='utf-8', iterator=False, **kwargs):
+def read_msgpack(path_or_buf, encoding='utf-8', iterator=False,
+                 use_threads=False, **kwargs):
     """
     Load msgpack pandas object from the specified
     file path
@@ -172,7 +204,12 @@ def read_msgpack(path_or_buf, encoding='utf-8', iterator=False, **kwargs):
     path_or_buf : string File path, BytesIO like or string
     encoding : Encoding for decoding msgpack str type
     iterator : boolean, if True, return an iterator to the unpacker
-               (default is False)
+               (default is False). The iterator reads the file in pieces of
+               `read_size` bytes and holds at most one object in memory.
+    use_threads : boolean or int, number of threads blosc decompresses
+                  with (True for the number of CPUs), default to False
+
+                  .. versionadded:: 0.24.0
 
     Returns
     -------
@@ -180,10 +217,12 @@ def read_msgpack(path_or_buf, encoding='utf-8', iterator=False, **kwargs):
     """
     path_or_buf, _, _, should_close = get_filepath_or_buffer(path_or_buf)
     if iterator:
-        return Iterator(path_or_buf)
+        return Iterator(path_or_buf, encoding=encoding,
+                        use_threads=use_threads, **kwargs)
 
     def read(fh):
-        unpacked_obj = list(unpack(fh, encoding=encoding, **kwargs))
+        with _blosc_threads(use_threads):
+            unpacked_obj = list(unpack(fh, encoding=encoding, **kwargs))
         if len(unpacked_obj) == 1:
             return unpacked_obj[0]
 
@@ -297,9 +336,14 @@ def convert(values):
         if dtype == np.object_:
             return v.tolist()
 
-        # convert to a bytes array
-        v = v.tostring()
-        return ExtType(0, blosc.compress(v, typesize=dtype.itemsize))
+        if not v.size:
+            return ExtType(0, blosc.compress(v.tostring(),
+                                             typesize=dtype.itemsize))
+
+        # compress straight from the array buffer
+        v = np.ascontiguousarray(v)
+        return ExtType(0, blosc.compress_ptr(v.__array_interface__['data'][0],
+                                             v.size, typesize=dtype.itemsize))
 
     # ndarray (on original dtype)
     return ExtType(0, v.tostring())
@@ -323,13 +367,20 @@ def unconvert(values, dtype, compress=None):
     if not as_is_ext:
         values = values.encode('latin1')
 
+    if compress == u'blosc':
+        _check_blosc()
+
+        # decompress straight into the buffer of the result; the size of
+        # the uncompressed data is stored in bytes 4-8 of the blosc header
+        nbytes, = struct.unpack('<I', values[4:8])
+        buf = np.empty(nbytes // dtype.itemsize, dtype=dtype)
+        blosc.decompress_ptr(values, buf.__array_interface__['data'][0])
+        return buf
+
     if compress:
         if compress == u'zlib':
             _check_zlib()
             decompress = zlib.decompress
-        elif compress == u'blosc':
-            _check_blosc()
-            decompress = blosc.decompress
         else:
             raise ValueError("compress must be one of 'zlib' or 'blosc'")
 
@@ -728,13 +779,13 @@ def pack(o, default=encode,
 def unpack(packed, object_hook=decode,
            list_hook=None, use_list=False, encoding='utf-8',
            unicode_errors='strict', object_pairs_hook=None,
-           max_buffer_size=0, ext_hook=ExtType):
+           max_buffer_size=0, ext_hook=ExtType, read_size=0):
     """
     Unpack a packed object, return an iterator
     Note: packed lists will be returned as tuples
     """
 
-    return Unpacker(packed, object_hook=object_hook,
+    return Unpacker(packed, read_size=read_size, object_hook=object_hook,
                     list_hook=list_hook,
                     use_list=use_list, encoding=encoding,
                     unicode_errors=unicode_errors,
@@ -782,8 +833,9 @@ class Iterator(object):
     """ manage the unpacking iteration,
         close the file on completion """
 
-    def __init__(self, path, **kwargs):
+    def __init__(self, path, use_threads=False, **kwargs):
         self.path = path
+        self.use_threads = use_threads
         self.kwargs = kwargs
 
     def __iter__(self):
@@ -815,8 +867,15 @@ class Iterator(object):
                     needs_closing = False
                     fh = self.path
 
-            unpacker = unpack(fh)
-            for o in unpacker:
+            # objects are decoded one at a time while the file is read in
+            # pieces, so only the current object is held in memory
+            unpacker = unpack(fh, **self.kwargs)
+            while True:
+                with _blosc_threads(self.use_threads):
+                    try:
+                        o = next(unpacker)
+                    except StopIteration:
+                        break
                 yield o
         finally:
             if needs_closing:
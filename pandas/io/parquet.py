@@ -6,9 +6,9 @@ from warnings import catch_warnings
 from pandas.compat import string_types
 from pandas.errors import AbstractMethodError
 
-from pandas import DataFrame, get_option
+from pandas import DataFrame, concat, get_option
 
-from pandas.io.common import get_filepath_or_buffer, is_s3_url
+from pandas.io.common import _IOReport, get_filepath_or_buffer, is_s3_url
 
 
 def get_engine(engine):
@@ -69,7 +69,15 @@ class BaseImpl(object):
     def write(self, df, path, compression, **kwargs):
         raise AbstractMethodError(self)
 
-    def read(self, path, columns=None, **kwargs):
+    def read(self, path, columns=None, filters=None, **kwargs):
+        raise AbstractMethodError(self)
+
+    def iter_read(self, path, columns=None, filters=None, chunksize=None,
+                  **kwargs):
+        """
+        Return an iterator over the file, yielding a DataFrame per row group
+        or, if `chunksize` is given, per `chunksize` rows.
+        """
         raise AbstractMethodError(self)
 
 
@@ -121,12 +129,28 @@ class PyArrowImpl(BaseImpl):
                 table, path, compression=compression,
                 coerce_timestamps=coerce_timestamps, **kwargs)
 
-    def read(self, path, columns=None, **kwargs):
+    def read(self, path, columns=None, filters=None, use_threads=None,
+             **kwargs):
         path, _, _, should_close = get_filepath_or_buffer(path)
 
         kwargs['use_pandas_metadata'] = True
-        result = self.api.parquet.read_table(path, columns=columns,
-                                             **kwargs).to_pandas()
+        to_pandas_kwargs = {}
+        if use_threads is not None:
+            # read (and convert) row groups and columns in parallel
+            kwargs['use_threads'] = use_threads
+            to_pandas_kwargs['use_threads'] = use_threads
+        if filters is not None and LooseVersion(self.api.__version__) < '1.0':
+            # only partitions of a dataset can be pruned
+            dataset = self.api.parquet.ParquetDataset(path, filters=filters)
+            table = dataset.read(columns=columns, **kwargs)
+        else:
+            if filters is not None:
+                # the datasets API also skips row groups using their
+                # statistics and filters the remaining rows
+                kwargs['filters'] = filters
+            table = self.api.parquet.read_table(path, columns=columns,
+                                                **kwargs)
+        result = table.to_pandas(**to_pandas_kwargs)
         if should_close:
             try:
                 path.close()
@@ -135,6 +159,35 @@ class PyArrowImpl(BaseImpl):
 
         return result
 
+    def iter_read(self, path, columns=None, filters=None, chunksize=None,
+                  use_threads=None, **kwargs):
+        path, _, _, should_close = get_filepath_or_buffer(path)
+        to_pandas_kwargs = {}
+        if use_threads is not None:
+            kwargs['use_threads'] = use_threads
+            to_pandas_kwargs['use_threads'] = use_threads
+
+        parquet_file = self.api.parquet.ParquetFile(path)
+
+        def iter_row_groups():
+            try:
+                for i in range(parquet_file.num_row_groups):
+                    if filters is not None and not _row_group_may_match(
+                            parquet_file.metadata.row_group(i), filters):
+                        continue
+                    table = parquet_file.read_row_group(
+                        i, columns=columns, use_pandas_metadata=True,
+                        **kwargs)
+                    yield table.to_pandas(**to_pandas_kwargs)
+            finally:
+                if should_close:
+                    try:
+                        path.close()
+                    except:  # noqa: flake8
+                        pass
+
+        return _rechunk(iter_row_groups(), chunksize)
+
 
 class FastParquetImpl(BaseImpl):
 
@@ -194,7 +247,34 @@ class FastParquetImpl(BaseImpl):
                            write_index=index, partition_on=partition_cols,
                            **kwargs)
 
-    def read(self, path, columns=None, **kwargs):
+    def read(self, path, columns=None, filters=None, use_threads=None,
+             **kwargs):
+        self._validate_use_threads(use_threads)
+        if filters is not None:
+            # skips partitions and row groups using their statistics
+            kwargs['filters'] = filters
+
+        parquet_file = self._open(path)
+        return parquet_file.to_pandas(columns=columns, **kwargs)
+
+    def iter_read(self, path, columns=None, filters=None, chunksize=None,
+                  use_threads=None, **kwargs):
+        self._validate_use_threads(use_threads)
+        if filters is not None:
+            kwargs['filters'] = filters
+
+        parquet_file = self._open(path)
+        return _rechunk(parquet_file.iter_row_groups(columns=columns,
+                                                     **kwargs),
+                        chunksize)
+
+    @staticmethod
+    def _validate_use_threads(use_threads):
+        if use_threads is not None:
+            raise ValueError("use_threads is only supported by the pyarrow "
+                             "engine")
+
+    def _open(self, path):
         if is_s3_url(path):
             # When path is s3:// an S3File is returned.
             # We need to retain the original path(str) while also
@@ -208,7 +288,7 @@ class FastParquetImpl(BaseImpl):
             path, _, _, _ = get_filepath_or_buffer(path)
             parquet_file = self.api.ParquetFile(path)
 
-        return parquet_file.to_pandas(columns=columns, **kwargs)
+        return parquet_file
 
 
 def to_parquet(df, path, engine='auto', compression='snappy', index=None,
@@ -248,11 +328,14 @@ def to_parquet(df, path, engine='auto', compression='snappy', index=None,
         Additional keyword arguments passed to the engine
     """
     impl = get_engine(engine)
-    return impl.write(df, path, compression=compression, index=index,
-                      partition_cols=partition_cols, **kwargs)
+    with _IOReport('to_parquet', path, 'w', compression) as report:
+        report(df)
+        return impl.write(df, path, compression=compression, index=index,
+                          partition_cols=partition_cols, **kwargs)
 
 
-def read_parquet(path, engine='auto', columns=None, **kwargs):
+def read_parquet(path, engine='auto', columns=None, filters=None,
+                 chunksize=None, iterator=False, use_threads=None, **kwargs):
     """
     Load a parquet object from the file path, returning a DataFrame.
 
@@ -271,12 +354,133 @@ def read_parquet(path, engine='auto', columns=None, **kwargs):
         ``io.parquet.engine`` is used. The default ``io.parquet.engine``
         behavior is to try 'pyarrow', falling back to 'fastparquet' if
         'pyarrow' is unavailable.
+    filters : list of tuples or list of lists of tuples, default None
+        Predicates ``(column, op, value)`` with ``op`` one of ``==``, ``=``,
+        ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in`` and ``not in``. The
+        tuples of a list are combined with AND, a list of such lists with
+        OR. Partitions of a dataset written with ``partition_cols`` and, with
+        fastparquet and pyarrow >= 1.0, row groups whose statistics show
+        that they cannot match are skipped without being read. Only pyarrow
+        >= 1.0 also removes the non-matching rows of the row groups that
+        are read, and only when not iterating: with `chunksize` or
+        `iterator`, both engines skip row groups using their statistics
+        and return all the rows of the remaining ones.
+
+        .. versionadded:: 0.24.0
+    chunksize : int, default None
+        Return an iterator yielding DataFrames of `chunksize` rows (the last
+        one may be shorter). Row groups are read one at a time, so at most
+        one row group and one chunk are held in memory.
+
+        .. versionadded:: 0.24.0
+    iterator : bool, default False
+        Return an iterator yielding a DataFrame per row group.
+
+        .. versionadded:: 0.24.0
+    use_threads : bool, default None
+        Read the row groups and columns of the file in parallel. Only
+        supported by the pyarrow engine, the fastparquet engine raises a
+        ValueError if it is not None. None uses the engine's default.
+
+        .. versionadded:: 0.24.0
     kwargs are passed to the engine
 
     Returns
     -------
-    DataFrame
+    DataFrame, or an iterator of DataFrames if `chunksize` or `iterator`
+    is given
+
+    Examples
+    --------
+    Read the partitions of a dataset for one year only:
+
+    >>> df.to_parquet('data', partition_cols=['year'])  # doctest: +SKIP
+    >>> pd.read_parquet('data',  # doctest: +SKIP
+    ...                 filters=[('year', '=', 2018)])
     """
 
     impl = get_engine(engine)
-    return impl.read(path, columns=columns, **kwargs)
+    if use_threads is not None:
+        kwargs['use_threads'] = use_threads
+    with _IOReport('read_parquet', path, 'r') as report:
+        if iterator or chunksize is not None:
+            if chunksize is not None and chunksize < 1:
+                raise ValueError("'chunksize' must be a positive integer")
+            return impl.iter_read(path, columns=columns, filters=filters,
+                                  chunksize=chunksize, **kwargs)
+        return report(impl.read(path, columns=columns, filters=filters,
+                                **kwargs))
+
+
+def _row_group_may_match(row_group, filters):
+    """
+    Whether the rows of a pyarrow row group can match the predicates in
+    `filters`, judging from the min and max statistics of its columns.
+    """
+    if filters and not isinstance(filters[0], list):
+        filters = [filters]
+
+    stats = {}
+    for i in range(row_group.num_columns):
+        column = row_group.column(i)
+        if column.is_stats_set and column.statistics.has_min_max:
+            stats[column.path_in_schema] = (column.statistics.min,
+                                            column.statistics.max)
+
+    def may_match(name, op, value):
+        if name not in stats:
+            return True
+        lo, hi = stats[name]
+        try:
+            if op in ('=', '=='):
+                return lo <= value <= hi
+            elif op == '!=':
+                return not lo == hi == value
+            elif op == '<':
+                return lo < value
+            elif op == '<=':
+                return lo <= value
+            elif op == '>':
+                return hi > value
+            elif op == '>=':
+                return hi >= value
+            elif op == 'in':
+                return any(lo <= v <= hi for v in value)
+            elif op == 'not in':
+                return not (lo == hi and lo in value)
+        except TypeError:
+            # statistics that can't be compared with the value
+            return True
+        raise ValueError("'{op}' is not a valid operator in "
+                         "predicates.".format(op=op))
+
+    return any(all(may_match(*predicate) for predicate in conjunction)
+               for conjunction in filters)
+
+
+def _rechunk(frames, chunksize):
+    """
+    Regroup an iterator of DataFrames into DataFrames of `chunksize` rows.
+    If `chunksize` is None, the frames are passed through.
+    """
+    if chunksize is None:
+        for frame in frames:
+            yield frame
+        return
+
+    pending = []
+    npending = 0
+    for frame in frames:
+        pending.append(frame)
+        npending += len(frame)
+        if npending < chunksize:
+            continue
+        frame = concat(pending) if len(pending) > 1 else pending[0]
+        start = 0
+        while npending - start >= chunksize:
+            yield frame.iloc[start:start + chunksize]
+            start += chunksize
+        pending = [frame.iloc[start:]] if start < npending else []
+        npending -= start
+    if npending:
+        yield concat(pending) if len(pending) > 1 else pending[0]
@@ -42,9 +42,9 @@ from pandas.core.series import Series
 from pandas.core.tools import datetimes as tools
 
 from pandas.io.common import (
-    _NA_VALUES, BaseIterator, UnicodeReader, UTF8Recoder, _get_handle,
-    _infer_compression, _validate_header_arg, get_filepath_or_buffer,
-    is_file_like)
+    _NA_VALUES, BaseIterator, UnicodeReader, UTF8Recoder, _IOReport,
+    _get_handle, _infer_compression, _validate_header_arg,
+    get_filepath_or_buffer, is_file_like)
 from pandas.io.date_converters import generic_parser
 
 # BOM character (byte order mark)
@@ -693,7 +693,8 @@ def _make_parser_function(name, default_sep=','):
                     infer_datetime_format=infer_datetime_format,
                     skip_blank_lines=skip_blank_lines)
 
-        return _read(filepath_or_buffer, kwds)
+        with _IOReport(name, filepath_or_buffer, 'r', compression) as report:
+            return report(_read(filepath_or_buffer, kwds))
 
     parser_f.__name__ = name
 
@@ -794,7 +795,9 @@ def read_fwf(filepath_or_buffer, colspecs='infer', widths=None,
     kwds['colspecs'] = colspecs
     kwds['infer_nrows'] = infer_nrows
     kwds['engine'] = 'python-fwf'
-    return _read(filepath_or_buffer, kwds)
+    with _IOReport('read_fwf', filepath_or_buffer, 'r',
+                   kwds.get('compression', 'infer')) as report:
+        return report(_read(filepath_or_buffer, kwds))
 
 
 class TextFileReader(BaseIterator):
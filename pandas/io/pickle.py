@@ -1,15 +1,26 @@
 """ pickle compat """
+import mmap as mmap_module
+import struct
 import warnings
 
 import numpy as np
 from numpy.lib.format import read_array, write_array
 
-from pandas.compat import PY3, BytesIO, cPickle as pkl, pickle_compat as pc
+from pandas.compat import (
+    PY3, BytesIO, cPickle as pkl, pickle5, pickle_compat as pc)
 
-from pandas.io.common import _get_handle, _stringify_path
+from pandas.io.common import _get_handle, _infer_compression, _stringify_path
 
+# Layout of a pickle written with out-of-band buffers: the magic, the length
+# of the pickle stream and the number of buffers, the (offset, length) of
+# each buffer, the pickle stream and the buffers, each starting at a multiple
+# of _BUFFER_ALIGNMENT in the (uncompressed) file.
+_OUT_OF_BAND_MAGIC = b'\x93PDPKL5\x00'
+_BUFFER_ALIGNMENT = 64
 
-def to_pickle(obj, path, compression='infer', protocol=pkl.HIGHEST_PROTOCOL):
+
+def to_pickle(obj, path, compression='infer', protocol=pkl.HIGHEST_PROTOCOL,
+              out_of_band=False):
     """
     Pickle (serialize) object to file.
 
@@ -35,6 +46,15 @@ def to_pickle(obj, path, compression='infer', protocol=pkl.HIGHEST_PROTOCOL):
 
         .. [1] https://docs.python.org/3/library/pickle.html
         .. versionadded:: 0.21.0
+    out_of_band : bool, default False
+        Write the data buffers of the object (e.g. the values of numeric,
+        datetime and categorical columns) out-of-band after the pickle
+        stream, aligned so that they can be memory-mapped by
+        ``read_pickle(path, mmap=True)``. Such files can only be read with
+        :func:`read_pickle`. Requires pickle protocol 5, which is available
+        on Python 3.8+ or with the ``pickle5`` package.
+
+        .. versionadded:: 0.24.0
 
     See Also
     --------
@@ -68,19 +88,79 @@ def to_pickle(obj, path, compression='infer', protocol=pkl.HIGHEST_PROTOCOL):
     >>> os.remove("./dummy.pkl")
     """
     path = _stringify_path(path)
+    if protocol < 0:
+        protocol = pkl.HIGHEST_PROTOCOL
+    if out_of_band:
+        if pickle5 is None:
+            raise ImportError("out_of_band requires pickle protocol 5, "
+                              "install the pickle5 package")
+        if protocol < 5:
+            raise ValueError("out_of_band requires protocol 5 or higher")
+
     f, fh = _get_handle(path, 'wb',
                         compression=compression,
                         is_text=False)
-    if protocol < 0:
-        protocol = pkl.HIGHEST_PROTOCOL
     try:
-        f.write(pkl.dumps(obj, protocol=protocol))
+        if out_of_band and _infer_compression(path, compression) == 'zip':
+            # every write adds a member to a zip archive
+            buf = BytesIO()
+            _write_out_of_band(buf, obj, protocol)
+            f.write(buf.getvalue())
+        elif out_of_band:
+            _write_out_of_band(f, obj, protocol)
+        else:
+            f.write(pkl.dumps(obj, protocol=protocol))
     finally:
         for _f in fh:
             _f.close()
 
 
-def read_pickle(path, compression='infer'):
+def _write_out_of_band(f, obj, protocol):
+    buffers = []
+    data = pickle5.dumps(obj, protocol=protocol,
+                         buffer_callback=buffers.append)
+    buffers = [buf.raw() for buf in buffers]
+
+    header_length = len(_OUT_OF_BAND_MAGIC) + 16 * (len(buffers) + 1)
+    pos = header_length + len(data)
+    offsets = []
+    for buf in buffers:
+        pos += -pos % _BUFFER_ALIGNMENT
+        offsets.append(pos)
+        pos += buf.nbytes
+
+    f.write(_OUT_OF_BAND_MAGIC)
+    f.write(struct.pack('<QQ', len(data), len(buffers)))
+    for offset, buf in zip(offsets, buffers):
+        f.write(struct.pack('<QQ', offset, buf.nbytes))
+    f.write(data)
+    pos = header_length + len(data)
+    for offset, buf in zip(offsets, buffers):
+        f.write(b'\x00' * (offset - pos))
+        f.write(buf)
+        pos = offset + buf.nbytes
+
+
+def _read_out_of_band(f, mmap=False):
+    f.read(len(_OUT_OF_BAND_MAGIC))
+    data_length, nbuffers = struct.unpack('<QQ', f.read(16))
+    layout = [struct.unpack('<QQ', f.read(16)) for _ in range(nbuffers)]
+    data = f.read(data_length)
+    pos = len(_OUT_OF_BAND_MAGIC) + 16 * (nbuffers + 1) + data_length
+
+    if mmap:
+        # read-only views into the mapped file
+        contents = memoryview(mmap_module.mmap(f.fileno(), 0,
+                                               access=mmap_module.ACCESS_READ))
+        pos = 0
+    else:
+        contents = memoryview(bytearray(f.read()))
+    buffers = [contents[offset - pos:offset - pos + length]
+               for offset, length in layout]
+    return pickle5.loads(data, buffers=buffers)
+
+
+def read_pickle(path, compression='infer', mmap=False):
     """
     Load pickled pandas object (or any object) from file.
 
@@ -100,6 +180,13 @@ def read_pickle(path, compression='infer'):
         Set to None for no decompression.
 
         .. versionadded:: 0.20.0
+    mmap : bool, default False
+        If the file was written with ``to_pickle(..., out_of_band=True)``,
+        memory-map its data buffers instead of reading them. The arrays of
+        the returned object are then read-only views into the file. Not
+        supported for compressed files.
+
+        .. versionadded:: 0.24.0
 
     Returns
     -------
@@ -138,6 +225,8 @@ def read_pickle(path, compression='infer'):
     >>> os.remove("./dummy.pkl")
     """
     path = _stringify_path(path)
+    if mmap and _infer_compression(path, compression) is not None:
+        raise ValueError("mmap is not supported for compressed files")
 
     def read_wrapper(func):
         # wrapper file handle open/close operation
@@ -175,6 +264,14 @@ def read_pickle(path, compression='infer'):
             except Exception:  # noqa: E722
                 return read_wrapper(
                     lambda f: pc.load(f, encoding=encoding, compat=True))
+    if read_wrapper(
+            lambda f: f.read(len(_OUT_OF_BAND_MAGIC)) == _OUT_OF_BAND_MAGIC):
+        if pickle5 is None:
+            raise ImportError("reading a pickle with out-of-band buffers "
+                              "requires pickle protocol 5, install the "
+                              "pickle5 package")
+        return read_wrapper(lambda f: _read_out_of_band(f, mmap=mmap))
+
     try:
         return try_read(path)
     except Exception:  # noqa: E722
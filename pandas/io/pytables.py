@@ -44,7 +44,7 @@ from pandas.core.internals import (
     BlockManager, _block2d_to_blocknd, _block_shape, _factor_indexer,
     make_block)
 
-from pandas.io.common import _stringify_path
+from pandas.io.common import _IOReport, _stringify_path
 from pandas.io.formats.printing import adjoin, pprint_thing
 
 # versioning attribute
@@ -268,12 +268,14 @@ def to_hdf(path_or_buf, key, value, mode=None, complevel=None, complib=None,
         f = lambda store: store.put(key, value, **kwargs)
 
     path_or_buf = _stringify_path(path_or_buf)
-    if isinstance(path_or_buf, string_types):
-        with HDFStore(path_or_buf, mode=mode, complevel=complevel,
-                      complib=complib) as store:
-            f(store)
-    else:
-        f(path_or_buf)
+    with _IOReport('to_hdf', path_or_buf, 'w', complib) as report:
+        report(value)
+        if isinstance(path_or_buf, string_types):
+            with HDFStore(path_or_buf, mode=mode, complevel=complevel,
+                          complib=complib) as store:
+                f(store)
+        else:
+            f(path_or_buf)
 
 
 def read_hdf(path_or_buf, key=None, mode='r', **kwargs):
@@ -316,6 +318,15 @@ def read_hdf(path_or_buf, key=None, mode='r', **kwargs):
         Specifies how encoding and decoding errors are to be handled.
         See the errors argument for :func:`open` for a full list
         of options.
+    mmap : bool, default False
+        Memory-map contiguous, uncompressed array nodes of a fixed format
+        store instead of copying them into memory. The returned object is
+        backed by read-only arrays and shares the page cache with other
+        processes mapping the same file. Nodes that cannot be mapped (e.g.
+        compressed or chunked nodes) are read normally. Requires h5py.
+
+        .. versionadded:: 0.24.0
+
     **kwargs
         Additional keyword arguments passed to HDFStore.
 
@@ -342,6 +353,7 @@ def read_hdf(path_or_buf, key=None, mode='r', **kwargs):
     # grab the scope
     if 'where' in kwargs:
         kwargs['where'] = _ensure_term(kwargs['where'], scope_level=1)
+    mmap = kwargs.pop('mmap', False)
 
     if isinstance(path_or_buf, HDFStore):
         if not path_or_buf.is_open:
@@ -386,7 +398,9 @@ def read_hdf(path_or_buf, key=None, mode='r', **kwargs):
                     raise ValueError('key must be provided when HDF5 file '
                                      'contains multiple datasets.')
             key = candidate_only_group._v_pathname
-        return store.select(key, auto_close=auto_close, **kwargs)
+        with _IOReport('read_hdf', path_or_buf, 'r') as report:
+            return report(store.select(key, auto_close=auto_close, mmap=mmap,
+                                       **kwargs))
     except (ValueError, TypeError):
         # if there is an error, close the store
         try:
@@ -688,7 +702,8 @@ class HDFStore(StringMixin):
         return self._read_group(group)
 
     def select(self, key, where=None, start=None, stop=None, columns=None,
-               iterator=False, chunksize=None, auto_close=False, **kwargs):
+               iterator=False, chunksize=None, auto_close=False, mmap=False,
+               **kwargs):
         """
         Retrieve pandas object stored in file, optionally based on where
         criteria
@@ -705,6 +720,10 @@ class HDFStore(StringMixin):
         chunksize : nrows to include in iteration, return an iterator
         auto_close : boolean, should automatically close the store when
             finished, default is False
+        mmap : boolean, memory-map uncompressed array nodes of a fixed
+            format store into read-only arrays, default is False
+
+            .. versionadded:: 0.24.0
 
         Returns
         -------
@@ -719,6 +738,12 @@ class HDFStore(StringMixin):
         s = self._create_storer(group)
         s.infer_axes()
 
+        if mmap:
+            if s.is_table:
+                raise ValueError("mmap is only supported when reading a "
+                                 "Fixed format store")
+            s.mmap = True
+
         # function to call on iteration
         def func(_start, _stop, _where):
             return s.read(start=_start, stop=_stop,
@@ -2438,6 +2463,7 @@ class GenericFixed(Fixed):
     _index_type_map = {DatetimeIndex: 'datetime', PeriodIndex: 'period'}
     _reverse_index_map = {v: k for k, v in compat.iteritems(_index_type_map)}
     attributes = []
+    mmap = False
 
     # indexer helpders
     def _class_to_alias(self, cls):
@@ -2518,10 +2544,16 @@ class GenericFixed(Fixed):
             dtype = getattr(attrs, 'value_type', None)
             shape = getattr(attrs, 'shape', None)
 
+            ret = None
             if shape is not None:
                 # length 0 axis
                 ret = np.empty(shape, dtype=dtype)
-            else:
+            elif self.mmap and type(node) is tables.Array:
+                ret = self._mmap_array(node)
+                if ret is not None:
+                    ret = ret[start:stop]
+
+            if ret is None:
                 ret = node[start:stop]
 
             if dtype == u'datetime64':
@@ -2537,6 +2569,37 @@ class GenericFixed(Fixed):
         else:
             return ret
 
+    def _mmap_array(self, node):
+        """
+        map a contiguous (unchunked, hence uncompressed) array node into a
+        read-only ndarray, return None if the node data cannot be mapped
+        """
+        try:
+            import h5py
+        except ImportError:
+            raise ImportError("mmap=True requires h5py to locate the array "
+                              "data inside the HDF5 file")
+
+        # only plain on-disk files can be mapped
+        if getattr(self._handle, 'driver', None) not in (None, 'H5FD_SEC2'):
+            return None
+
+        path = self.parent._path
+        with h5py.File(path, 'r') as f:
+            offset = f[node._v_pathname].id.get_offset()
+        if offset is None:
+            return None
+
+        dtype = node.atom.dtype
+        if node.byteorder == 'little':
+            dtype = dtype.newbyteorder('<')
+        elif node.byteorder == 'big':
+            dtype = dtype.newbyteorder('>')
+
+        values = np.memmap(path, dtype=dtype, mode='r', offset=offset,
+                           shape=node.shape)
+        return values.view(np.ndarray)
+
     def read_index(self, key, **kwargs):
         variety = _ensure_decoded(getattr(self.attrs, '%s_variety' % key))
 
@@ -0,0 +1,223 @@
+""" parallel ranged reads of remote files """
+
+import hashlib
+import io
+from multiprocessing.pool import ThreadPool
+import os
+import tempfile
+import threading
+
+from pandas.compat import range
+
+from pandas.core.config import get_option
+
+
+class RangeReader(object):
+    """
+    Fetch byte ranges of a file of a filesystem object (``s3fs``, ``gcsfs``).
+
+    Each thread reads through a file object of its own. Subclasses can
+    override :meth:`fetch` to plug in a different way of fetching ranges.
+
+    Parameters
+    ----------
+    fs : filesystem object
+        Has ``info(path)`` and ``open(path, mode)`` methods.
+    path : str
+        Path of the file in ``fs``.
+    block_size : int, optional
+        Read-ahead block size of the file objects opened on ``fs``.
+    """
+
+    def __init__(self, fs, path, block_size=None):
+        self.fs = fs
+        self.path = path
+        self.block_size = block_size
+        info = fs.info(path)
+        self.size = int(info['size'] if 'size' in info else info['Size'])
+        self.etag = None
+        for key in ['ETag', 'etag', 'md5Hash']:
+            if info.get(key):
+                self.etag = str(info[key])
+                break
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._handles = []
+
+    def _open(self):
+        f = getattr(self._local, 'handle', None)
+        if f is None:
+            try:
+                f = self.fs.open(self.path, 'rb', block_size=self.block_size)
+            except TypeError:
+                f = self.fs.open(self.path, 'rb')
+            self._local.handle = f
+            with self._lock:
+                self._handles.append(f)
+        return f
+
+    def fetch(self, start, end):
+        """ Return the bytes ``start:end`` of the file. """
+        f = self._open()
+        f.seek(start)
+        return f.read(end - start)
+
+    def close(self):
+        with self._lock:
+            handles, self._handles = self._handles, []
+        for f in handles:
+            f.close()
+
+
+class RemoteFile(io.RawIOBase):
+    """
+    Read-only, seekable file object over a :class:`RangeReader`.
+
+    The file is read in blocks of ``block_size`` bytes. Reading a block
+    schedules the fetch of the next ``readahead`` blocks on a pool of
+    ``threads`` threads; blocks behind the read position are dropped, so at
+    most ``readahead + 1`` blocks are held in memory.
+
+    If ``cache_dir`` is given, the blocks are also stored there, in files
+    keyed by the url, the etag of the object and the byte range, and read
+    back from there by later reads of the same object. Objects without an
+    etag are not cached.
+    """
+
+    def __init__(self, reader, url, block_size, readahead=0, threads=1,
+                 cache_dir=None):
+        super(RemoteFile, self).__init__()
+        self._reader = reader
+        self._url = url
+        self._size = reader.size
+        self._block_size = block_size
+        self._nblocks = -(-self._size // block_size)
+        self._readahead = readahead
+        self._cache_dir = cache_dir
+        self._pool = ThreadPool(max(threads, 1))
+        self._pending = {}
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._size
+        elif whence != io.SEEK_SET:
+            raise ValueError("invalid whence ({whence})".format(whence=whence))
+        if offset < 0:
+            raise ValueError("negative seek position {offset}"
+                             .format(offset=offset))
+        self._pos = offset
+        return self._pos
+
+    def peek(self, size=0):
+        """ Return the rest of the current block without advancing. """
+        if self._pos >= self._size:
+            return b''
+        i, start = divmod(self._pos, self._block_size)
+        return self._block(i)[start:]
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self._size
+        size = max(min(size, self._size - self._pos), 0)
+
+        chunks = []
+        while size > 0:
+            chunk = self.peek()[:size]
+            chunks.append(chunk)
+            self._pos += len(chunk)
+            size -= len(chunk)
+        return b''.join(chunks)
+
+    def readall(self):
+        return self.read()
+
+    def readinto(self, b):
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._pool.terminate()
+            self._pending = {}
+            self._reader.close()
+        super(RemoteFile, self).close()
+
+    def _block(self, i):
+        last = min(i + self._readahead, self._nblocks - 1)
+        for j in range(i, last + 1):
+            if j not in self._pending:
+                self._pending[j] = self._pool.apply_async(self._fetch_block,
+                                                          (j,))
+        for j in [j for j in self._pending if j < i or j > last]:
+            del self._pending[j]
+        return self._pending[i].get()
+
+    def _cache_path(self, start, end):
+        if self._cache_dir is None or self._reader.etag is None:
+            return None
+        key = u'\0'.join([self._url, self._reader.etag,
+                          str(start), str(end)])
+        return os.path.join(self._cache_dir,
+                            hashlib.sha1(key.encode('utf-8')).hexdigest())
+
+    def _fetch_block(self, i):
+        start = i * self._block_size
+        end = min(start + self._block_size, self._size)
+
+        path = self._cache_path(start, end)
+        if path is not None and os.path.exists(path):
+            with open(path, 'rb') as f:
+                return f.read()
+
+        data = self._reader.fetch(start, end)
+        if path is not None:
+            _store(path, data)
+        return data
+
+
+def _store(path, data):
+    # write to a temporary file first, so that concurrent readers never see
+    # a partial block
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    try:
+        os.rename(tmp, path)
+    except OSError:
+        # another reader stored the block in the meantime (Windows)
+        os.remove(tmp)
+
+
+def open_remote(fs, path, url, mode='rb'):
+    """
+    Open ``path`` of the filesystem object ``fs``.
+
+    Files opened for reading go through :class:`RemoteFile` when
+    ``io.remote.threads`` is positive or ``io.remote.cache_dir`` is set,
+    otherwise (and for writing) the file object of ``fs`` is returned.
+    """
+    threads = get_option('io.remote.threads')
+    cache_dir = get_option('io.remote.cache_dir')
+    if mode != 'rb' or (threads <= 0 and cache_dir is None):
+        return fs.open(path, mode)
+
+    if cache_dir is not None and not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+    block_size = get_option('io.remote.block_size')
+    reader = RangeReader(fs, path, block_size=block_size)
+    return RemoteFile(reader, url, block_size,
+                      readahead=get_option('io.remote.readahead'),
+                      threads=threads, cache_dir=cache_dir)
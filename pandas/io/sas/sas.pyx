@@ -1,6 +1,8 @@
 # cython: profile=False
 # cython: boundscheck=False, initializedcheck=False
 
+from libc.string cimport memset
+
 import numpy as np
 import sas_constants as const
 
@@ -8,17 +10,37 @@ ctypedef signed long long   int64_t
 ctypedef unsigned char      uint8_t
 ctypedef unsigned short     uint16_t
 
+ctypedef int (*decompress_func)(const uint8_t *inbuff, int length,
+                                uint8_t *result, int result_length) nogil
+
+# error codes of the decompressors, which run without the GIL
+cdef enum DecompressError:
+    decompress_overrun = -1
+    rle_nonzero_end_of_first_byte = -2
+    rle_unknown_control_byte = -3
+    rdc_unknown_command = -4
+
+
+cdef raise_decompress_error(int status):
+    if status == rle_nonzero_end_of_first_byte:
+        raise ValueError("Unexpected non-zero end_of_first_byte")
+    elif status == rle_unknown_control_byte:
+        raise ValueError("unknown control byte")
+    elif status == rdc_unknown_command:
+        raise ValueError("unknown RDC command")
+    raise ValueError("compressed row does not match the row length")
+
+
 # rle_decompress decompresses data using a Run Length Encoding
 # algorithm.  It is partially documented here:
 #
 # https://cran.r-project.org/web/packages/sas7bdat/vignettes/sas7bdat.pdf
-cdef const uint8_t[:] rle_decompress(int result_length,
-                                     const uint8_t[:] inbuff):
+cdef int rle_decompress(const uint8_t *inbuff, int length,
+                        uint8_t *result, int result_length) nogil:
 
     cdef:
         uint8_t control_byte, x
-        uint8_t[:] result = np.zeros(result_length, np.uint8)
-        int rpos = 0, ipos = 0, length = len(inbuff)
+        int rpos = 0, ipos = 0
         int i, nbytes, end_of_first_byte
 
     while ipos < length:
@@ -28,116 +50,104 @@ cdef const uint8_t[:] rle_decompress(int result_length,
 
         if control_byte == 0x00:
             if end_of_first_byte != 0:
-                raise ValueError("Unexpected non-zero end_of_first_byte")
+                return rle_nonzero_end_of_first_byte
+            if ipos >= length:
+                return decompress_overrun
             nbytes = <int>(inbuff[ipos]) + 64
             ipos += 1
+            if ipos + nbytes > length or rpos + nbytes > result_length:
+                return decompress_overrun
             for i in range(nbytes):
                 result[rpos] = inbuff[ipos]
                 rpos += 1
                 ipos += 1
         elif control_byte == 0x40:
             # not documented
+            if ipos + 1 >= length:
+                return decompress_overrun
             nbytes = end_of_first_byte * 16
             nbytes += <int>(inbuff[ipos])
             ipos += 1
-            for i in range(nbytes):
-                result[rpos] = inbuff[ipos]
-                rpos += 1
-            ipos += 1
-        elif control_byte == 0x60:
-            nbytes = end_of_first_byte * 256 + <int>(inbuff[ipos]) + 17
+            if rpos + nbytes > result_length:
+                return decompress_overrun
+            memset(&result[rpos], inbuff[ipos], nbytes)
+            rpos += nbytes
             ipos += 1
-            for i in range(nbytes):
-                result[rpos] = 0x20
-                rpos += 1
-        elif control_byte == 0x70:
+        elif control_byte == 0x60 or control_byte == 0x70:
+            if ipos >= length:
+                return decompress_overrun
             nbytes = end_of_first_byte * 256 + <int>(inbuff[ipos]) + 17
             ipos += 1
-            for i in range(nbytes):
-                result[rpos] = 0x00
-                rpos += 1
-        elif control_byte == 0x80:
-            nbytes = end_of_first_byte + 1
-            for i in range(nbytes):
-                result[rpos] = inbuff[ipos + i]
-                rpos += 1
-            ipos += nbytes
-        elif control_byte == 0x90:
-            nbytes = end_of_first_byte + 17
-            for i in range(nbytes):
-                result[rpos] = inbuff[ipos + i]
-                rpos += 1
-            ipos += nbytes
-        elif control_byte == 0xA0:
-            nbytes = end_of_first_byte + 33
-            for i in range(nbytes):
-                result[rpos] = inbuff[ipos + i]
-                rpos += 1
-            ipos += nbytes
-        elif control_byte == 0xB0:
-            nbytes = end_of_first_byte + 49
+            if rpos + nbytes > result_length:
+                return decompress_overrun
+            x = 0x20 if control_byte == 0x60 else 0x00
+            memset(&result[rpos], x, nbytes)
+            rpos += nbytes
+        elif (control_byte == 0x80 or control_byte == 0x90 or
+                control_byte == 0xA0 or control_byte == 0xB0):
+            # 0x80: 1, 0x90: 17, 0xA0: 33 and 0xB0: 49 plus end_of_first_byte
+            nbytes = end_of_first_byte + 1 + 16 * ((control_byte >> 4) - 8)
+            if ipos + nbytes > length or rpos + nbytes > result_length:
+                return decompress_overrun
             for i in range(nbytes):
                 result[rpos] = inbuff[ipos + i]
                 rpos += 1
             ipos += nbytes
         elif control_byte == 0xC0:
+            if ipos >= length:
+                return decompress_overrun
             nbytes = end_of_first_byte + 3
             x = inbuff[ipos]
             ipos += 1
-            for i in range(nbytes):
-                result[rpos] = x
-                rpos += 1
-        elif control_byte == 0xD0:
+            if rpos + nbytes > result_length:
+                return decompress_overrun
+            memset(&result[rpos], x, nbytes)
+            rpos += nbytes
+        elif (control_byte == 0xD0 or control_byte == 0xE0 or
+                control_byte == 0xF0):
             nbytes = end_of_first_byte + 2
-            for i in range(nbytes):
-                result[rpos] = 0x40
-                rpos += 1
-        elif control_byte == 0xE0:
-            nbytes = end_of_first_byte + 2
-            for i in range(nbytes):
-                result[rpos] = 0x20
-                rpos += 1
-        elif control_byte == 0xF0:
-            nbytes = end_of_first_byte + 2
-            for i in range(nbytes):
-                result[rpos] = 0x00
-                rpos += 1
+            if rpos + nbytes > result_length:
+                return decompress_overrun
+            if control_byte == 0xD0:
+                x = 0x40
+            elif control_byte == 0xE0:
+                x = 0x20
+            else:
+                x = 0x00
+            memset(&result[rpos], x, nbytes)
+            rpos += nbytes
         else:
-            raise ValueError("unknown control byte: {byte}"
-                             .format(byte=control_byte))
-
-    # In py37 cython/clang sees `len(outbuff)` as size_t and not Py_ssize_t
-    if <Py_ssize_t>len(result) != <Py_ssize_t>result_length:
-        raise ValueError("RLE: {got} != {expect}".format(got=len(result),
-                                                         expect=result_length))
+            return rle_unknown_control_byte
 
-    return np.asarray(result)
+    return 0
 
 
 # rdc_decompress decompresses data using the Ross Data Compression algorithm:
 #
 # http://collaboration.cmc.ec.gc.ca/science/rpn/biblio/ddj/Website/articles/CUJ/1992/9210/ross/ross.htm
-cdef const uint8_t[:] rdc_decompress(int result_length,
-                                     const uint8_t[:] inbuff):
+cdef int rdc_decompress(const uint8_t *inbuff, int length,
+                        uint8_t *outbuff, int result_length) nogil:
 
     cdef:
         uint8_t cmd
-        uint16_t ctrl_bits, ctrl_mask = 0, ofs, cnt
+        uint16_t ctrl_bits = 0, ctrl_mask = 0, ofs, cnt
         int ipos = 0, rpos = 0, k
-        uint8_t[:] outbuff = np.zeros(result_length, dtype=np.uint8)
 
-    ii = -1
-
-    while ipos < len(inbuff):
-        ii += 1
+    while ipos < length:
         ctrl_mask = ctrl_mask >> 1
         if ctrl_mask == 0:
+            if ipos + 1 >= length:
+                return decompress_overrun
             ctrl_bits = ((<uint16_t>inbuff[ipos] << 8) +
                          <uint16_t>inbuff[ipos + 1])
             ipos += 2
             ctrl_mask = 0x8000
+            if ipos >= length:
+                break
 
         if ctrl_bits & ctrl_mask == 0:
+            if rpos >= result_length:
+                return decompress_overrun
             outbuff[rpos] = inbuff[ipos]
             ipos += 1
             rpos += 1
@@ -146,12 +156,15 @@ cdef const uint8_t[:] rdc_decompress(int result_length,
         cmd = (inbuff[ipos] >> 4) & 0x0F
         cnt = <uint16_t>(inbuff[ipos] & 0x0F)
         ipos += 1
+        if ipos >= length:
+            return decompress_overrun
 
         # short RLE
         if cmd == 0:
             cnt += 3
-            for k in range(cnt):
-                outbuff[rpos + k] = inbuff[ipos]
+            if rpos + cnt > result_length:
+                return decompress_overrun
+            memset(&outbuff[rpos], inbuff[ipos], cnt)
             rpos += cnt
             ipos += 1
 
@@ -160,8 +173,9 @@ cdef const uint8_t[:] rdc_decompress(int result_length,
             cnt += <uint16_t>inbuff[ipos] << 4
             cnt += 19
             ipos += 1
-            for k in range(cnt):
-                outbuff[rpos + k] = inbuff[ipos]
+            if ipos >= length or rpos + cnt > result_length:
+                return decompress_overrun
+            memset(&outbuff[rpos], inbuff[ipos], cnt)
             rpos += cnt
             ipos += 1
 
@@ -170,9 +184,14 @@ cdef const uint8_t[:] rdc_decompress(int result_length,
             ofs = cnt + 3
             ofs += <uint16_t>inbuff[ipos] << 4
             ipos += 1
+            if ipos >= length:
+                return decompress_overrun
             cnt = <uint16_t>inbuff[ipos]
             ipos += 1
             cnt += 16
+            if ofs > rpos or rpos + cnt > result_length:
+                return decompress_overrun
+            # the pattern may overlap the output, copy byte by byte
             for k in range(cnt):
                 outbuff[rpos + k] = outbuff[rpos - <int>ofs + k]
             rpos += cnt
@@ -182,19 +201,16 @@ cdef const uint8_t[:] rdc_decompress(int result_length,
             ofs = cnt + 3
             ofs += <uint16_t>inbuff[ipos] << 4
             ipos += 1
+            if ofs > rpos or rpos + cmd > result_length:
+                return decompress_overrun
             for k in range(cmd):
                 outbuff[rpos + k] = outbuff[rpos - <int>ofs + k]
             rpos += cmd
 
         else:
-            raise ValueError("unknown RDC command")
-
-    # In py37 cython/clang sees `len(outbuff)` as size_t and not Py_ssize_t
-    if <Py_ssize_t>len(outbuff) != <Py_ssize_t>result_length:
-        raise ValueError("RDC: {got} != {expect}\n"
-                         .format(got=len(outbuff), expect=result_length))
+            return rdc_unknown_command
 
-    return np.asarray(outbuff)
+    return 0
 
 
 cdef enum ColumnTypes:
@@ -209,6 +225,9 @@ cdef int page_mix_types_1 = const.page_mix_types[1]
 cdef int page_data_type = const.page_data_type
 cdef int subheader_pointers_offset = const.subheader_pointers_offset
 
+# number of pages per thread that are collected before they are processed
+cdef int pages_per_thread = 16
+
 
 cdef class Parser(object):
 
@@ -218,7 +237,7 @@ cdef class Parser(object):
         int64_t[:] offsets
         int64_t[:] column_types
         uint8_t[:, :] byte_chunk
-        object[:, :] string_chunk
+        uint8_t[:, :] string_chunk
         char *cached_page
         int current_row_on_page_index
         int current_page_block_count
@@ -232,9 +251,14 @@ cdef class Parser(object):
         int subheader_pointer_length
         int current_page_type
         bint is_little_endian
-        const uint8_t[:] (*decompress)(int result_length,
-                                       const uint8_t[:] inbuff)
+        decompress_func decompress
+        uint8_t[:] row_buffer
         object parser
+        # rows collected for decompression and unpacking on the thread pool
+        object pool
+        int num_threads
+        list batch_pages
+        list batch_rows
 
     def __init__(self, object parser):
         cdef:
@@ -253,6 +277,11 @@ cdef class Parser(object):
         self.subheader_pointer_length = self.parser._subheader_pointer_length
         self.is_little_endian = parser.byte_order == "<"
         self.column_types = np.empty(self.column_count, dtype='int64')
+        self.row_buffer = np.zeros(self.row_length, dtype=np.uint8)
+        self.pool = parser._get_pool()
+        self.num_threads = parser._num_threads
+        self.batch_pages = []
+        self.batch_rows = []
 
         # page indicators
         self.update_next_page()
@@ -292,6 +321,9 @@ cdef class Parser(object):
             done = self.readline()
             if done:
                 break
+            if len(self.batch_pages) >= self.num_threads * pages_per_thread:
+                self.process_batch()
+        self.process_batch()
 
         # update the parser
         self.parser._current_row_on_page_index = self.current_row_on_page_index
@@ -391,40 +423,51 @@ cdef class Parser(object):
                 raise ValueError("unknown page type: {typ}"
                                  .format(typ=self.current_page_type))
 
-    cdef void process_byte_array_with_data(self, int offset, int length):
+    cdef process_byte_array_with_data(self, int offset, int length):
+
+        cdef:
+            const uint8_t *source
+            int status
+
+        if self.pool is not None:
+            # defer to process_batch, keeping the page alive until then
+            page = self.parser._cached_page
+            if not self.batch_pages or self.batch_pages[-1] is not page:
+                self.batch_pages.append(page)
+            self.batch_rows.append((len(self.batch_pages) - 1, offset, length,
+                                    self.current_row_in_chunk_index))
+        else:
+            source = <const uint8_t *>self.cached_page + offset
+            if self.decompress != NULL and (length < self.row_length):
+                memset(&self.row_buffer[0], 0, self.row_length)
+                status = self.decompress(source, length, &self.row_buffer[0],
+                                         self.row_length)
+                if status < 0:
+                    raise_decompress_error(status)
+                source = &self.row_buffer[0]
+            self.unpack_row(source, self.current_row_in_chunk_index)
+
+        self.current_row_on_page_index += 1
+        self.current_row_in_chunk_index += 1
+        self.current_row_in_file_index += 1
+
+    cdef void unpack_row(self, const uint8_t *source, int current_row) nogil:
+        # copy the fields of a (decompressed) row into the chunk buffers
 
         cdef:
             Py_ssize_t j
-            int s, k, m, jb, js, current_row
+            int s, k, m, jb, js
             int64_t lngt, start, ct
-            const uint8_t[:] source
-            int64_t[:] column_types
-            int64_t[:] lengths
-            int64_t[:] offsets
-            uint8_t[:, :] byte_chunk
-            object[:, :] string_chunk
-
-        source = np.frombuffer(
-            self.cached_page[offset:offset + length], dtype=np.uint8)
-
-        if self.decompress != NULL and (length < self.row_length):
-            source = self.decompress(self.row_length, source)
-
-        current_row = self.current_row_in_chunk_index
-        column_types = self.column_types
-        lengths = self.lengths
-        offsets = self.offsets
-        byte_chunk = self.byte_chunk
-        string_chunk = self.string_chunk
-        s = 8 * self.current_row_in_chunk_index
+
+        s = 8 * current_row
         js = 0
         jb = 0
         for j in range(self.column_count):
-            lngt = lengths[j]
+            lngt = self.lengths[j]
             if lngt == 0:
                 break
-            start = offsets[j]
-            ct = column_types[j]
+            start = self.offsets[j]
+            ct = self.column_types[j]
             if ct == column_type_decimal:
                 # decimal
                 if self.is_little_endian:
@@ -432,14 +475,62 @@ cdef class Parser(object):
                 else:
                     m = s
                 for k in range(lngt):
-                    byte_chunk[jb, m + k] = source[start + k]
+                    self.byte_chunk[jb, m + k] = source[start + k]
                 jb += 1
-            elif column_types[j] == column_type_string:
-                # string
-                string_chunk[js, current_row] = np.array(source[start:(
-                    start + lngt)]).tostring().rstrip(b"\x00 ")
-                js += 1
+            elif ct == column_type_string:
+                # string, padding is stripped when the column is decoded
+                for k in range(lngt):
+                    self.string_chunk[current_row, js + k] = source[start + k]
+                js += lngt
 
-        self.current_row_on_page_index += 1
-        self.current_row_in_chunk_index += 1
-        self.current_row_in_file_index += 1
+    cdef process_batch(self):
+        # Decompress and unpack the collected rows, split in contiguous
+        # ranges over the threads of the pool.
+        cdef:
+            Py_ssize_t i, n = len(self.batch_rows)
+            int64_t[:] page_starts
+            int64_t pos = 0
+
+        if n == 0:
+            return
+
+        page_starts = np.empty(len(self.batch_pages), dtype=np.int64)
+        for i in range(len(self.batch_pages)):
+            page_starts[i] = pos
+            pos += len(self.batch_pages[i])
+        data = np.frombuffer(b''.join(self.batch_pages), dtype=np.uint8)
+
+        rows = np.array(self.batch_rows, dtype=np.int64).reshape(n, 4)
+        rows[:, 1] += np.asarray(page_starts)[rows[:, 0]]
+        self.batch_pages = []
+        self.batch_rows = []
+
+        bounds = np.linspace(0, n, min(self.num_threads, n) + 1).astype(int)
+        tasks = [(data, rows[bounds[i]:bounds[i + 1]])
+                 for i in range(len(bounds) - 1)]
+        for status in self.pool.map(self._process_rows, tasks):
+            if status < 0:
+                raise_decompress_error(status)
+
+    def _process_rows(self, task):
+        cdef:
+            const uint8_t[:] data = task[0]
+            int64_t[:, :] rows = task[1]
+            uint8_t[:] row_buffer = np.empty(self.row_length, dtype=np.uint8)
+            const uint8_t *source
+            Py_ssize_t i
+            int length, status = 0
+
+        with nogil:
+            for i in range(rows.shape[0]):
+                source = &data[rows[i, 1]]
+                length = <int>rows[i, 2]
+                if self.decompress != NULL and (length < self.row_length):
+                    memset(&row_buffer[0], 0, self.row_length)
+                    status = self.decompress(source, length, &row_buffer[0],
+                                             self.row_length)
+                    if status < 0:
+                        break
+                    source = &row_buffer[0]
+                self.unpack_row(source, <int>rows[i, 3])
+        return status
@@ -14,10 +14,12 @@ Reference for binary data compression:
   http://collaboration.cmc.ec.gc.ca/science/rpn/biblio/ddj/Website/articles/CUJ/1992/9210/ross/ross.htm
 """
 from datetime import datetime
+from multiprocessing import cpu_count
 import struct
 
 import numpy as np
 
+from pandas._libs.lib import decode_fixed_width
 from pandas.errors import EmptyDataError
 
 import pandas as pd
@@ -64,11 +66,18 @@ class SAS7BDATReader(BaseIterator):
     convert_header_text : bool, defaults to True
         If False, header text, including column names, are left as raw
         bytes.
+    use_threads : bool or int, defaults to False
+        Decompress and unpack the rows of a chunk on a pool of threads.
+        If an int, the number of threads to use; True uses the number of
+        CPUs.
+
+        .. versionadded:: 0.24.0
     """
 
     def __init__(self, path_or_buf, index=None, convert_dates=True,
                  blank_missing=True, chunksize=None, encoding=None,
-                 convert_text=True, convert_header_text=True):
+                 convert_text=True, convert_header_text=True,
+                 use_threads=False):
 
         self.index = index
         self.convert_dates = convert_dates
@@ -77,6 +86,10 @@ class SAS7BDATReader(BaseIterator):
         self.encoding = encoding
         self.convert_text = convert_text
         self.convert_header_text = convert_header_text
+        if use_threads is True:
+            use_threads = cpu_count()
+        self._num_threads = int(use_threads)
+        self._pool = None
 
         self.default_encoding = "latin-1"
         self.compression = ""
@@ -117,11 +130,23 @@ class SAS7BDATReader(BaseIterator):
         return np.asarray(self._column_types, dtype=np.dtype('S1'))
 
     def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
         try:
             self.handle.close()
         except AttributeError:
             pass
 
+    def _get_pool(self):
+        # thread pool used by the parser, None to unpack rows as they are read
+        if self._num_threads <= 1:
+            return None
+        if self._pool is None:
+            from multiprocessing.pool import ThreadPool
+            self._pool = ThreadPool(self._num_threads)
+        return self._pool
+
     def _get_properties(self):
 
         # Check magic number
@@ -618,9 +643,12 @@ class SAS7BDATReader(BaseIterator):
             nrows = m
 
         nd = self._column_types.count(b'd')
-        ns = self._column_types.count(b's')
 
-        self._string_chunk = np.empty((ns, nrows), dtype=np.object)
+        # the string columns of a row are stored next to each other
+        string_width = sum(length for length, typ in
+                           zip(self._column_data_lengths, self._column_types)
+                           if typ == b's')
+        self._string_chunk = np.zeros((nrows, string_width), dtype=np.uint8)
         self._byte_chunk = np.zeros((nd, 8 * nrows), dtype=np.uint8)
 
         self._current_row_in_chunk_index = 0
@@ -684,14 +712,14 @@ class SAS7BDATReader(BaseIterator):
                                                     origin="1960-01-01")
                 jb += 1
             elif self._column_types[j] == b's':
-                rslt[name] = self._string_chunk[js, :]
+                width = self._column_data_lengths[j]
+                encoding = None
                 if self.convert_text and (self.encoding is not None):
-                    rslt[name] = rslt[name].str.decode(
-                        self.encoding or self.default_encoding)
-                if self.blank_missing:
-                    ii = rslt[name].str.len() == 0
-                    rslt.loc[ii, name] = np.nan
-                js += 1
+                    encoding = self.encoding or self.default_encoding
+                rslt[name] = decode_fixed_width(
+                    self._string_chunk[:, js:js + width], encoding,
+                    strip_spaces=True, blank_missing=self.blank_missing)
+                js += width
             else:
                 self.close()
                 raise ValueError("unknown column type %s" %
@@ -7,7 +7,7 @@ from pandas.io.common import _stringify_path
 
 
 def read_sas(filepath_or_buffer, format=None, index=None, encoding=None,
-             chunksize=None, iterator=False):
+             chunksize=None, iterator=False, use_threads=False):
     """
     Read SAS files stored as either XPORT or SAS7BDAT format files.
 
@@ -26,6 +26,12 @@ def read_sas(filepath_or_buffer, format=None, index=None, encoding=None,
         Read file `chunksize` lines at a time, returns iterator.
     iterator : bool, defaults to False
         If True, returns an iterator for reading the file incrementally.
+    use_threads : bool or int, defaults to False
+        Decompress and unpack the rows of a chunk on a pool of threads.
+        If an int, the number of threads to use; True uses the number of
+        CPUs. Only supported for SAS7BDAT files.
+
+        .. versionadded:: 0.24.0
 
     Returns
     -------
@@ -51,6 +57,9 @@ def read_sas(filepath_or_buffer, format=None, index=None, encoding=None,
             pass
 
     if format.lower() == 'xport':
+        if use_threads:
+            raise ValueError("use_threads is only supported for sas7bdat "
+                             "files")
         from pandas.io.sas.sas_xport import XportReader
         reader = XportReader(filepath_or_buffer, index=index,
                              encoding=encoding,
@@ -59,7 +68,8 @@ def read_sas(filepath_or_buffer, format=None, index=None, encoding=None,
         from pandas.io.sas.sas7bdat import SAS7BDATReader
         reader = SAS7BDATReader(filepath_or_buffer, index=index,
                                 encoding=encoding,
-                                chunksize=chunksize)
+                                chunksize=chunksize,
+                                use_threads=use_threads)
     else:
         raise ValueError('unknown SAS format')
 
@@ -8,6 +8,7 @@ from __future__ import division, print_function
 
 from contextlib import contextmanager
 from datetime import date, datetime, time
+from functools import partial
 import re
 import warnings
 
@@ -15,17 +16,22 @@ import numpy as np
 
 import pandas._libs.lib as lib
 from pandas.compat import (
-    map, raise_with_traceback, string_types, text_type, zip)
+    PY36, map, raise_with_traceback, string_types, text_type, zip)
 
+from pandas.core.dtypes.cast import (
+    construct_1d_object_array_from_listlike, maybe_cast_to_datetime)
 from pandas.core.dtypes.common import (
-    is_datetime64tz_dtype, is_dict_like, is_list_like)
+    is_datetime64tz_dtype, is_dict_like, is_integer, is_list_like, is_number)
 from pandas.core.dtypes.dtypes import DatetimeTZDtype
 from pandas.core.dtypes.missing import isna
 
 from pandas.core.api import DataFrame, Series
 from pandas.core.base import PandasObject
+from pandas.core.reshape.concat import concat
 from pandas.core.tools.datetimes import to_datetime
 
+from pandas.io.common import _IOReport
+
 
 class SQLAlchemyRequired(ImportError):
     pass
@@ -40,6 +46,15 @@ class DatabaseError(IOError):
 
 _SQLALCHEMY_INSTALLED = None
 
+# Upper bound on the number of bound parameters in a single multi-values
+# INSERT statement when no chunksize is given. This is the default
+# SQLITE_MAX_VARIABLE_NUMBER, the most restrictive of the common drivers.
+_MAX_INSERT_PARAMS = 999
+
+# Number of rows requested per fetchmany call when a full result set is
+# read without chunksize
+_FETCH_BATCH_SIZE = 10000
+
 
 def _is_sqlalchemy_connectable(con):
     global _SQLALCHEMY_INSTALLED
@@ -131,12 +146,256 @@ def _parse_date_columns(data_frame, parse_dates):
     return data_frame
 
 
+def _fetch_batches(fetchmany, batchsize=None):
+    """Yield non-empty batches of rows from a ``fetchmany`` callable"""
+    if batchsize is None:
+        batchsize = _FETCH_BATCH_SIZE
+    while True:
+        data = fetchmany(batchsize)
+        if not data:
+            break
+        yield data
+
+
+def _column_kinds(description, dbapi):
+    """
+    Kind of the buffer of each column of a result set, from the DBAPI type
+    codes of ``cursor.description``: 'number', 'datetime' or None for a
+    list of objects. Returns None if the type codes are not available.
+    """
+    if not description or dbapi is None:
+        return None
+
+    type_objects = [(kind, getattr(dbapi, name, None))
+                    for kind, name in [('number', 'NUMBER'),
+                                       ('datetime', 'DATETIME')]]
+    kinds = []
+    for desc in description:
+        kind = None
+        for candidate, type_object in type_objects:
+            if type_object is None or desc[1] is None:
+                continue
+            try:
+                if desc[1] == type_object:
+                    kind = candidate
+                    break
+            except Exception:
+                pass
+        kinds.append(kind)
+    return kinds
+
+
+def _result_kinds(result):
+    """Buffer kinds of the columns of a SQLAlchemy result proxy"""
+    try:
+        description = result.cursor.description
+        dbapi = result.context.dialect.dbapi
+    except AttributeError:
+        return None
+    return _column_kinds(description, dbapi)
+
+
+class _TypedColumn(object):
+    """
+    Preallocated numpy buffer for a numeric or datetime column, grown by
+    doubling its capacity. Each batch is converted like a whole column of
+    objects would be; the buffer is promoted from int64 to float64 for
+    missing values or floats.
+    """
+
+    _dtypes = {'number': (np.dtype(np.int64), np.dtype(np.float64),
+                          np.dtype(np.bool_)),
+               'datetime': (np.dtype('M8[ns]'),)}
+
+    def __init__(self, kind, capacity=0, coerce_float=True):
+        self.kind = kind
+        self.capacity = capacity
+        self.coerce_float = coerce_float
+        # None until the first batch with non-missing values
+        self.values = None
+        self.nrows = 0
+
+    def _reserve(self, nrows):
+        """Make room for ``nrows`` more values"""
+        if len(self.values) < self.nrows + nrows:
+            capacity = max(2 * len(self.values), self.nrows + nrows)
+            values = np.empty(capacity, dtype=self.values.dtype)
+            values[:self.nrows] = self.values[:self.nrows]
+            self.values = values
+
+    def _promote(self):
+        self.values = self.values.astype(np.float64)
+
+    def _fill_missing(self, start, stop):
+        if self.kind == 'datetime':
+            self.values[start:stop] = np.datetime64('NaT')
+        else:
+            self.values[start:stop] = np.nan
+
+    def append(self, values):
+        """
+        Append a batch of values. Returns False, leaving the column
+        unchanged, if the values do not fit a numpy buffer.
+        """
+        arr = construct_1d_object_array_from_listlike(values)
+        arr = lib.maybe_convert_objects(arr, try_float=self.coerce_float)
+        if self.kind == 'datetime':
+            arr = maybe_cast_to_datetime(arr, None)
+        n = len(arr)
+
+        if arr.dtype == np.object_:
+            # only a batch of missing values fits
+            if not isna(arr).all():
+                return False
+            if self.values is None:
+                self.nrows += n
+                return True
+            if self.values.dtype.kind == 'b':
+                return False
+            if self.values.dtype.kind == 'i':
+                self._promote()
+            self._reserve(n)
+            self._fill_missing(self.nrows, self.nrows + n)
+            self.nrows += n
+            return True
+
+        dtype = arr.dtype
+        if dtype not in self._dtypes[self.kind]:
+            return False
+        if self.values is None:
+            if self.nrows and dtype.kind == 'b':
+                # missing values and booleans make an object column
+                return False
+            if self.nrows and dtype.kind == 'i':
+                dtype = np.dtype(np.float64)
+            self.values = np.empty(max(self.capacity, self.nrows + n),
+                                   dtype=dtype)
+            self._fill_missing(0, self.nrows)
+        elif self.values.dtype != dtype:
+            if {self.values.dtype.kind, dtype.kind} != {'i', 'f'}:
+                return False
+            if self.values.dtype.kind == 'i':
+                self._promote()
+
+        self._reserve(n)
+        self.values[self.nrows:self.nrows + n] = arr
+        self.nrows += n
+        return True
+
+    def to_list(self):
+        """The values as a list of objects, when falling back to a list"""
+        if self.values is None:
+            return [None] * self.nrows
+        values = self.values[:self.nrows]
+        if self.kind == 'datetime':
+            return list(Series(values).astype(object))
+        return values.tolist()
+
+    def to_array(self):
+        """The values, releasing the spare capacity of the buffer"""
+        if self.values is None:
+            return construct_1d_object_array_from_listlike(
+                [None] * self.nrows)
+        values, self.values = self.values, None
+        if len(values) != self.nrows:
+            values.resize(self.nrows, refcheck=False)
+        return values
+
+
+class _ColumnBuffers(object):
+    """
+    Buffers, one per column, that batches of fetched rows are appended to.
+
+    Only a single batch of row tuples needs to be alive at any time and no
+    2-D object array of the whole result set is built. Given the ``kinds``
+    of the columns (see :func:`_column_kinds`), numeric and datetime columns
+    are stored in preallocated numpy buffers as the batches arrive, falling
+    back to a list of objects when the values do not fit one. The other
+    columns are collected as lists and converted to their final dtype once,
+    releasing each list before the next column is converted.
+    """
+
+    def __init__(self, columns, kinds=None, coerce_float=True,
+                 capacity=None):
+        if kinds is None:
+            kinds = [None] * len(columns)
+        self.columns = columns
+        self.kinds = kinds
+        self.coerce_float = coerce_float
+        self.capacity = capacity
+        self.buffers = self._new_buffers()
+        self.nrows = 0
+
+    def _new_buffers(self):
+        return [[] if kind is None else
+                _TypedColumn(kind, self.capacity or 0, self.coerce_float)
+                for kind in self.kinds]
+
+    def append(self, rows):
+        buffers = self.buffers
+        for i, values in enumerate(zip(*rows)):
+            buf = buffers[i]
+            if isinstance(buf, _TypedColumn):
+                if buf.append(values):
+                    continue
+                buf = buffers[i] = buf.to_list()
+            buf.extend(values)
+        self.nrows += len(rows)
+
+    def to_frame(self):
+        if not self.nrows:
+            return DataFrame.from_records([], columns=self.columns,
+                                          coerce_float=self.coerce_float)
+
+        buffers, self.buffers = self.buffers, self._new_buffers()
+        self.nrows = 0
+
+        arrays = []
+        for i in range(len(buffers)):
+            buf, buffers[i] = buffers[i], None
+            if isinstance(buf, _TypedColumn):
+                arrays.append(buf.to_array())
+                continue
+            values = construct_1d_object_array_from_listlike(buf)
+            del buf
+            values = lib.maybe_convert_objects(values,
+                                               try_float=self.coerce_float)
+            arrays.append(maybe_cast_to_datetime(values, None))
+
+        # each array becomes a block of its own, stacking the columns of a
+        # dtype would briefly hold two copies of them
+        return DataFrame._from_arrays(arrays, columns=self.columns,
+                                      index=None, consolidate=False)
+
+
+def _records_to_frame(batches, columns, coerce_float=True, kinds=None):
+    """
+    Build a DataFrame from batches of fetched rows. ``kinds`` are the kinds
+    of the column buffers, see :func:`_column_kinds`.
+    """
+    buffers = _ColumnBuffers(columns, kinds=kinds, coerce_float=coerce_float,
+                             capacity=_FETCH_BATCH_SIZE)
+    for data in batches:
+        buffers.append(data)
+    return buffers.to_frame()
+
+
 def _wrap_result(data, columns, index_col=None, coerce_float=True,
-                 parse_dates=None):
-    """Wrap result set of query in a DataFrame."""
+                 parse_dates=None, kinds=None):
+    """
+    Wrap result set of query in a DataFrame.
+
+    ``data`` is an iterable of batches of rows, as returned by
+    ``fetchmany``.
+    """
+
+    frame = _records_to_frame(data, columns, coerce_float=coerce_float,
+                              kinds=kinds)
+    return _wrap_frame(frame, index_col=index_col, parse_dates=parse_dates)
 
-    frame = DataFrame.from_records(data, columns=columns,
-                                   coerce_float=coerce_float)
+
+def _wrap_frame(frame, index_col=None, parse_dates=None):
+    """Parse the dates and set the index of a frame read from a query."""
 
     _parse_date_columns(frame, parse_dates)
 
@@ -146,6 +405,52 @@ def _wrap_result(data, columns, index_col=None, coerce_float=True,
     return frame
 
 
+def _get_partition_bounds(lower_bound, upper_bound, num_partitions):
+    """
+    Split the range between the bounds into ``num_partitions`` strides.
+
+    Returns a list of ``(lower, upper)`` limits, one per partition. The
+    first partition has no lower limit and the last one no upper limit, so
+    the bounds only decide the stride and no rows are filtered out.
+    """
+    if not is_integer(num_partitions) or num_partitions < 1:
+        raise ValueError("num_partitions must be a positive integer")
+    if not (is_number(lower_bound) and is_number(upper_bound)):
+        raise ValueError("lower_bound and upper_bound must be numbers when "
+                         "partition_column is given")
+    if lower_bound >= upper_bound:
+        raise ValueError("lower_bound must be smaller than upper_bound")
+
+    if is_integer(lower_bound) and is_integer(upper_bound):
+        cuts = [lower_bound + (upper_bound - lower_bound) * i // num_partitions
+                for i in range(1, num_partitions)]
+    else:
+        step = (upper_bound - lower_bound) / num_partitions
+        cuts = [lower_bound + step * i for i in range(1, num_partitions)]
+
+    # drop empty partitions when the range is narrower than num_partitions
+    limits = [None] + sorted(set(cuts)) + [None]
+    return list(zip(limits[:-1], limits[1:]))
+
+
+def _get_partition_predicates(column, bounds):
+    """Return the SQLAlchemy where clause of each partition"""
+    from sqlalchemy import and_, or_
+
+    predicates = []
+    for lower, upper in bounds:
+        if lower is None and upper is None:
+            predicates.append(None)
+        elif lower is None:
+            # rows with NULL in the partition column go to the first partition
+            predicates.append(or_(column < upper, column.is_(None)))
+        elif upper is None:
+            predicates.append(column >= lower)
+        else:
+            predicates.append(and_(column >= lower, column < upper))
+    return predicates
+
+
 def execute(sql, con, cur=None, params=None):
     """
     Execute the given SQL query using the provided connection object.
@@ -179,7 +484,8 @@ def execute(sql, con, cur=None, params=None):
 
 def read_sql_table(table_name, con, schema=None, index_col=None,
                    coerce_float=True, parse_dates=None, columns=None,
-                   chunksize=None):
+                   chunksize=None, partition_column=None, lower_bound=None,
+                   upper_bound=None, num_partitions=None):
     """Read SQL database table into a DataFrame.
 
     Given a table name and a SQLAlchemy connectable, returns a DataFrame.
@@ -189,8 +495,10 @@ def read_sql_table(table_name, con, schema=None, index_col=None,
     ----------
     table_name : string
         Name of SQL table in database.
-    con : SQLAlchemy connectable (or database string URI)
-        SQLite DBAPI connection mode not supported.
+    con : SQLAlchemy connectable (or database string URI) or SQLDatabase
+        SQLite DBAPI connection mode not supported. Passing a
+        :class:`pandas.io.sql.SQLDatabase` reuses the table metadata it has
+        already reflected.
     schema : string, default None
         Name of SQL schema in database to query (if database flavor
         supports this). Uses default schema if None (default).
@@ -213,6 +521,26 @@ def read_sql_table(table_name, con, schema=None, index_col=None,
     chunksize : int, default None
         If specified, returns an iterator where `chunksize` is the number of
         rows to include in each chunk.
+    partition_column : string, default None
+        Name of a numeric column used to split the read into
+        `num_partitions` range queries, which are run concurrently over the
+        connection pool when `con` is an Engine and concatenated. Cannot be
+        combined with `chunksize`.
+
+        .. versionadded:: 0.24.0
+    lower_bound, upper_bound : int or float, default None
+        Used together with `partition_column` to compute the stride of the
+        partitions. The bounds do not filter rows: values below
+        `lower_bound` (and NULLs) go to the first partition and values
+        above `upper_bound` to the last one.
+
+        .. versionadded:: 0.24.0
+    num_partitions : int, default None
+        Number of partitions when `partition_column` is given. At most as
+        many of them are read at the same time as the pool of the Engine
+        can hand out connections (``pool_size + max_overflow``).
+
+        .. versionadded:: 0.24.0
 
     Returns
     -------
@@ -229,30 +557,37 @@ def read_sql_table(table_name, con, schema=None, index_col=None,
     """
 
     con = _engine_builder(con)
-    if not _is_sqlalchemy_connectable(con):
+    if isinstance(con, SQLDatabase):
+        pandas_sql = con
+    elif not _is_sqlalchemy_connectable(con):
         raise NotImplementedError("read_sql_table only supported for "
                                   "SQLAlchemy connectable.")
-    import sqlalchemy
-    from sqlalchemy.schema import MetaData
-    meta = MetaData(con, schema=schema)
-    try:
-        meta.reflect(only=[table_name], views=True)
-    except sqlalchemy.exc.InvalidRequestError:
-        raise ValueError("Table %s not found" % table_name)
+    else:
+        from sqlalchemy.schema import MetaData
+        meta = MetaData(con, schema=schema)
+        pandas_sql = SQLDatabase(con, meta=meta)
 
-    pandas_sql = SQLDatabase(con, meta=meta)
-    table = pandas_sql.read_table(
-        table_name, index_col=index_col, coerce_float=coerce_float,
-        parse_dates=parse_dates, columns=columns, chunksize=chunksize)
+    if pandas_sql.get_table(table_name, schema) is None:
+        raise ValueError("Table %s not found" % table_name)
 
-    if table is not None:
-        return table
-    else:
-        raise ValueError("Table %s not found" % table_name, con)
+    with _IOReport('read_sql_table', table_name, 'r',
+                   local_path=False) as report:
+        table = pandas_sql.read_table(
+            table_name, index_col=index_col, coerce_float=coerce_float,
+            parse_dates=parse_dates, columns=columns, schema=schema,
+            chunksize=chunksize, partition_column=partition_column,
+            lower_bound=lower_bound, upper_bound=upper_bound,
+            num_partitions=num_partitions)
+
+        if table is not None:
+            return report(table)
+        else:
+            raise ValueError("Table %s not found" % table_name, con)
 
 
 def read_sql_query(sql, con, index_col=None, coerce_float=True, params=None,
-                   parse_dates=None, chunksize=None):
+                   parse_dates=None, chunksize=None, partition_column=None,
+                   lower_bound=None, upper_bound=None, num_partitions=None):
     """Read SQL query into a DataFrame.
 
     Returns a DataFrame corresponding to the result set of the query
@@ -291,6 +626,28 @@ def read_sql_query(sql, con, index_col=None, coerce_float=True, params=None,
     chunksize : int, default None
         If specified, return an iterator where `chunksize` is the number of
         rows to include in each chunk.
+    partition_column : string, default None
+        Name of a numeric column used to split the read into
+        `num_partitions` range queries, which are run concurrently over the
+        connection pool when `con` is an Engine and concatenated. The query
+        is wrapped in a sub-select, so `partition_column` must be one of its
+        result columns. Requires an SQLAlchemy connectable. Cannot be
+        combined with `chunksize`.
+
+        .. versionadded:: 0.24.0
+    lower_bound, upper_bound : int or float, default None
+        Used together with `partition_column` to compute the stride of the
+        partitions. The bounds do not filter rows: values below
+        `lower_bound` (and NULLs) go to the first partition and values
+        above `upper_bound` to the last one.
+
+        .. versionadded:: 0.24.0
+    num_partitions : int, default None
+        Number of partitions when `partition_column` is given. At most as
+        many of them are read at the same time as the pool of the Engine
+        can hand out connections (``pool_size + max_overflow``).
+
+        .. versionadded:: 0.24.0
 
     Returns
     -------
@@ -307,9 +664,20 @@ def read_sql_query(sql, con, index_col=None, coerce_float=True, params=None,
     read_sql
     """
     pandas_sql = pandasSQL_builder(con)
-    return pandas_sql.read_query(
-        sql, index_col=index_col, params=params, coerce_float=coerce_float,
-        parse_dates=parse_dates, chunksize=chunksize)
+    if partition_column is not None:
+        if not isinstance(pandas_sql, SQLDatabase):
+            raise NotImplementedError("partitioned reads are only supported "
+                                      "for SQLAlchemy connectables")
+        kwargs = dict(partition_column=partition_column,
+                      lower_bound=lower_bound, upper_bound=upper_bound,
+                      num_partitions=num_partitions)
+    else:
+        kwargs = {}
+    with _IOReport('read_sql_query', sql, 'r', local_path=False) as report:
+        return report(pandas_sql.read_query(
+            sql, index_col=index_col, params=params,
+            coerce_float=coerce_float, parse_dates=parse_dates,
+            chunksize=chunksize, **kwargs))
 
 
 def read_sql(sql, con, index_col=None, coerce_float=True, params=None,
@@ -371,31 +739,32 @@ def read_sql(sql, con, index_col=None, coerce_float=True, params=None,
     """
     pandas_sql = pandasSQL_builder(con)
 
-    if isinstance(pandas_sql, SQLiteDatabase):
-        return pandas_sql.read_query(
-            sql, index_col=index_col, params=params,
-            coerce_float=coerce_float, parse_dates=parse_dates,
-            chunksize=chunksize)
+    with _IOReport('read_sql', sql, 'r', local_path=False) as report:
+        if isinstance(pandas_sql, SQLiteDatabase):
+            return report(pandas_sql.read_query(
+                sql, index_col=index_col, params=params,
+                coerce_float=coerce_float, parse_dates=parse_dates,
+                chunksize=chunksize))
 
-    try:
-        _is_table_name = pandas_sql.has_table(sql)
-    except (ImportError, AttributeError):
-        _is_table_name = False
-
-    if _is_table_name:
-        pandas_sql.meta.reflect(only=[sql])
-        return pandas_sql.read_table(
-            sql, index_col=index_col, coerce_float=coerce_float,
-            parse_dates=parse_dates, columns=columns, chunksize=chunksize)
-    else:
-        return pandas_sql.read_query(
-            sql, index_col=index_col, params=params,
-            coerce_float=coerce_float, parse_dates=parse_dates,
-            chunksize=chunksize)
+        try:
+            _is_table_name = pandas_sql.has_table(sql)
+        except (ImportError, AttributeError):
+            _is_table_name = False
+
+        if _is_table_name:
+            return report(pandas_sql.read_table(
+                sql, index_col=index_col, coerce_float=coerce_float,
+                parse_dates=parse_dates, columns=columns,
+                chunksize=chunksize))
+        else:
+            return report(pandas_sql.read_query(
+                sql, index_col=index_col, params=params,
+                coerce_float=coerce_float, parse_dates=parse_dates,
+                chunksize=chunksize))
 
 
 def to_sql(frame, name, con, schema=None, if_exists='fail', index=True,
-           index_label=None, chunksize=None, dtype=None):
+           index_label=None, chunksize=None, dtype=None, method=None):
     """
     Write records stored in a DataFrame to a SQL database.
 
@@ -429,6 +798,19 @@ def to_sql(frame, name, con, schema=None, if_exists='fail', index=True,
         Optional specifying the datatype for columns. The SQL type should
         be a SQLAlchemy type, or a string for sqlite3 fallback connection.
         If all columns are of the same type, one single value can be used.
+    method : {None, 'multi', callable}, default None
+        Controls the SQL insertion clause used:
+
+        - None : Uses standard SQL ``INSERT`` clause (one per row).
+        - 'multi': Pass multiple values in a single ``INSERT`` clause.
+          If `chunksize` is None, the rows are batched so that a single
+          statement stays within the bound parameter limit of the driver.
+        - callable with signature ``(pd_table, conn, keys, data_iter)``.
+
+        Details and a sample callable implementation can be found in the
+        section :ref:`insert method <io.sql.method>`.
+
+        .. versionadded:: 0.24.0
     """
     if if_exists not in ('fail', 'replace', 'append'):
         raise ValueError("'{0}' is not valid for if_exists".format(if_exists))
@@ -441,9 +823,11 @@ def to_sql(frame, name, con, schema=None, if_exists='fail', index=True,
         raise NotImplementedError("'frame' argument should be either a "
                                   "Series or a DataFrame")
 
-    pandas_sql.to_sql(frame, name, if_exists=if_exists, index=index,
-                      index_label=index_label, schema=schema,
-                      chunksize=chunksize, dtype=dtype)
+    with _IOReport('to_sql', name, 'w', local_path=False) as report:
+        report(frame)
+        pandas_sql.to_sql(frame, name, if_exists=if_exists, index=index,
+                          index_label=index_label, schema=schema,
+                          chunksize=chunksize, dtype=dtype, method=method)
 
 
 def has_table(table_name, con, schema=None):
@@ -500,7 +884,10 @@ def pandasSQL_builder(con, schema=None, meta=None,
     # When support for DBAPI connections is removed,
     # is_cursor should not be necessary.
     con = _engine_builder(con)
-    if _is_sqlalchemy_connectable(con):
+    if isinstance(con, PandasSQL):
+        # reuse the object, and with it the metadata it has cached
+        return con
+    elif _is_sqlalchemy_connectable(con):
         return SQLDatabase(con, schema=schema, meta=meta)
     elif isinstance(con, string_types):
         raise ImportError("Using URI string without sqlalchemy installed.")
@@ -613,10 +1000,50 @@ class SQLTable(PandasObject):
         return column_names, data_list
 
     def _execute_insert(self, conn, keys, data_iter):
+        """Execute SQL statement inserting data
+
+        Parameters
+        ----------
+        conn : sqlalchemy.engine.Engine or sqlalchemy.engine.Connection
+        keys : list of str
+           Column names
+        data_iter : generator of list
+           Each item contains a list of values to be inserted
+        """
         data = [dict(zip(keys, row)) for row in data_iter]
         conn.execute(self.insert_statement(), data)
 
-    def insert(self, chunksize=None):
+    def _execute_insert_multi(self, conn, keys, data_iter):
+        """Alternative to _execute_insert for DBs support multivalue INSERT.
+
+        Note: multi-value insert is usually faster for analytics DBs
+        and tables containing a few columns
+        but performance degrades quickly with increase of columns.
+        """
+        data = [dict(zip(keys, row)) for row in data_iter]
+        conn.execute(self.table.insert(data))
+
+    def insert(self, chunksize=None, method=None):
+
+        # set insert method
+        if method is None:
+            exec_insert = self._execute_insert
+        elif method == 'multi':
+            exec_insert = self._execute_insert_multi
+        elif callable(method):
+            exec_insert = partial(method, self)
+        else:
+            raise ValueError('Invalid parameter `method`: {}'.format(method))
+
+        if len(self.frame) == 0:
+            return
+
+        with self.pd_sql.run_transaction() as conn:
+            for keys, chunk_iter in self.insert_chunks(chunksize, method):
+                exec_insert(conn, keys, chunk_iter)
+
+    def insert_chunks(self, chunksize=None, method=None):
+        """Yield the column names and an iterator of rows for each chunk"""
         keys, data_list = self.insert_data()
 
         nrows = len(self.frame)
@@ -625,21 +1052,24 @@ class SQLTable(PandasObject):
             return
 
         if chunksize is None:
-            chunksize = nrows
+            if method == 'multi':
+                # keep each statement within the bound parameter limit
+                chunksize = max(_MAX_INSERT_PARAMS // len(keys), 1)
+            else:
+                chunksize = nrows
         elif chunksize == 0:
             raise ValueError('chunksize argument should be non-zero')
 
         chunks = int(nrows / chunksize) + 1
 
-        with self.pd_sql.run_transaction() as conn:
-            for i in range(chunks):
-                start_i = i * chunksize
-                end_i = min((i + 1) * chunksize, nrows)
-                if start_i >= end_i:
-                    break
+        for i in range(chunks):
+            start_i = i * chunksize
+            end_i = min((i + 1) * chunksize, nrows)
+            if start_i >= end_i:
+                break
 
-                chunk_iter = zip(*[arr[start_i:end_i] for arr in data_list])
-                self._execute_insert(conn, keys, chunk_iter)
+            chunk_iter = zip(*[arr[start_i:end_i] for arr in data_list])
+            yield keys, chunk_iter
 
     def _query_iterator(self, result, chunksize, columns, coerce_float=True,
                         parse_dates=None):
@@ -650,8 +1080,8 @@ class SQLTable(PandasObject):
             if not data:
                 break
             else:
-                self.frame = DataFrame.from_records(
-                    data, columns=columns, coerce_float=coerce_float)
+                self.frame = _records_to_frame(
+                    [data], columns, coerce_float=coerce_float)
 
                 self._harmonize_columns(parse_dates=parse_dates)
 
@@ -661,7 +1091,7 @@ class SQLTable(PandasObject):
                 yield self.frame
 
     def read(self, coerce_float=True, parse_dates=None, columns=None,
-             chunksize=None):
+             chunksize=None, where=None):
 
         if columns is not None and len(columns) > 0:
             from sqlalchemy import select
@@ -672,6 +1102,9 @@ class SQLTable(PandasObject):
         else:
             sql_select = self.table.select()
 
+        if where is not None:
+            sql_select = sql_select.where(where)
+
         result = self.pd_sql.execute(sql_select)
         column_names = result.keys()
 
@@ -680,9 +1113,9 @@ class SQLTable(PandasObject):
                                         coerce_float=coerce_float,
                                         parse_dates=parse_dates)
         else:
-            data = result.fetchall()
-            self.frame = DataFrame.from_records(
-                data, columns=column_names, coerce_float=coerce_float)
+            self.frame = _records_to_frame(
+                _fetch_batches(result.fetchmany), column_names,
+                coerce_float=coerce_float, kinds=_result_kinds(result))
 
             self._harmonize_columns(parse_dates=parse_dates)
 
@@ -938,6 +1371,14 @@ class SQLDatabase(PandasSQL):
         created. This allows to specify database flavor specific
         arguments in the MetaData object.
 
+    Notes
+    -----
+    Tables are reflected once and then kept in ``meta``, which serves as a
+    cache for :meth:`has_table`, :meth:`get_table` and the reads and writes
+    built on them. Tables dropped or created through this object update the
+    cache; after changing the schema through another connection, call
+    :meth:`invalidate_cache`.
+
     """
 
     def __init__(self, engine, schema=None, meta=None):
@@ -960,9 +1401,64 @@ class SQLDatabase(PandasSQL):
         """Simple passthrough to SQLAlchemy connectable"""
         return self.connectable.execute(*args, **kwargs)
 
+    def _can_read_concurrently(self):
+        """
+        Whether queries can be run from several threads: this needs an
+        Engine handing out pooled connections (a Connection cannot be
+        shared between threads) and a database that every connection sees,
+        which excludes in-memory SQLite.
+        """
+        import sqlalchemy
+        engine = self.connectable
+        if not isinstance(engine, sqlalchemy.engine.Engine):
+            return False
+        if engine.dialect.name == 'sqlite':
+            return engine.url.database not in (None, '', ':memory:')
+        return True
+
+    def _max_workers(self, num_partitions):
+        """
+        Number of threads reading the partitions: at most as many as the
+        pool of the Engine can hand out connections, so that no thread
+        waits for a connection until the pool times out.
+        """
+        pool = self.connectable.pool
+        try:
+            limit = pool.size() + pool._max_overflow
+        except (AttributeError, TypeError):
+            # the pool does not limit the number of connections
+            return num_partitions
+        if pool._max_overflow < 0:
+            # unlimited overflow
+            return num_partitions
+        return max(1, min(num_partitions, limit))
+
+    def _read_partitions(self, read_partition, predicates, ignore_index):
+        """
+        Call ``read_partition`` with the where clause of every partition
+        and concatenate the resulting frames in partition order.
+        """
+        if len(predicates) > 1 and self._can_read_concurrently():
+            from multiprocessing.pool import ThreadPool
+            pool = ThreadPool(self._max_workers(len(predicates)))
+            try:
+                frames = pool.map(read_partition, predicates)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            frames = [read_partition(where) for where in predicates]
+
+        # empty partitions have object columns, which would upcast the rest
+        frames = [frame for frame in frames if len(frame)] or frames[:1]
+        if len(frames) == 1:
+            return frames[0]
+        return concat(frames, ignore_index=ignore_index)
+
     def read_table(self, table_name, index_col=None, coerce_float=True,
                    parse_dates=None, columns=None, schema=None,
-                   chunksize=None):
+                   chunksize=None, partition_column=None, lower_bound=None,
+                   upper_bound=None, num_partitions=None):
         """Read SQL database table into a DataFrame.
 
         Parameters
@@ -993,6 +1489,20 @@ class SQLDatabase(PandasSQL):
         chunksize : int, default None
             If specified, return an iterator where `chunksize` is the number
             of rows to include in each chunk.
+        partition_column : string, default None
+            Numeric column used to split the read into `num_partitions`
+            range queries that are run concurrently and concatenated.
+
+            .. versionadded:: 0.24.0
+        lower_bound, upper_bound : int or float, default None
+            Bounds used to compute the stride of the partitions; rows
+            outside of them are read by the first and last partition.
+
+            .. versionadded:: 0.24.0
+        num_partitions : int, default None
+            Number of partitions when `partition_column` is given.
+
+            .. versionadded:: 0.24.0
 
         Returns
         -------
@@ -1005,9 +1515,29 @@ class SQLDatabase(PandasSQL):
 
         """
         table = SQLTable(table_name, self, index=index_col, schema=schema)
-        return table.read(coerce_float=coerce_float,
-                          parse_dates=parse_dates, columns=columns,
-                          chunksize=chunksize)
+        if partition_column is None:
+            return table.read(coerce_float=coerce_float,
+                              parse_dates=parse_dates, columns=columns,
+                              chunksize=chunksize)
+
+        if chunksize is not None:
+            raise ValueError("chunksize cannot be combined with "
+                             "partition_column")
+        bounds = _get_partition_bounds(lower_bound, upper_bound,
+                                       num_partitions)
+        predicates = _get_partition_predicates(
+            table.table.c[partition_column], bounds)
+
+        def read_partition(where):
+            # SQLTable.read stores the frame on the table, so every partition
+            # needs its own instance
+            part = SQLTable(table_name, self, index=index_col, schema=schema)
+            return part.read(coerce_float=coerce_float,
+                             parse_dates=parse_dates, columns=columns,
+                             where=where)
+
+        return self._read_partitions(read_partition, predicates,
+                                     ignore_index=index_col is None)
 
     @staticmethod
     def _query_iterator(result, chunksize, columns, index_col=None,
@@ -1019,12 +1549,14 @@ class SQLDatabase(PandasSQL):
             if not data:
                 break
             else:
-                yield _wrap_result(data, columns, index_col=index_col,
+                yield _wrap_result([data], columns, index_col=index_col,
                                    coerce_float=coerce_float,
                                    parse_dates=parse_dates)
 
     def read_query(self, sql, index_col=None, coerce_float=True,
-                   parse_dates=None, params=None, chunksize=None):
+                   parse_dates=None, params=None, chunksize=None,
+                   partition_column=None, lower_bound=None, upper_bound=None,
+                   num_partitions=None):
         """Read SQL query into a DataFrame.
 
         Parameters
@@ -1054,6 +1586,20 @@ class SQLDatabase(PandasSQL):
         chunksize : int, default None
             If specified, return an iterator where `chunksize` is the number
             of rows to include in each chunk.
+        partition_column : string, default None
+            Numeric column used to split the read into `num_partitions`
+            range queries that are run concurrently and concatenated.
+
+            .. versionadded:: 0.24.0
+        lower_bound, upper_bound : int or float, default None
+            Bounds used to compute the stride of the partitions; rows
+            outside of them are read by the first and last partition.
+
+            .. versionadded:: 0.24.0
+        num_partitions : int, default None
+            Number of partitions when `partition_column` is given.
+
+            .. versionadded:: 0.24.0
 
         Returns
         -------
@@ -1065,6 +1611,13 @@ class SQLDatabase(PandasSQL):
         read_sql
 
         """
+        if partition_column is not None:
+            return self._read_query_partitioned(
+                sql, partition_column, lower_bound, upper_bound,
+                num_partitions, index_col=index_col,
+                coerce_float=coerce_float, parse_dates=parse_dates,
+                params=params, chunksize=chunksize)
+
         args = _convert_params(sql, params)
 
         result = self.execute(*args)
@@ -1076,16 +1629,66 @@ class SQLDatabase(PandasSQL):
                                         coerce_float=coerce_float,
                                         parse_dates=parse_dates)
         else:
-            data = result.fetchall()
-            frame = _wrap_result(data, columns, index_col=index_col,
+            frame = _wrap_result(_fetch_batches(result.fetchmany), columns,
+                                 index_col=index_col,
                                  coerce_float=coerce_float,
-                                 parse_dates=parse_dates)
+                                 parse_dates=parse_dates,
+                                 kinds=_result_kinds(result))
             return frame
 
     read_sql = read_query
 
+    def _read_query_partitioned(self, sql, partition_column, lower_bound,
+                                upper_bound, num_partitions, index_col=None,
+                                coerce_float=True, parse_dates=None,
+                                params=None, chunksize=None):
+        """
+        Read the query as range partitions of ``partition_column``, by
+        wrapping it in a sub-select filtered on that column.
+        """
+        from sqlalchemy import select
+        from sqlalchemy.sql import column
+
+        if chunksize is not None:
+            raise ValueError("chunksize cannot be combined with "
+                             "partition_column")
+        bounds = _get_partition_bounds(lower_bound, upper_bound,
+                                       num_partitions)
+
+        if isinstance(sql, string_types):
+            dialect = self.connectable.dialect
+            predicates = _get_partition_predicates(column(partition_column),
+                                                   bounds)
+            queries = []
+            for where in predicates:
+                if where is None:
+                    queries.append(sql)
+                    continue
+                # render the bounds inline, so the driver specific
+                # parameters of the query are left untouched
+                where = where.compile(dialect=dialect,
+                                      compile_kwargs={'literal_binds': True})
+                queries.append('SELECT * FROM ({sql}) pandas_partition '
+                               'WHERE {where}'.format(sql=sql, where=where))
+        else:
+            subquery = sql.alias('pandas_partition')
+            predicates = _get_partition_predicates(
+                subquery.c[partition_column], bounds)
+            queries = [select([subquery]).where(where)
+                       if where is not None else sql
+                       for where in predicates]
+
+        def read_partition(query):
+            return self.read_query(query, index_col=index_col,
+                                   coerce_float=coerce_float,
+                                   parse_dates=parse_dates, params=params)
+
+        return self._read_partitions(read_partition, queries,
+                                     ignore_index=index_col is None)
+
     def to_sql(self, frame, name, if_exists='fail', index=True,
-               index_label=None, schema=None, chunksize=None, dtype=None):
+               index_label=None, schema=None, chunksize=None, dtype=None,
+               method=None):
         """
         Write records stored in a DataFrame to a SQL database.
 
@@ -1115,6 +1718,17 @@ class SQLDatabase(PandasSQL):
             Optional specifying the datatype for columns. The SQL type should
             be a SQLAlchemy type. If all columns are of the same type, one
             single value can be used.
+        method : {None, 'multi', callable}, default None
+            Controls the SQL insertion clause used:
+
+            * None : Uses standard SQL ``INSERT`` clause (one per row).
+            * 'multi': Pass multiple values in a single ``INSERT`` clause.
+            * callable with signature ``(pd_table, conn, keys, data_iter)``.
+
+            Details and a sample callable implementation can be found in the
+            section :ref:`insert method <io.sql.method>`.
+
+            .. versionadded:: 0.24.0
 
         """
         if dtype and not is_dict_like(dtype):
@@ -1127,12 +1741,15 @@ class SQLDatabase(PandasSQL):
                     raise ValueError('The type of %s is not a SQLAlchemy '
                                      'type ' % col)
 
+        # a cached table has already been checked for case sensitivity
+        cached = self._get_cached_table(name, schema) is not None
+
         table = SQLTable(name, self, frame=frame, index=index,
                          if_exists=if_exists, index_label=index_label,
                          schema=schema, dtype=dtype)
         table.create()
-        table.insert(chunksize)
-        if (not name.isdigit() and not name.islower()):
+        table.insert(chunksize, method=method)
+        if (not cached and not name.isdigit() and not name.islower()):
             # check for potentially case sensitivity issues (GH7815)
             # Only check when name is not a number and name is not lower case
             engine = self.connectable.engine
@@ -1154,7 +1771,16 @@ class SQLDatabase(PandasSQL):
     def tables(self):
         return self.meta.tables
 
+    def _get_cached_table(self, table_name, schema=None):
+        schema = schema or self.meta.schema
+        if schema:
+            return self.meta.tables.get('.'.join([schema, table_name]))
+        else:
+            return self.meta.tables.get(table_name)
+
     def has_table(self, name, schema=None):
+        if self._get_cached_table(name, schema) is not None:
+            return True
         return self.connectable.run_callable(
             self.connectable.dialect.has_table,
             name,
@@ -1162,11 +1788,21 @@ class SQLDatabase(PandasSQL):
         )
 
     def get_table(self, table_name, schema=None):
+        """
+        Return the SQLAlchemy Table, reflecting it on first access.
+
+        Returns None if the table does not exist.
+        """
         schema = schema or self.meta.schema
-        if schema:
-            tbl = self.meta.tables.get('.'.join([schema, table_name]))
-        else:
-            tbl = self.meta.tables.get(table_name)
+        tbl = self._get_cached_table(table_name, schema)
+        if tbl is None:
+            import sqlalchemy
+            try:
+                self.meta.reflect(only=[table_name], schema=schema,
+                                  views=True)
+            except sqlalchemy.exc.InvalidRequestError:
+                return None
+            tbl = self._get_cached_table(table_name, schema)
 
         # Avoid casting double-precision floats into decimals
         from sqlalchemy import Numeric
@@ -1176,12 +1812,32 @@ class SQLDatabase(PandasSQL):
 
         return tbl
 
+    def invalidate_cache(self, table_name=None, schema=None):
+        """
+        Forget cached table metadata, so it is reflected again on next use.
+
+        Parameters
+        ----------
+        table_name : string, default None
+            Name of the table to forget. If None, the metadata of all tables
+            is dropped.
+        schema : string, default None
+            Name of SQL schema of the table. If None, use the default schema
+            of the SQLDatabase object.
+        """
+        if table_name is None:
+            self.meta.clear()
+            return
+
+        tbl = self._get_cached_table(table_name, schema)
+        if tbl is not None:
+            self.meta.remove(tbl)
+
     def drop_table(self, table_name, schema=None):
         schema = schema or self.meta.schema
         if self.has_table(table_name, schema):
-            self.meta.reflect(only=[table_name], schema=schema)
             self.get_table(table_name, schema).drop()
-            self.meta.clear()
+            self.invalidate_cache(table_name, schema)
 
     def _create_sql_schema(self, frame, table_name, keys=None, dtype=None):
         table = SQLTable(table_name, self, frame=frame, index=False, keys=keys,
@@ -1257,7 +1913,7 @@ class SQLiteTable(SQLTable):
             for stmt in self.table:
                 conn.execute(stmt)
 
-    def insert_statement(self):
+    def insert_statement(self, num_rows=1):
         names = list(map(text_type, self.frame.columns))
         wld = '?'  # wildcard char
         escape = _get_valid_sqlite_name
@@ -1267,14 +1923,25 @@ class SQLiteTable(SQLTable):
 
         bracketed_names = [escape(column) for column in names]
         col_names = ','.join(bracketed_names)
-        wildcards = ','.join([wld] * len(names))
-        insert_statement = 'INSERT INTO %s (%s) VALUES (%s)' % (
+        row_wildcards = ','.join([wld] * len(names))
+        wildcards = ','.join('({})'.format(row_wildcards)
+                             for _ in range(num_rows))
+        insert_statement = 'INSERT INTO %s (%s) VALUES %s' % (
             escape(self.name), col_names, wildcards)
         return insert_statement
 
     def _execute_insert(self, conn, keys, data_iter):
+        # all chunks are inserted within the transaction opened by insert;
+        # the identical statement text lets sqlite3 reuse the prepared
+        # statement from its cache, and executemany consumes the rows
+        # lazily instead of materializing them in a list first
+        conn.executemany(self.insert_statement(), data_iter)
+
+    def _execute_insert_multi(self, conn, keys, data_iter):
         data_list = list(data_iter)
-        conn.executemany(self.insert_statement(), data_list)
+        flattened_data = [x for row in data_list for x in row]
+        conn.execute(self.insert_statement(num_rows=len(data_list)),
+                     flattened_data)
 
     def _create_table_setup(self):
         """
@@ -1410,7 +2077,7 @@ class SQLiteDatabase(PandasSQL):
                 cursor.close()
                 break
             else:
-                yield _wrap_result(data, columns, index_col=index_col,
+                yield _wrap_result([data], columns, index_col=index_col,
                                    coerce_float=coerce_float,
                                    parse_dates=parse_dates)
 
@@ -1427,22 +2094,16 @@ class SQLiteDatabase(PandasSQL):
                                         coerce_float=coerce_float,
                                         parse_dates=parse_dates)
         else:
-            data = self._fetchall_as_list(cursor)
-            cursor.close()
-
-            frame = _wrap_result(data, columns, index_col=index_col,
+            frame = _wrap_result(_fetch_batches(cursor.fetchmany), columns,
+                                 index_col=index_col,
                                  coerce_float=coerce_float,
                                  parse_dates=parse_dates)
+            cursor.close()
             return frame
 
-    def _fetchall_as_list(self, cur):
-        result = cur.fetchall()
-        if not isinstance(result, list):
-            result = list(result)
-        return result
-
     def to_sql(self, frame, name, if_exists='fail', index=True,
-               index_label=None, schema=None, chunksize=None, dtype=None):
+               index_label=None, schema=None, chunksize=None, dtype=None,
+               method=None):
         """
         Write records stored in a DataFrame to a SQL database.
 
@@ -1471,6 +2132,17 @@ class SQLiteDatabase(PandasSQL):
             Optional specifying the datatype for columns. The SQL type should
             be a string. If all columns are of the same type, one single value
             can be used.
+        method : {None, 'multi', callable}, default None
+            Controls the SQL insertion clause used:
+
+            * None : Uses standard SQL ``INSERT`` clause (one per row).
+            * 'multi': Pass multiple values in a single ``INSERT`` clause.
+            * callable with signature ``(pd_table, conn, keys, data_iter)``.
+
+            Details and a sample callable implementation can be found in the
+            section :ref:`insert method <io.sql.method>`.
+
+            .. versionadded:: 0.24.0
 
         """
         if dtype and not is_dict_like(dtype):
@@ -1486,7 +2158,7 @@ class SQLiteDatabase(PandasSQL):
                             if_exists=if_exists, index_label=index_label,
                             dtype=dtype)
         table.create()
-        table.insert(chunksize)
+        table.insert(chunksize, method=method)
 
     def has_table(self, name, schema=None):
         # TODO(wesm): unused?
@@ -1535,3 +2207,9 @@ def get_schema(frame, name, keys=None, con=None, dtype=None):
 
     pandas_sql = pandasSQL_builder(con=con)
     return pandas_sql._create_sql_schema(frame, name, keys=keys, dtype=dtype)
+
+
+if PY36:
+    # asynchronous generators need Python 3.6
+    from pandas.io._sql_async import (  # noqa:F401
+        read_sql_query_async, to_sql_async)
@@ -10,8 +10,9 @@ You can find more information on http://presbrey.mit.edu/PyDTA and
 http://www.statsmodels.org/devel/
 """
 
-from collections import OrderedDict
+from collections import OrderedDict, deque
 import datetime
+from multiprocessing import cpu_count
 import struct
 import sys
 import warnings
@@ -19,7 +20,7 @@ import warnings
 from dateutil.relativedelta import relativedelta
 import numpy as np
 
-from pandas._libs.lib import infer_dtype
+from pandas._libs.lib import decode_fixed_width, infer_dtype
 from pandas._libs.tslibs import NaT, Timestamp
 from pandas._libs.writers import max_len_string_array
 from pandas.compat import (
@@ -79,6 +80,21 @@ _iterator_params = """\
 iterator : boolean, default False
     Return StataReader object."""
 
+_performance_params = """\
+memory_map : boolean, default False
+    If a file path is given, map the data section of the file directly onto
+    memory and read observations from there.  Only the fields of the
+    variables selected with `columns` are copied out of the mapping.
+
+    .. versionadded:: 0.24.0
+use_threads : boolean or int, default False
+    When iterating over the file in chunks, run the conversion of several
+    chunks (string decoding, missing values, dates and categoricals) on a
+    pool of threads while further chunks are read.  If an int, the number
+    of threads to use; True uses the number of CPUs.
+
+    .. versionadded:: 0.24.0"""
+
 _read_stata_doc = """
 Read Stata file into DataFrame.
 
@@ -91,6 +107,7 @@ filepath_or_buffer : string or file-like object
 %s
 %s
 %s
+%s
 
 Returns
 -------
@@ -114,7 +131,7 @@ Read a Stata dta file in 10,000 line chunks:
 ...     do_something(chunk)
 """ % (_statafile_processing_params1, _encoding_params,
        _statafile_processing_params2, _chunksize_params,
-       _iterator_params)
+       _iterator_params, _performance_params)
 
 _data_method_doc = """\
 Reads observations from Stata file, converting them into a dataframe
@@ -162,8 +179,9 @@ path_or_buf : path (string), buffer or path object
 %s
 %s
 %s
+%s
 """ % (_statafile_processing_params1, _statafile_processing_params2,
-       _encoding_params, _chunksize_params)
+       _encoding_params, _chunksize_params, _performance_params)
 
 
 @Appender(_read_stata_doc)
@@ -172,7 +190,8 @@ path_or_buf : path (string), buffer or path object
 def read_stata(filepath_or_buffer, convert_dates=True,
                convert_categoricals=True, encoding=None, index_col=None,
                convert_missing=False, preserve_dtypes=True, columns=None,
-               order_categoricals=True, chunksize=None, iterator=False):
+               order_categoricals=True, chunksize=None, iterator=False,
+               memory_map=False, use_threads=False):
 
     reader = StataReader(filepath_or_buffer,
                          convert_dates=convert_dates,
@@ -181,7 +200,8 @@ def read_stata(filepath_or_buffer, convert_dates=True,
                          preserve_dtypes=preserve_dtypes,
                          columns=columns,
                          order_categoricals=order_categoricals,
-                         chunksize=chunksize)
+                         chunksize=chunksize, memory_map=memory_map,
+                         use_threads=use_threads)
 
     if iterator or chunksize:
         data = reader
@@ -955,7 +975,8 @@ class StataReader(StataParser, BaseIterator):
                  convert_categoricals=True, index_col=None,
                  convert_missing=False, preserve_dtypes=True,
                  columns=None, order_categoricals=True,
-                 encoding=None, chunksize=None):
+                 encoding=None, chunksize=None, memory_map=False,
+                 use_threads=False):
         super(StataReader, self).__init__()
         self.col_sizes = ()
 
@@ -970,6 +991,10 @@ class StataReader(StataParser, BaseIterator):
         self._order_categoricals = order_categoricals
         self._encoding = None
         self._chunksize = chunksize
+        self._memory_map = False
+        if use_threads is True:
+            use_threads = cpu_count()
+        self._num_threads = int(use_threads)
 
         # State variables for the file
         self._has_string_data = False
@@ -980,6 +1005,8 @@ class StataReader(StataParser, BaseIterator):
         self._data_read = False
         self._dtype = None
         self._lines_read = 0
+        self._pool = None
+        self._pending = deque()
 
         self._native_byteorder = _set_endianness(sys.byteorder)
         path_or_buf = _stringify_path(path_or_buf)
@@ -989,6 +1016,8 @@ class StataReader(StataParser, BaseIterator):
 
         if isinstance(path_or_buf, (str, text_type, bytes)):
             self.path_or_buf = open(path_or_buf, 'rb')
+            # only the data of plain files on disk can be mapped
+            self._memory_map = memory_map
         else:
             # Copy to BytesIO, and ensure no encoding
             contents = path_or_buf.read()
@@ -1007,6 +1036,10 @@ class StataReader(StataParser, BaseIterator):
 
     def close(self):
         """ close the handle if its open """
+        if self._pool is not None:
+            # already submitted conversions are still completed
+            self._pool.close()
+            self._pool = None
         try:
             self.path_or_buf.close()
         except IOError:
@@ -1335,6 +1368,13 @@ class StataReader(StataParser, BaseIterator):
         s = s.partition(b"\0")[0]
         return s.decode(self._encoding)
 
+    def _decode_strings(self, values):
+        # fixed-width str# field -> one row of bytes per observation
+        width = values.dtype.itemsize
+        values = np.ascontiguousarray(values).view(np.uint8)
+        return decode_fixed_width(values.reshape(-1, width), self._encoding,
+                                  nul_terminated=True)
+
     def _read_value_labels(self):
         if self._value_labels_read:
             # Don't read twice
@@ -1436,7 +1476,42 @@ class StataReader(StataParser, BaseIterator):
         return self.read(None, **kwargs)
 
     def __next__(self):
-        return self.read(nrows=self._chunksize or 1)
+        nrows = self._chunksize or 1
+        if self._num_threads > 1:
+            return self._next_threaded(nrows)
+        return self.read(nrows=nrows)
+
+    def _next_threaded(self, nrows):
+        # Chunks are read from the file in order on the calling thread,
+        # while up to _num_threads of them are being converted in the pool.
+        if self._pool is None and self._lines_read < self.nobs:
+            from multiprocessing.pool import ThreadPool
+            self._pool = ThreadPool(self._num_threads)
+        while len(self._pending) < self._num_threads:
+            try:
+                chunk = self._read_chunk(nrows, self._columns,
+                                         self._convert_categoricals)
+            except StopIteration:
+                break
+            self._pending.append(self._pool.apply_async(
+                self._convert_chunk, chunk,
+                dict(convert_dates=self._convert_dates,
+                     convert_categoricals=self._convert_categoricals,
+                     index_col=self._index_col,
+                     convert_missing=self._convert_missing,
+                     preserve_dtypes=self._preserve_dtypes,
+                     columns=self._columns,
+                     order_categoricals=self._order_categoricals)))
+        if not self._pending:
+            raise StopIteration
+        try:
+            return self._pending.popleft().get()
+        except ValueError:
+            # the conversion failed on a worker thread, only close the
+            # reader here on the calling thread
+            self._pending.clear()
+            self.close()
+            raise
 
     def get_chunk(self, size=None):
         """
@@ -1489,6 +1564,28 @@ class StataReader(StataParser, BaseIterator):
         if nrows is None:
             nrows = self.nobs
 
+        data, names, start = self._read_chunk(nrows, columns,
+                                              convert_categoricals)
+        try:
+            return self._convert_chunk(
+                data, names, start, convert_dates=convert_dates,
+                convert_categoricals=convert_categoricals,
+                index_col=index_col, convert_missing=convert_missing,
+                preserve_dtypes=preserve_dtypes, columns=columns,
+                order_categoricals=order_categoricals)
+        except ValueError:
+            self.close()
+            raise
+
+    def _read_chunk(self, nrows, columns, convert_categoricals):
+        """
+        Read the next `nrows` observations from the file.
+
+        Everything touching the file or the reader state happens here, so
+        that the returned chunk can be converted independently of other
+        chunks.  Returns the records as structured array together with the
+        names of its fields and the row number of the first observation.
+        """
         if (self.format_version >= 117) and (not self._value_labels_read):
             self._can_read_value_labels = True
             self._read_strls()
@@ -1505,11 +1602,37 @@ class StataReader(StataParser, BaseIterator):
                 self._read_value_labels()
             self.close()
             raise StopIteration
+
+        if columns is not None:
+            try:
+                self._set_column_selector(columns)
+            except ValueError:
+                self.close()
+                raise
+
         offset = self._lines_read * dtype.itemsize
-        self.path_or_buf.seek(self.data_location + offset)
         read_lines = min(nrows, self.nobs - self._lines_read)
-        data = np.frombuffer(self.path_or_buf.read(read_len), dtype=dtype,
-                             count=read_lines)
+        names = self.varlist
+        if self._memory_map:
+            data = np.memmap(self.path_or_buf, dtype=dtype, mode='r',
+                             offset=self.data_location + offset,
+                             shape=(read_lines,))
+            if columns is not None:
+                # copy only the selected fields out of the mapping
+                fields = [dtype.names[self.varlist.index(col)]
+                          for col in columns]
+                selected = np.empty(read_lines, dtype=[
+                    (field, dtype.fields[field][0]) for field in fields])
+                for field in fields:
+                    selected[field] = data[field]
+                data = selected
+                names = list(columns)
+            else:
+                data = np.array(data)
+        else:
+            self.path_or_buf.seek(self.data_location + offset)
+            data = np.frombuffer(self.path_or_buf.read(read_len),
+                                 dtype=dtype, count=read_lines)
 
         self._lines_read += read_lines
         if self._lines_read == self.nobs:
@@ -1522,30 +1645,34 @@ class StataReader(StataParser, BaseIterator):
         if convert_categoricals:
             self._read_value_labels()
 
+        return data, names, self._lines_read - read_lines
+
+    def _convert_chunk(self, data, names, start, convert_dates,
+                       convert_categoricals, index_col, convert_missing,
+                       preserve_dtypes, columns, order_categoricals):
+        """
+        Convert a chunk returned by ``_read_chunk`` into a DataFrame.
+        """
         if len(data) == 0:
-            data = DataFrame(columns=self.varlist)
+            data = DataFrame(columns=names)
         else:
-            data = DataFrame.from_records(data)
-            data.columns = self.varlist
+            # decode the string fields while building the columns
+            arrays = []
+            for field in data.dtype.names:
+                values = data[field]
+                if values.dtype.kind == 'S':
+                    values = self._decode_strings(values)
+                arrays.append(values)
+            data = DataFrame._from_arrays(arrays, columns=names, index=None)
 
         # If index is not specified, use actual row number rather than
         # restarting at 0 for each chunk.
         if index_col is None:
-            ix = np.arange(self._lines_read - read_lines, self._lines_read)
+            ix = np.arange(start, start + len(data))
             data = data.set_index(ix)
 
-        if columns is not None:
-            try:
-                data = self._do_select_columns(data, columns)
-            except ValueError:
-                self.close()
-                raise
-
-        # Decode strings
-        for col, typ in zip(data, self.typlist):
-            if type(typ) is int:
-                data[col] = data[col].apply(
-                    self._null_terminate, convert_dtype=True)
+        if columns is not None and list(names) != list(columns):
+            data = data[columns]
 
         data = self._insert_strls(data)
 
@@ -1577,13 +1704,9 @@ class StataReader(StataParser, BaseIterator):
                                  self.fmtlist))[0]
             for i in cols:
                 col = data.columns[i]
-                try:
-                    data[col] = _stata_elapsed_date_to_datetime_vec(
-                        data[col],
-                        self.fmtlist[i])
-                except ValueError:
-                    self.close()
-                    raise
+                data[col] = _stata_elapsed_date_to_datetime_vec(
+                    data[col],
+                    self.fmtlist[i])
 
         if convert_categoricals and self.format_version > 108:
             data = self._do_convert_categoricals(data,
@@ -1655,13 +1778,16 @@ class StataReader(StataParser, BaseIterator):
             data.iloc[:, i] = [self.GSO[str(k)] for k in data.iloc[:, i]]
         return data
 
-    def _do_select_columns(self, data, columns):
-
+    def _set_column_selector(self, columns):
+        """
+        Validate `columns` and restrict the variable information used in
+        the conversion to the selected columns.
+        """
         if not self._column_selector_set:
             column_set = set(columns)
             if len(column_set) != len(columns):
                 raise ValueError('columns contains duplicate entries')
-            unmatched = column_set.difference(data.columns)
+            unmatched = column_set.difference(self.varlist)
             if unmatched:
                 raise ValueError('The following columns were not found in the '
                                  'Stata data set: ' +
@@ -1672,7 +1798,7 @@ class StataReader(StataParser, BaseIterator):
             fmtlist = []
             lbllist = []
             for col in columns:
-                i = data.columns.get_loc(col)
+                i = self.varlist.index(col)
                 dtyplist.append(self.dtyplist[i])
                 typlist.append(self.typlist[i])
                 fmtlist.append(self.fmtlist[i])
@@ -1684,8 +1810,6 @@ class StataReader(StataParser, BaseIterator):
             self.lbllist = lbllist
             self._column_selector_set = True
 
-        return data[columns]
-
     def _do_convert_categoricals(self, data, value_label_dict, lbllist,
                                  order_categoricals):
         """
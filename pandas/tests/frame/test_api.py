@@ -429,6 +429,26 @@ class TestDataFrameMisc(SharedWithSparse):
         float_frame.values[:, 0] = 5.
         assert (float_frame.values[:, 0] == 5).all()
 
+    def test_itertuples_boxing(self):
+        df = DataFrame({'int': np.arange(25000),
+                        'dt': date_range('2000', periods=25000, freq='s'),
+                        'tz': date_range('2000', periods=25000, freq='s',
+                                         tz='US/Eastern'),
+                        'td': timedelta_range('1 day', periods=25000),
+                        'cat': pd.Categorical(['a', 'b'] * 12500)},
+                       columns=['int', 'dt', 'tz', 'td', 'cat'])
+        df.iloc[1, 1] = pd.NaT
+
+        result = list(df.itertuples(name=None))
+        expected = list(zip(df.index, *[df[col].tolist()
+                                        for col in df.columns]))
+        assert len(result) == 25000
+        assert result[0] == expected[0]
+        assert result[-1] == expected[-1]
+        assert result[1][2] is pd.NaT
+        assert [type(value) for value in result[0]] == [
+            type(value) for value in expected[0]]
+
     def test_as_matrix_deprecated(self, float_frame):
         # GH 18458
         with tm.assert_produces_warning(FutureWarning):
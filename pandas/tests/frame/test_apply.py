@@ -230,6 +230,55 @@ class TestDataFrameApply():
         tapplied = float_frame.apply(np.mean, axis=1)
         assert tapplied[d] == np.mean(float_frame.xs(d))
 
+    def test_apply_axis1_reused_row(self):
+        df = DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z'],
+                        'c': pd.Categorical(['u', 'v', 'w'])},
+                       index=list('pqr'), columns=['a', 'b', 'c'])
+        expected = DataFrame([[1, 'x', 'u'], [2, 'y', 'v'], [3, 'z', 'w']],
+                             index=list('pqr'), columns=['a', 'b', 'c'])
+
+        # returning the row, the result may not change with the next row
+        result = df.apply(lambda row: row, axis=1)
+        assert_frame_equal(result, expected)
+
+        # keeping a reference to the row
+        rows = []
+        result = df.apply(lambda row: rows.append(row) or row.name, axis=1)
+        assert_series_equal(result, Series(list('pqr'), index=list('pqr')))
+        assert [row.tolist() for row in rows] == expected.values.tolist()
+        assert [row.name for row in rows] == list('pqr')
+
+        # returning derived Series
+        result = df.apply(lambda row: row[['b', 'a']], axis=1,
+                          result_type='expand')
+        assert_frame_equal(result, expected[['b', 'a']])
+
+        # returning a Series sharing the manager or the block of the row
+        result = df.apply(lambda row: pd.Series(row), axis=1)
+        assert_frame_equal(result, expected)
+
+        result = df.apply(lambda row: row.astype(row.dtype, copy=False),
+                          axis=1)
+        assert_frame_equal(result, expected)
+
+        # replacing the internals of the row
+        def f(row):
+            row.index = ['A', 'B', 'C']
+            return row['A']
+        result = df.apply(f, axis=1)
+        assert_series_equal(result, Series([1, 2, 3], index=list('pqr')))
+
+        # ignoring failures
+        def g(row):
+            if row.name == 'q':
+                raise ValueError
+            return row['a']
+        result = frame_apply(df, g, 1, ignore_failures=True).get_result()
+        assert_series_equal(result, Series([1, 3], index=list('pr')))
+
+        with pytest.raises(ValueError, match='occurred at index q'):
+            df.apply(g, axis=1)
+
     def test_apply_ignore_failures(self, float_string_frame):
         result = frame_apply(float_string_frame, np.mean, 0,
                              ignore_failures=True).apply_standard()
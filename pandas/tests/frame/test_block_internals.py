@@ -64,12 +64,142 @@ class TestDataFrameBlockInternals():
         assert recons is not consolidated
         tm.assert_frame_equal(recons, consolidated)
 
+        # appended to the block inserted for 'E'
         float_frame['F'] = 8.
-        assert len(float_frame._data.blocks) == 3
+        assert len(float_frame._data.blocks) == 2
 
         float_frame._consolidate(inplace=True)
         assert len(float_frame._data.blocks) == 1
 
+    def test_insert_grows_block(self):
+        # inserted items of the same dtype share a growable block
+        df = DataFrame(index=range(3))
+        for i in range(20):
+            df[i] = np.arange(3.) + i
+            df['x{}'.format(i)] = i
+        assert len(df._data.blocks) == 2
+        assert df._data.is_consolidated()
+
+        expected = DataFrame(np.arange(3.)[:, None] + np.arange(20),
+                             columns=pd.Index(list(range(20)), dtype=object))
+        assert_frame_equal(df[list(range(20))], expected)
+        assert (df['x7'] == 7).all()
+
+        # earlier views and shallow copies are not affected by later inserts
+        first = df[0]
+        shallow = df.copy(deep=False)
+        df.insert(0, 'y', 1.)
+        assert_series_equal(first, expected[0])
+        assert_frame_equal(shallow[list(range(20))], expected)
+        assert list(df.columns[:2]) == ['y', 0]
+        assert (df['y'] == 1.).all()
+
+        df[1] = -1.
+        assert (df[1] == -1.).all()
+        assert_series_equal(df[0], expected[0])
+
+        # a deleted item is not part of the grown block anymore
+        del df[2]
+        df['z'] = 2.
+        assert 2 not in df
+        assert (df['z'] == 2.).all()
+        assert_series_equal(df[3], expected[3])
+
+    def _grown_frame(self):
+        df = DataFrame(index=range(3))
+        for i in range(5):
+            df[i] = float(i)
+        values = df._data.blocks[0].values
+        assert len(values.base) > len(values)
+        return df
+
+    def test_consolidate_trims_grown_block(self):
+        # an explicit consolidation releases the spare capacity of a grown
+        # block
+        df = self._grown_frame()
+        df._consolidate(inplace=True)
+        values = df._data.blocks[0].values
+        assert values.base is None or len(values.base) == len(values)
+
+        # later inserts still go to the same block
+        df[5] = 5.
+        assert len(df._data.blocks) == 1
+        expected = DataFrame(np.tile(np.arange(6.), (3, 1)),
+                             columns=pd.Index(list(range(6)), dtype=object))
+        assert_frame_equal(df, expected)
+
+    @pytest.mark.parametrize('copy_on_write', [True, False])
+    def test_copy_trims_grown_block(self, copy_on_write):
+        # a deep copy doesn't keep the spare capacity of a grown block, and
+        # leaves the grown block of the source alone
+        df = self._grown_frame()
+        block = df._data.blocks[0]
+        cached = df[0]
+        with option_context('mode.copy_on_write', copy_on_write):
+            result = df.copy()
+        values = result._data.blocks[0].values
+        assert values.base is None or len(values.base) == len(values)
+        assert_frame_equal(result, df)
+
+        assert df._data.blocks[0] is block
+        assert df[0] is cached
+        df._consolidate()
+        assert df._data.blocks[0] is block
+
+    @pytest.mark.parametrize('policy, consolidated', [
+        ('eager', True), ('lazy', False), (2, True), (10, False),
+        ('1KB', True), ('1B', False)])
+    def test_consolidation_policy(self, policy, consolidated):
+        # the two float blocks to be merged hold 160 bytes
+        df = DataFrame({'a': np.arange(10.)})
+        df['b'] = np.arange(10.)
+        df['c'] = np.arange(10)
+        assert len(df._data.blocks) == 3
+
+        with option_context('mode.consolidation', policy):
+            result = df.fillna(0)
+            assert df._data.is_consolidated() is consolidated
+            assert_frame_equal(result, df)
+
+            # explicit consolidation is not affected
+            df._consolidate(inplace=True)
+            assert df._data.is_consolidated()
+
+    def test_consolidation_policy_invalid(self):
+        with pytest.raises(ValueError, match="'64MB'"):
+            pd.set_option('mode.consolidation', 'sometimes')
+        with pytest.raises(ValueError, match="'64MB'"):
+            pd.set_option('mode.consolidation', -1)
+
+    @pytest.mark.parametrize('name', ['sum', 'mean', 'min', 'max', 'std',
+                                      'median', 'prod'])
+    def test_reduce_blockwise(self, name):
+        df = DataFrame({'a': [1., 2., nan], 'b': [1, 2, 3]})
+        df['c'] = np.array([1., 2., 3.], dtype='float32')
+        df['d'] = [4., 5., 6.]
+        assert not df._data.is_consolidated()
+
+        with option_context('mode.consolidation', 'lazy'):
+            expected = DataFrame(df.values, columns=df.columns)
+            result = getattr(df, name)()
+            assert not df._data.is_consolidated()
+        assert_series_equal(result, getattr(expected, name)())
+
+    @pytest.mark.parametrize('name', ['sum', 'mean', 'std', 'median'])
+    def test_reduce_threads(self, name, monkeypatch):
+        monkeypatch.setattr(pd.core.internals.managers,
+                            '_PARALLEL_MIN_ELEMENTS', 0)
+        df = DataFrame(np.random.randn(100, 10))
+        df.iloc[::7, 3] = nan
+        df[10] = np.arange(100)
+        expected = getattr(df, name)()
+
+        with option_context('compute.reduction_threads', 3):
+            # mixed blocks and a single block
+            assert_series_equal(getattr(df, name)(), expected)
+            assert_series_equal(getattr(df.iloc[:, :10], name)(),
+                                expected.iloc[:10])
+
     def test_consolidate_inplace(self, float_frame):
         frame = float_frame.copy()  # noqa
 
@@ -579,3 +709,132 @@ starting,ending,measure
         first = len(df.loc[pd.isna(df[myid]), [myid]])
         second = len(df.loc[pd.isna(df[myid]), [myid]])
         assert first == second == 0
+
+
+class TestCopyOnWrite(object):
+
+    @pytest.fixture(autouse=True)
+    def copy_on_write(self):
+        with option_context('mode.copy_on_write', True):
+            yield
+
+    @staticmethod
+    def _shares(left, right, col='a'):
+        return np.shares_memory(left._data.get(col).internal_values(),
+                                right._data.get(col).internal_values())
+
+    @pytest.mark.parametrize('method', [
+        lambda df: df.copy(),
+        lambda df: df.reindex(df.index, copy=True),
+        lambda df: df.rename(index=str),
+        lambda df: df.reset_index(),
+    ])
+    def test_copy_shares_values(self, method):
+        df = DataFrame({'a': [1, 2, 3], 'b': [1., 2., 3.], 'c': list('xyz')})
+        expected = df.copy(deep=True)
+        result = method(df)
+        assert self._shares(result, df)
+        assert self._shares(result, df, 'b')
+
+        # the first write copies the block
+        result.loc[0, 'a'] = 10
+        assert not self._shares(result, df)
+        assert self._shares(result, df, 'b')
+        assert result.loc[0, 'a'] == 10
+        assert_frame_equal(df, expected)
+
+        # also for writes to the original
+        df.loc[1, 'b'] = 20.
+        assert result.loc[1, 'b'] == 2.
+        assert df.loc[1, 'b'] == 20.
+
+    def test_slice(self):
+        df = DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]})
+        expected = df.copy()
+
+        with option_context('mode.chained_assignment', None):
+            rows = df.iloc[1:]
+            rows.iloc[0, 0] = 10
+            assert rows.iloc[0, 0] == 10
+            assert_frame_equal(df, expected)
+
+            columns = df.iloc[:, :1]
+            df.iloc[0, 0] = 100
+            assert columns.iloc[0, 0] == 1
+
+            s = df['b']
+            part = s[:2]
+            part[0] = 100
+            assert s[0] == 4
+
+    @pytest.mark.parametrize('data', [
+        {'a': [1, 2, 3], 'b': [4, 5, 6]},
+        {'a': [1, 2, 3], 'b': [4, 5, 6], 'c': list('xyz')},
+    ])
+    @pytest.mark.parametrize('setter', [
+        lambda s: s.__setitem__(0, 100),
+        lambda s: s.loc.__setitem__(0, 100),
+        lambda s: s.iat.__setitem__(0, 100),
+    ])
+    def test_column(self, data, setter):
+        # a column of a fresh frame, without any prior slice
+        df = DataFrame(data)
+        expected = DataFrame(data)
+
+        s = df['b']
+        setter(s)
+        assert s[0] == 100
+        assert_frame_equal(df, expected)
+
+        # a deep copy taken while a column is alive
+        s = df['a']
+        result = df.copy()
+        setter(s)
+        assert s[0] == 100
+        assert_frame_equal(result, expected)
+        assert_frame_equal(df, expected)
+
+    def test_copy_does_not_consolidate(self):
+        df = DataFrame.from_arrays([np.arange(3.), np.arange(3.)],
+                                   columns=['a', 'b'], consolidate=False)
+        result = df.copy()
+        assert len(df._data.blocks) == 2
+        assert len(result._data.blocks) == 1
+        result.iloc[0, 0] = 10.
+        assert df.iloc[0, 0] == 0.
+
+    @pytest.mark.parametrize('setter', [
+        lambda df: df.__setitem__('a', [7, 8, 9]),
+        lambda df: df.__setitem__(df > 2, 0),
+        lambda df: df.mask(df > 2, 0, inplace=True),
+        lambda df: df.at.__setitem__((0, 'a'), 10),
+        lambda df: df.iat.__setitem__((0, 0), 10),
+        lambda df: df['a'].__setitem__(0, 10),
+    ])
+    def test_setters(self, setter):
+        df = DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]})
+        expected = df.copy(deep=True)
+        result = df.copy()
+        with option_context('mode.chained_assignment', None):
+            setter(result)
+        assert_frame_equal(df, expected)
+
+    def test_fillna_inplace(self):
+        df = DataFrame({'a': [1., nan, 3.]})
+        result = df.copy()
+        result.fillna(0, inplace=True)
+        assert df['a'].isna()[1]
+        assert result.loc[1, 'a'] == 0
+
+        s = Series([1., nan, 3.])
+        result = s.copy()
+        result.fillna(0, inplace=True)
+        assert s.isna()[1]
+        result[0] = 10.
+        assert s[0] == 1.
+
+    def test_disabled(self):
+        df = DataFrame({'a': [1, 2, 3]})
+        with option_context('mode.copy_on_write', False):
+            assert not self._shares(df.copy(), df)
+        assert self._shares(df.copy(), df)
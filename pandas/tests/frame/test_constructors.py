@@ -2165,6 +2165,59 @@ class TestDataFrameConstructors(TestData):
         result = DataFrame({'A': range(5)}, dtype=dtype)
         tm.assert_frame_equal(result, expected)
 
+    def test_constructor_dict_no_copy(self):
+        arrays = {'a': np.arange(3), 'b': np.arange(3.), 'c': np.arange(3.),
+                  'd': pd.date_range('2000', periods=3).values}
+        expected = DataFrame({k: v.copy() for k, v in arrays.items()})
+
+        result = DataFrame(arrays)
+        assert result._data.nblocks == 3
+        assert not np.shares_memory(result['b'].values, arrays['b'])
+
+        result = DataFrame(arrays, copy=False)
+        tm.assert_frame_equal(result, expected)
+        assert result._data.nblocks == 4
+        for key, values in arrays.items():
+            assert np.shares_memory(result[key].values, values)
+
+    @pytest.mark.parametrize('keys', [['a'], ['a', 'b', 'c']])
+    @pytest.mark.parametrize('copy', [None, True])
+    def test_constructor_dict_series_copy(self, keys, copy):
+        # dict input is copied by default, also with Series values
+        data = {'a': Series([1, 2, 3]), 'b': Series([1., 2., 3.]),
+                'c': Series(list('xyz'))}
+        data = {key: data[key] for key in keys}
+        kwargs = {} if copy is None else {'copy': copy}
+
+        result = DataFrame(data, **kwargs)
+        for key in keys:
+            assert not np.shares_memory(result[key].values,
+                                        data[key].values)
+
+        data['a'][0] = 100
+        assert result['a'][0] == 1
+        result.loc[1, 'a'] = 200
+        assert data['a'][1] == 2
+
+    @pytest.mark.parametrize('consolidate', [True, False])
+    def test_from_arrays(self, consolidate):
+        arrays = [np.arange(3), np.arange(3.), np.arange(3.)]
+        expected = DataFrame({'a': arrays[0], 'b': arrays[1],
+                              'c': arrays[2]}, columns=['a', 'b', 'c'])
+
+        result = DataFrame.from_arrays(arrays, columns=['a', 'b', 'c'],
+                                       consolidate=consolidate)
+        tm.assert_frame_equal(result, expected)
+        assert result._data.nblocks == (2 if consolidate else 3)
+        assert (np.shares_memory(result['b'].values, arrays[1]) is
+                not consolidate)
+
+        result = DataFrame.from_arrays(arrays, consolidate=consolidate)
+        tm.assert_index_equal(result.columns, pd.RangeIndex(3))
+
+        with pytest.raises(ValueError, match='2 columns passed'):
+            DataFrame.from_arrays(arrays, columns=['a', 'b'])
+
 
 class TestDataFrameConstructorWithDatetimeTZ(TestData):
 
@@ -10,7 +10,7 @@ import numpy as np
 
 from pandas import compat
 from pandas.compat import long
-from pandas import (DataFrame, Series, MultiIndex, Timestamp,
+from pandas import (DataFrame, Series, MultiIndex, Timedelta, Timestamp,
                     date_range)
 
 import pandas.util.testing as tm
@@ -314,6 +314,27 @@ class TestDataFrameConvertTo(TestData):
         tm.assert_dict_equal(result[0], expected[0])
         tm.assert_dict_equal(result[1], expected[1])
 
+    @pytest.mark.parametrize('into', [dict, OrderedDict])
+    def test_to_dict_records(self, into):
+        tsmp = Timestamp('20130101')
+        df = DataFrame({'a b': [1, 2],
+                        'dt': [tsmp, tsmp],
+                        'td': [Timedelta('1D'), Timedelta('2D')],
+                        'obj': [np.datetime64('2013-01-01'), 'x']},
+                       columns=['a b', 'dt', 'td', 'obj'])
+
+        result = df.to_dict(orient='records', into=into)
+        expected = [into([('a b', 1), ('dt', tsmp), ('td', Timedelta('1D')),
+                          ('obj', tsmp)]),
+                    into([('a b', 2), ('dt', tsmp), ('td', Timedelta('2D')),
+                          ('obj', 'x')])]
+        assert result == expected
+        assert all(type(row) is into for row in result)
+        if into is OrderedDict:
+            assert list(result[0]) == list(df.columns)
+        assert isinstance(result[0]['a b'], (int, long))
+        assert isinstance(result[0]['obj'], Timestamp)
+
     @pytest.mark.parametrize('into, expected', [
         (dict, {0: {'int_col': 1, 'float_col': 1.0},
                 1: {'int_col': 2, 'float_col': 2.0},
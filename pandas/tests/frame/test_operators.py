@@ -752,6 +752,67 @@ class TestDataFrameOperators(TestData):
         expected = id(df)
         assert id(df) == expected
 
+    @pytest.mark.parametrize('use_numexpr', [True, False])
+    def test_inplace_arithmetic(self, use_numexpr):
+        df_orig = DataFrame({'a': np.arange(20000.), 'b': np.arange(20000.),
+                             'c': np.arange(20000)})
+
+        with pd.option_context('compute.inplace_arithmetic', True,
+                               'compute.use_numexpr', use_numexpr):
+            # evaluated into the values of the blocks
+            df = df_orig.copy()
+            values = [blk.values for blk in df._data.blocks]
+            df += 2
+            df *= df_orig
+            df -= 1
+            assert_frame_equal(df, (df_orig + 2) * df_orig - 1)
+            for blk, blk_values in zip(df._data.blocks, values):
+                assert blk.values is blk_values
+
+            s = df_orig['a'].copy()
+            values = s.values
+            s /= 2
+            assert_series_equal(s, df_orig['a'] / 2)
+            assert np.shares_memory(s.values, values)
+
+            # upcast of the int block, falls back to a new result
+            df = df_orig.copy()
+            df /= 2
+            assert_frame_equal(df, df_orig / 2)
+            assert df['c'].dtype == np.float64
+
+            # unaligned, falls back to a new result
+            s = df_orig['a'].copy()
+            values = s.values
+            s += s[::-1]
+            assert_series_equal(s, df_orig['a'] * 2)
+            assert not np.shares_memory(s.values, values)
+
+    def test_inplace_arithmetic_copy_of_slice(self):
+        df = DataFrame({'a': [1., -2., 3.], 'b': [4., 5., 6.]})
+        expected = df.copy()
+
+        with pd.option_context('compute.inplace_arithmetic', True):
+            sub = df[df.a > 0]
+            sub += 1
+            assert_frame_equal(sub, expected[expected.a > 0] + 1)
+            assert_frame_equal(df, expected)
+
+            # a view on the rows of df is not written through either
+            sub = df[:2]
+            sub += 1
+            assert_frame_equal(sub, expected[:2] + 1)
+            assert_frame_equal(df, expected)
+
+            with tm.assert_produces_warning(com.SettingWithCopyWarning):
+                df[df.a > 0]['b'] += 1
+            assert_frame_equal(df, expected)
+
+            # a column of df is updated as without the option
+            df['b'] += 1
+            expected['b'] += 1
+            assert_frame_equal(df, expected)
+
     def test_alignment_non_pandas(self):
         index = ['A', 'B', 'C']
         columns = ['X', 'Y', 'Z']
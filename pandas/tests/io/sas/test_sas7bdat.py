@@ -75,6 +75,38 @@ class TestSAS7BDAT(object):
                 tm.assert_frame_equal(df, df0.iloc[2:5, :])
                 rdr.close()
 
+    @pytest.mark.parametrize('use_threads', [True, 3])
+    def test_use_threads(self, use_threads):
+        from pandas.io.sas.sas7bdat import SAS7BDATReader
+        for j in 0, 1:
+            df0 = self.data[j]
+            for k in self.test_ix[j]:
+                fname = os.path.join(
+                    self.dirpath, "test{k}.sas7bdat".format(k=k))
+                rdr = SAS7BDATReader(fname, encoding='utf-8',
+                                     use_threads=use_threads)
+                df = rdr.read()
+                tm.assert_frame_equal(df, df0)
+                rdr.close()
+
+                rdr = SAS7BDATReader(fname, encoding='utf-8', chunksize=4,
+                                     use_threads=use_threads)
+                df = pd.concat(rdr)
+                tm.assert_frame_equal(df, df0)
+                rdr.close()
+
+                df = pd.read_sas(fname, encoding='utf-8',
+                                 use_threads=use_threads)
+                tm.assert_frame_equal(df, df0)
+
+                rdr = pd.read_sas(fname, encoding='utf-8', chunksize=4,
+                                  use_threads=use_threads)
+                if use_threads is not True:
+                    assert rdr._num_threads == use_threads
+                df = pd.concat(rdr)
+                tm.assert_frame_equal(df, df0)
+                rdr.close()
+
     @td.skip_if_no('pathlib')
     def test_path_pathlib(self):
         from pathlib import Path
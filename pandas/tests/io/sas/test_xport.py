@@ -141,3 +141,7 @@ class TestXport(object):
 
         data = read_sas(self.file04, format="xport")
         tm.assert_frame_equal(data.astype('int64'), data_csv)
+
+    def test_use_threads_unsupported(self):
+        with pytest.raises(ValueError, match="use_threads"):
+            read_sas(self.file01, format="xport", use_threads=True)
@@ -0,0 +1,112 @@
+""" test the native block format """
+import mmap as mmap_module
+
+import numpy as np
+import pytest
+
+import pandas as pd
+import pandas.util.testing as tm
+from pandas.util.testing import assert_frame_equal, ensure_clean
+
+from pandas.io.blocks import read_blocks, to_blocks
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({'int': np.arange(5),
+                         'float': np.arange(5, dtype='float64'),
+                         'float_with_null': [1., np.nan, 3., 4., np.nan],
+                         'uint': np.arange(5, dtype='u1'),
+                         'bool': [True, False, True, True, False],
+                         'string': list('abcde'),
+                         'cat': pd.Categorical(list('aabbc'), ordered=True),
+                         'dt': pd.date_range('20130101', periods=5),
+                         'dttz': pd.date_range('20130101', periods=5,
+                                               tz='US/Eastern'),
+                         'td': pd.timedelta_range('1 day', periods=5),
+                         'period': pd.period_range('2013', periods=5,
+                                                   freq='A')},
+                        index=pd.Index(list('vwxyz'), name='idx'))
+
+
+def _is_mapped(values):
+    base = values
+    while isinstance(base, np.ndarray):
+        base = base.base
+    return isinstance(base, mmap_module.mmap)
+
+
+class TestBlocks(object):
+
+    @pytest.mark.parametrize('mmap', [True, False])
+    def test_round_trip(self, df, mmap):
+        with ensure_clean() as path:
+            df.to_blocks(path)
+            result = pd.read_blocks(path, mmap=mmap)
+            assert_frame_equal(result, df)
+            assert result._data.nblocks == df._data.nblocks
+            del result
+
+    def test_round_trip_unconsolidated(self):
+        df = pd.DataFrame({'a': np.arange(3)})
+        df['b'] = np.arange(3.)
+        df['c'] = np.arange(3)
+        df.columns = pd.MultiIndex.from_tuples([('a', 1), ('a', 2),
+                                                ('b', 1)])
+        assert df._data.nblocks == 3
+
+        with ensure_clean() as path:
+            to_blocks(df, path)
+            result = read_blocks(path)
+            assert_frame_equal(result, df)
+            assert result._data.nblocks == 3
+            del result
+
+    def test_fortran_ordered(self):
+        df = pd.DataFrame(np.asfortranarray(np.arange(12.).reshape(4, 3)),
+                          columns=list('abc'))
+        assert not df._data.blocks[0].values.flags.c_contiguous
+
+        with ensure_clean() as path:
+            df.to_blocks(path)
+            result = pd.read_blocks(path)
+            assert_frame_equal(result, df)
+            del result
+
+    def test_empty(self):
+        df = pd.DataFrame(columns=list('ab'), dtype='float64')
+        with ensure_clean() as path:
+            df.to_blocks(path)
+            result = pd.read_blocks(path)
+            assert_frame_equal(result, df)
+            del result
+
+    def test_mmap_views(self, df):
+        with ensure_clean() as path:
+            df.to_blocks(path)
+            result = pd.read_blocks(path)
+
+            for col in ['int', 'float', 'dt']:
+                assert _is_mapped(result._data.get(col).internal_values())
+            assert _is_mapped(result['cat'].values.codes)
+            assert not _is_mapped(result['string'].values)
+
+            # copy-on-write, the file is not modified
+            result.iloc[0, result.columns.get_loc('float')] = 100.
+            assert result['float'].iloc[0] == 100.
+            del result
+            assert_frame_equal(pd.read_blocks(path), df)
+
+    def test_error(self):
+        with pytest.raises(ValueError, match='only supports'):
+            to_blocks(pd.Series([1, 2, 3]), 'unused')
+
+        with ensure_clean() as path:
+            with open(path, 'wb') as f:
+                f.write(b'not a block file')
+            with pytest.raises(ValueError, match='is not a block file'):
+                pd.read_blocks(path)
+
+    def test_path_pathlib(self, df):
+        result = tm.round_trip_pathlib(df.to_blocks, pd.read_blocks)
+        assert_frame_equal(result, df)
@@ -1,6 +1,7 @@
 """
 Tests for the pandas.io.common functionalities
 """
+from io import BytesIO
 import mmap
 import os
 
@@ -310,3 +311,148 @@ class TestMMapWrapper(object):
             df.to_csv(path)
             with pytest.raises(ValueError, match='Unknown engine'):
                 pd.read_csv(path, engine='pyt')
+
+
+class TestIOListeners(object):
+
+    @pytest.fixture
+    def events(self):
+        events = []
+        icom.register_io_listener(events.append)
+        yield events
+        icom.unregister_io_listener(events.append)
+
+    @pytest.fixture
+    def df(self):
+        return pd.DataFrame({'a': range(10), 'b': list('abcdefghij')})
+
+    def test_csv(self, events, df):
+        with tm.ensure_clean('__listener__.csv') as path:
+            df.to_csv(path, index=False)
+            size = os.path.getsize(path)
+
+            assert [e.event for e in events] == ['open', 'close', 'write']
+            opened, closed, written = events
+            assert opened.operation == closed.operation == 'to_csv'
+            assert opened.path == path
+            assert closed.nbytes == size
+            assert written.nbytes == size
+            assert written.shape == df.shape
+            assert written.elapsed >= closed.elapsed >= 0
+
+            # the C parser reads the file itself
+            del events[:]
+            result = pd.read_csv(path)
+            assert [e.event for e in events] == ['read']
+            assert events[0].operation == 'read_csv'
+            assert events[0].nbytes == size
+            assert events[0].shape == result.shape
+
+            # the python parser reads through a handle
+            del events[:]
+            pd.read_csv(path, engine='python')
+            assert [e.event for e in events] == ['open', 'close', 'read']
+            assert events[1].nbytes == events[2].nbytes == size
+
+    @pytest.mark.parametrize('compression, ext', [
+        (None, ''), ('gzip', '.gz'), ('bz2', '.bz2')])
+    def test_csv_c_engine(self, events, df, compression, ext):
+        with tm.ensure_clean('__listener__.csv' + ext) as path:
+            df.to_csv(path, index=False, compression=compression)
+            size = os.path.getsize(path)
+
+            del events[:]
+            result = pd.read_csv(path, engine='c')
+            tm.assert_frame_equal(result, df)
+            assert [e.event for e in events] == ['read']
+            assert events[0].nbytes == size
+            assert events[0].shape == df.shape
+
+    def test_monitored_handle(self, events):
+        data = b'a,b\n1,2\n3,4\n'
+        handle = icom._MonitoredHandle(BytesIO(data), 'path', 'rb', None)
+        assert handle.readline() == b'a,b\n'
+        buf = bytearray(2)
+        assert handle.readinto(buf) == 2
+        assert handle.read1(2) == b'2\n'
+        assert list(handle) == [b'3,4\n']
+        assert handle.nbytes == len(data)
+        handle.close()
+        assert events[-1].event == 'close'
+        assert events[-1].nbytes == len(data)
+
+        out = BytesIO()
+        handle = icom._MonitoredHandle(out, 'path', 'wb', None)
+        handle.writelines([b'a,b\n', b'1,2\n'])
+        assert handle.nbytes == 8
+
+    def test_compression(self, events, df):
+        with tm.ensure_clean('__listener__.csv.gz') as path:
+            df.to_csv(path, compression='gzip')
+            assert events[-1].compression == 'gzip'
+
+            del events[:]
+            pd.read_csv(path, index_col=0)
+            assert events[-1].event == 'read'
+            assert events[-1].compression == 'gzip'
+
+    def test_json(self, events, df):
+        with tm.ensure_clean('__listener__.json') as path:
+            df.to_json(path)
+            assert [e.event for e in events] == ['open', 'close', 'write']
+            assert events[-1].operation == 'to_json'
+
+            del events[:]
+            pd.read_json(path)
+            assert [e.event for e in events] == ['open', 'close', 'read']
+            assert events[1].operation == 'read_json'
+            assert events[1].nbytes == events[2].nbytes > 0
+            assert events[2].shape == df.shape
+
+    def test_sql(self, events, df):
+        import sqlite3
+        con = sqlite3.connect(':memory:')
+        df.to_sql('test_listener', con, index=False)
+        assert [e.event for e in events] == ['write']
+        assert events[0].operation == 'to_sql'
+
+        del events[:]
+        result = pd.read_sql_query('SELECT * FROM test_listener', con)
+        assert [e.event for e in events] == ['read']
+        assert events[0].operation == 'read_sql_query'
+        assert events[0].nbytes is None
+        assert events[0].shape == result.shape == df.shape
+
+    @td.skip_if_no('sqlalchemy')
+    def test_sql_table(self, events, df):
+        from sqlalchemy import create_engine
+        engine = create_engine('sqlite:///:memory:')
+        df.to_sql('test_listener', engine, index=False)
+
+        del events[:]
+        result = pd.read_sql_table('test_listener', engine)
+        assert [e.event for e in events] == ['read']
+        assert events[0].operation == 'read_sql_table'
+        assert events[0].path == 'test_listener'
+        assert events[0].shape == result.shape == df.shape
+
+    def test_buffer(self, events, df):
+        # handles passed in are not reported, only the call
+        buf = StringIO()
+        df.to_csv(buf)
+        assert [e.event for e in events] == ['write']
+        assert events[0].path is buf
+        assert events[0].nbytes is None
+
+    def test_error(self, events):
+        with pytest.raises(FileNotFoundError):
+            pd.read_csv('does_not_exist.csv')
+        assert [e.event for e in events if e.event == 'read'] == []
+
+    def test_unregister(self, df):
+        events = []
+        icom.register_io_listener(events.append)
+        icom.unregister_io_listener(events.append)
+        with tm.ensure_clean() as path:
+            df.to_csv(path)
+        assert events == []
@@ -119,6 +119,32 @@ class TestFeather(object):
         self.check_round_trip(df, use_threads=True)
         self.check_round_trip(df, use_threads=False)
 
+    @pytest.mark.skipif(pyarrow_version < LooseVersion('0.17.0'),
+                        reason='need pyarrow >= 0.17.0 for memory_map')
+    def test_read_memory_map(self):
+        df = pd.DataFrame({'int': np.arange(10),
+                           'float': np.arange(10, dtype='float64'),
+                           'float_with_null': [1., np.nan] * 5,
+                           'string': list('abcdefghij'),
+                           'cat': pd.Categorical(list('aabbccddee')),
+                           'dt': pd.date_range('20130101', periods=10)})
+        self.check_round_trip(df, memory_map=True)
+        self.check_round_trip(df, columns=['string', 'int'],
+                              expected=df[['string', 'int']],
+                              memory_map=True)
+
+        with ensure_clean() as path:
+            to_feather(df, path)
+            result = read_feather(path, memory_map=True)
+
+            # null-free numeric columns are views on the mapped file
+            for col in ['int', 'float', 'dt']:
+                values = result._data.get(col).values
+                assert not values.flags.writeable
+                assert values.base is not None
+            assert result['float_with_null'].values.flags.writeable
+            del result
+
     def test_write_with_index(self):
 
         df = pd.DataFrame({'A': [1, 2, 3]})
@@ -534,6 +534,18 @@ class TestNDFrame(TestPackers):
             for i, packed in enumerate(read_msgpack(path, iterator=True)):
                 check_arbitrary(packed, packed_items[i])
 
+    def test_iterator_read_size(self):
+        # objects larger than read_size are read in several pieces
+        packed_items = [self.frame['float'], self.frame['float'].A,
+                        self.frame['float'].B, None]
+
+        with ensure_clean(self.path) as path:
+            to_msgpack(path, *packed_items)
+            result = list(read_msgpack(path, iterator=True, read_size=16))
+            assert len(result) == len(packed_items)
+            for packed, expected in zip(result, packed_items):
+                check_arbitrary(packed, expected)
+
     def tests_datetimeindex_freq_issue(self):
 
         # GH 5947
@@ -717,10 +729,40 @@ class TestCompression(TestPackers):
             pytest.skip('no zlib')
         self._test_compression_warns_when_decompress_caches('zlib')
 
-    def test_compression_warns_when_decompress_caches_blosc(self):
+    def test_compression_blosc_decompresses_into_result(self):
+        if not _BLOSC_INSTALLED:
+            pytest.skip('no blosc')
+
+        def decompress(ob):
+            raise AssertionError('blosc.decompress should not be called')
+
+        # the data is decompressed straight into the buffer of the result,
+        # never into an intermediate bytes object
+        with patch(blosc, 'decompress', decompress), \
+                tm.assert_produces_warning(None):
+            i_rec = self.encode_decode(self.frame, compress='blosc')
+
+        for k in self.frame.keys():
+            value = i_rec[k]
+            assert_frame_equal(value, self.frame[k])
+            for block in value._data.blocks:
+                assert block.values.flags.writeable
+
+    @pytest.mark.parametrize('use_threads', [True, 2])
+    def test_compression_blosc_use_threads(self, use_threads):
         if not _BLOSC_INSTALLED:
             pytest.skip('no blosc')
-        self._test_compression_warns_when_decompress_caches('blosc')
+
+        previous = blosc.set_nthreads(1)
+        try:
+            i_rec = self.encode_decode(self.frame, compress='blosc',
+                                       use_threads=use_threads)
+            for k in self.frame.keys():
+                assert_frame_equal(i_rec[k], self.frame[k])
+            # the number of threads is restored
+            assert blosc.set_nthreads(1) == 1
+        finally:
+            blosc.set_nthreads(previous)
 
     def _test_small_strings_no_warn(self, compress):
         empty = np.array([], dtype='uint8')
@@ -386,6 +386,61 @@ class TestBasic(Base):
         check_round_trip(df, engine, write_kwargs=write_kwargs,
                          expected=expected)
 
+    @pytest.mark.parametrize('chunksize, sizes', [
+        (None, [4, 4, 2]), (1, [1] * 10), (3, [3, 3, 3, 1]),
+        (4, [4, 4, 2]), (6, [6, 4]), (20, [10])])
+    def test_read_chunks(self, engine, chunksize, sizes):
+        df = pd.DataFrame({'a': np.arange(10, dtype='int64'),
+                           'b': list('abcdefghij')})
+        if engine == 'pyarrow':
+            write_kwargs = {'row_group_size': 4}
+        else:
+            write_kwargs = {'row_group_offsets': 4}
+
+        with tm.ensure_clean() as path:
+            df.to_parquet(path, engine, compression=None, index=False,
+                          **write_kwargs)
+            chunks = list(read_parquet(path, engine, chunksize=chunksize,
+                                       iterator=True))
+        assert [len(chunk) for chunk in chunks] == sizes
+        result = pd.concat(chunks, ignore_index=True)
+        tm.assert_frame_equal(result, df)
+
+    def test_read_chunks_invalid(self, engine):
+        df = pd.DataFrame({'a': [1, 2, 3]})
+        with tm.ensure_clean() as path:
+            df.to_parquet(path, engine, compression=None)
+            with pytest.raises(ValueError, match="chunksize"):
+                read_parquet(path, engine, chunksize=0)
+
+    def test_read_chunks_reported(self, engine):
+        from pandas.io import common as icom
+        df = pd.DataFrame({'a': [1, 2, 3]})
+        events = []
+        with tm.ensure_clean() as path:
+            df.to_parquet(path, engine, compression=None)
+            icom.register_io_listener(events.append)
+            try:
+                chunks = list(read_parquet(path, engine, iterator=True))
+            finally:
+                icom.unregister_io_listener(events.append)
+            size = os.path.getsize(path)
+        assert sum(len(chunk) for chunk in chunks) == 3
+        assert [e.event for e in events] == ['read']
+        assert events[0].operation == 'read_parquet'
+        assert events[0].nbytes == size
+
+    def test_filters_partitioned(self, engine):
+        df = pd.DataFrame({'a': np.arange(6, dtype='int64'),
+                           'part': ['x', 'y'] * 3})
+        with tm.ensure_clean_dir() as path:
+            df.to_parquet(path, engine, partition_cols=['part'],
+                          compression=None)
+            result = read_parquet(path, engine, columns=['a', 'part'],
+                                  filters=[('part', '==', 'x')])
+        assert sorted(result['a']) == [0, 2, 4]
+        assert set(result['part'].astype(str)) == {'x'}
+
 
 class TestParquetPyArrow(Base):
 
@@ -466,6 +521,46 @@ class TestParquetPyArrow(Base):
             assert len(dataset.partitions.partition_names) == 2
             assert dataset.partitions.partition_names == set(partition_cols)
 
+    @pytest.mark.parametrize('use_threads', [True, False])
+    def test_use_threads(self, pa, df_compat, use_threads):
+        check_round_trip(df_compat, pa,
+                         read_kwargs={'use_threads': use_threads})
+
+    def test_filter_row_groups(self, pa):
+        if LooseVersion(pyarrow.__version__) < LooseVersion('1.0'):
+            pytest.skip("row group filters require pyarrow >= 1.0")
+        df = pd.DataFrame({'a': list(range(0, 3))})
+        with tm.ensure_clean() as path:
+            df.to_parquet(path, pa, compression=None, row_group_size=1)
+            result = read_parquet(path, pa, filters=[('a', '==', 0)])
+        assert len(result) == 1
+
+    @pytest.mark.parametrize('filters, values', [
+        ([('a', '==', 0)], [0]),
+        ([('a', '>', 2)], [2, 3, 4, 5]),
+        ([('a', 'in', [1, 5])], [0, 1, 4, 5]),
+        ([[('a', '<', 1)], [('a', '>=', 4)]], [0, 1, 4, 5]),
+        ([('a', '==', 0), ('b', '==', 'x')], [0, 1])])
+    def test_iter_filter_row_groups(self, pa, filters, values):
+        # row groups are skipped using their statistics, the rows of the
+        # remaining ones are not filtered
+        df = pd.DataFrame({'a': np.arange(6, dtype='int64'),
+                           'b': list('xyxyxy')})
+        with tm.ensure_clean() as path:
+            df.to_parquet(path, pa, compression=None, row_group_size=2)
+            chunks = list(read_parquet(path, pa, filters=filters,
+                                       iterator=True))
+        result = pd.concat(chunks, ignore_index=True)
+        assert list(result['a']) == values
+
+    def test_iter_filter_invalid_operator(self, pa):
+        df = pd.DataFrame({'a': np.arange(6, dtype='int64')})
+        with tm.ensure_clean() as path:
+            df.to_parquet(path, pa, compression=None)
+            with pytest.raises(ValueError, match="'~'"):
+                list(read_parquet(path, pa, filters=[('a', '~', 0)],
+                                  chunksize=2))
+
 
 class TestParquetFastParquet(Base):
 
@@ -518,6 +613,14 @@ class TestParquetFastParquet(Base):
             check_round_trip(df, fp_lt_014,
                              expected=df.astype('datetime64[ns]'))
 
+    def test_use_threads_unsupported(self, fp, df_compat):
+        with tm.ensure_clean() as path:
+            df_compat.to_parquet(path, fp, compression=None)
+            with pytest.raises(ValueError, match='use_threads'):
+                read_parquet(path, fp, use_threads=True)
+            with pytest.raises(ValueError, match='use_threads'):
+                read_parquet(path, fp, iterator=True, use_threads=False)
+
     def test_filter_row_groups(self, fp):
         d = {'a': list(range(0, 3))}
         df = pd.DataFrame(d)
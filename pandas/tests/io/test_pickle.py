@@ -14,6 +14,7 @@ $ python generate_legacy_storage_files.py <output_dir> pickle
 """
 import glob
 import pytest
+import numpy as np
 from warnings import catch_warnings, simplefilter
 
 import os
@@ -477,3 +478,77 @@ class TestProtocol(object):
             with tm.ensure_clean(get_random_path) as path:
                 df = tm.makeDataFrame()
                 df.to_pickle(path, protocol=protocol)
+
+
+# ---------------------
+# test out-of-band buffers
+# ---------------------
+
+@pytest.mark.skipif(pandas.compat.pickle5 is None,
+                    reason="pickle protocol 5 not available")
+class TestOutOfBand(object):
+
+    @pytest.fixture
+    def df(self):
+        return pd.DataFrame({
+            'int': np.arange(5, dtype='int64'),
+            'float': np.arange(5, dtype='float64') / 2,
+            'date': pd.date_range('2018-01-01', periods=5),
+            'datetz': pd.date_range('2018-01-01', periods=5, tz='US/Eastern'),
+            'cat': pd.Categorical(list('abcab')),
+            'obj': list('vwxyz')})
+
+    def test_buffers(self, df):
+        pickle5 = pandas.compat.pickle5
+        buffers = []
+        data = pickle5.dumps(df, protocol=5, buffer_callback=buffers.append)
+        # int, float, date, datetz and the codes of cat
+        assert len(buffers) >= 5
+        result = pickle5.loads(data, buffers=buffers)
+        tm.assert_frame_equal(result, df)
+
+        # in-band
+        result = pickle5.loads(pickle5.dumps(df, protocol=5))
+        tm.assert_frame_equal(result, df)
+
+    def test_buffers_grown_block(self):
+        # only the used rows of a block grown by insert are handed over
+        pickle5 = pandas.compat.pickle5
+        df = pd.DataFrame(index=range(3))
+        for i in range(5):
+            df[i] = float(i)
+        assert len(df._data.blocks) == 1
+
+        buffers = []
+        data = pickle5.dumps(df, protocol=5, buffer_callback=buffers.append)
+        assert [len(b.raw()) for b in buffers] == [5 * 3 * 8]
+        result = pickle5.loads(data, buffers=buffers)
+        tm.assert_frame_equal(result, df)
+
+    @pytest.mark.parametrize('compression', [None, 'gzip', 'zip'])
+    def test_round_trip(self, df, compression, get_random_path):
+        with tm.ensure_clean(get_random_path) as path:
+            df.to_pickle(path, compression=compression, protocol=5,
+                         out_of_band=True)
+            result = pd.read_pickle(path, compression=compression)
+        tm.assert_frame_equal(result, df)
+
+    def test_mmap(self, df, get_random_path):
+        with tm.ensure_clean(get_random_path) as path:
+            df.to_pickle(path, protocol=5, out_of_band=True)
+            result = pd.read_pickle(path, mmap=True)
+            tm.assert_frame_equal(result, df)
+            assert not result['float'].values.flags.writeable
+            del result
+
+    def test_mmap_compressed_raises(self, df, get_random_path):
+        with tm.ensure_clean(get_random_path) as path:
+            df.to_pickle(path, compression='gzip', protocol=5,
+                         out_of_band=True)
+            with pytest.raises(ValueError, match="compressed"):
+                pd.read_pickle(path, compression='gzip', mmap=True)
+
+    def test_protocol_raises(self, df, get_random_path):
+        with tm.ensure_clean(get_random_path) as path:
+            with pytest.raises(ValueError, match="protocol 5"):
+                df.to_pickle(path, protocol=4, out_of_band=True)
@@ -5029,6 +5029,42 @@ class TestHDFStore(Base):
             store.close()
             pytest.raises(IOError, read_hdf, store, 'df')
 
+    @td.skip_if_no('h5py')
+    def test_read_hdf_mmap(self):
+        df = DataFrame({'A': np.random.randn(10),
+                        'B': np.arange(10),
+                        'C': date_range('20130101', periods=10)})
+
+        with ensure_clean_path(self.path) as path:
+            df.to_hdf(path, 'df', mode='w')
+            result = read_hdf(path, 'df', mmap=True)
+            tm.assert_frame_equal(result, df)
+            for blk in result._data.blocks:
+                if blk.is_numeric:
+                    assert not blk.values.flags.writeable
+
+            result = read_hdf(path, 'df', mmap=True, start=2, stop=5)
+            tm.assert_frame_equal(result, df.iloc[2:5])
+
+    @td.skip_if_no('h5py')
+    def test_read_hdf_mmap_compressed(self):
+        # chunked nodes cannot be mapped and are read normally
+        df = tm.makeDataFrame()
+
+        with ensure_clean_path(self.path) as path:
+            df.to_hdf(path, 'df', mode='w', complevel=9, complib='zlib')
+            result = read_hdf(path, 'df', mmap=True)
+            tm.assert_frame_equal(result, df)
+            assert result._data.blocks[0].values.flags.writeable
+
+    def test_read_hdf_mmap_table_raises(self):
+        df = tm.makeDataFrame()
+
+        with ensure_clean_path(self.path) as path:
+            df.to_hdf(path, 'df', mode='w', format='table')
+            with pytest.raises(ValueError, match='Fixed format'):
+                read_hdf(path, 'df', mmap=True)
+
     def test_read_hdf_generic_buffer_errors(self):
         pytest.raises(NotImplementedError, read_hdf, BytesIO(b''), 'df')
 
@@ -0,0 +1,141 @@
+""" test the parallel ranged reads of remote files """
+import os
+
+import pytest
+
+import pandas as pd
+from pandas.compat import BytesIO
+import pandas.util.testing as tm
+
+from pandas.io.remote import RangeReader, RemoteFile, open_remote
+
+
+class LocalFileSystem(object):
+    """ Stand-in for s3fs/gcsfs over a dict of contents """
+
+    def __init__(self, files, etag='abc'):
+        self.files = files
+        self.etag = etag
+        self.reads = []
+
+    def info(self, path):
+        return {'Size': len(self.files[path]), 'ETag': self.etag}
+
+    def open(self, path, mode='rb', block_size=None):
+        fs = self
+
+        class File(BytesIO):
+            def read(self, n=-1):
+                fs.reads.append((path, self.tell(), n))
+                return BytesIO.read(self, n)
+
+        return File(self.files[path])
+
+
+@pytest.fixture
+def data():
+    return b''.join(b'%d,%d\n' % (i, i * 2) for i in range(1000))
+
+
+@pytest.fixture
+def fs(data):
+    return LocalFileSystem({'bucket/file.csv': data})
+
+
+def remote_file(fs, block_size=64, readahead=2, threads=2, cache_dir=None):
+    reader = RangeReader(fs, 'bucket/file.csv')
+    return RemoteFile(reader, 's3://bucket/file.csv', block_size,
+                      readahead=readahead, threads=threads,
+                      cache_dir=cache_dir)
+
+
+@pytest.mark.parametrize('threads', [1, 4])
+@pytest.mark.parametrize('readahead', [0, 3])
+def test_read(fs, data, threads, readahead):
+    with remote_file(fs, readahead=readahead, threads=threads) as f:
+        assert f.read(10) == data[:10]
+        assert f.read(100) == data[10:110]
+        assert f.tell() == 110
+        assert f.read() == data[110:]
+        assert f.read() == b''
+
+
+def test_seek(fs, data):
+    with remote_file(fs) as f:
+        f.seek(-20, os.SEEK_END)
+        assert f.read() == data[-20:]
+        f.seek(500)
+        f.seek(10, os.SEEK_CUR)
+        assert f.read(30) == data[510:540]
+        f.seek(0)
+        assert f.read(5) == data[:5]
+        with pytest.raises(ValueError, match='negative seek'):
+            f.seek(-1)
+
+
+def test_readline(fs, data):
+    with remote_file(fs) as f:
+        assert list(f) == BytesIO(data).readlines()
+
+
+def test_read_csv(fs, data):
+    expected = pd.read_csv(BytesIO(data), header=None)
+    with remote_file(fs) as f:
+        tm.assert_frame_equal(pd.read_csv(f, header=None), expected)
+
+
+def test_ranges(fs, data):
+    with remote_file(fs, block_size=100, readahead=0, threads=1) as f:
+        f.read(150)
+    assert sorted(fs.reads) == [('bucket/file.csv', 0, 100),
+                                ('bucket/file.csv', 100, 100)]
+
+
+def test_cache(fs, data):
+    with tm.ensure_clean_dir() as cache_dir:
+        with remote_file(fs, cache_dir=cache_dir) as f:
+            assert f.read() == data
+        assert fs.reads
+        assert len(os.listdir(cache_dir)) == -(-len(data) // 64)
+
+        # served from disk
+        fs.reads = []
+        with remote_file(fs, cache_dir=cache_dir) as f:
+            assert f.read() == data
+        assert fs.reads == []
+
+        # a changed object is fetched again
+        fs.etag = 'def'
+        with remote_file(fs, cache_dir=cache_dir) as f:
+            assert f.read() == data
+        assert fs.reads
+
+
+def test_open_remote(fs, data):
+    # disabled by default
+    f = open_remote(fs, 'bucket/file.csv', 's3://bucket/file.csv')
+    assert not isinstance(f, RemoteFile)
+
+    with pd.option_context('io.remote.threads', 2,
+                           'io.remote.block_size', 128):
+        f = open_remote(fs, 'bucket/file.csv', 's3://bucket/file.csv')
+        assert isinstance(f, RemoteFile)
+        assert f.read() == data
+        f.close()
+
+        # writing goes through the filesystem
+        f = open_remote(fs, 'bucket/file.csv', 's3://bucket/file.csv',
+                        mode='wb')
+        assert not isinstance(f, RemoteFile)
+
+
+def test_read_csv_s3(s3_resource, tips_file):
+    tips_df = pd.read_csv(tips_file)
+    with tm.ensure_clean_dir() as cache_dir:
+        with pd.option_context('io.remote.threads', 4,
+                               'io.remote.block_size', 1024,
+                               'io.remote.cache_dir', cache_dir):
+            for _ in range(2):
+                result = pd.read_csv('s3://pandas-test/tips.csv')
+                tm.assert_frame_equal(result, tips_df)
+            assert os.listdir(cache_dir)
@@ -434,6 +434,54 @@ class PandasSQLTest(object):
         assert num_rows == num_entries
         self.drop_table('test_frame1')
 
+    def _to_sql_method_multi(self):
+        self.drop_table('test_frame1')
+
+        self.pandasSQL.to_sql(self.test_frame1, 'test_frame1',
+                              method='multi')
+        assert self.pandasSQL.has_table('test_frame1')
+
+        num_entries = len(self.test_frame1)
+        num_rows = self._count_rows('test_frame1')
+        assert num_rows == num_entries
+
+        # explicit chunks
+        self.pandasSQL.to_sql(self.test_frame1, 'test_frame1',
+                              if_exists='append', method='multi',
+                              chunksize=2)
+        num_rows = self._count_rows('test_frame1')
+        assert num_rows == 2 * num_entries
+
+        self.drop_table('test_frame1')
+
+    def _to_sql_method_callable(self):
+        check = []  # used to double check function below is really being used
+
+        def sample(pd_table, conn, keys, data_iter):
+            check.append(1)
+            data = [dict(zip(keys, row)) for row in data_iter]
+            conn.execute(pd_table.table.insert(), data)
+        self.drop_table('test_frame1')
+
+        self.pandasSQL.to_sql(self.test_frame1, 'test_frame1', method=sample)
+        assert self.pandasSQL.has_table('test_frame1')
+
+        assert check == [1]
+        num_entries = len(self.test_frame1)
+        num_rows = self._count_rows('test_frame1')
+        assert num_rows == num_entries
+        # Nuke table
+        self.drop_table('test_frame1')
+
+    def _to_sql_method_invalid(self):
+        self.drop_table('test_frame1')
+
+        with pytest.raises(ValueError, match='Invalid parameter `method`'):
+            self.pandasSQL.to_sql(self.test_frame1, 'test_frame1',
+                                  method='bulk')
+
+        self.drop_table('test_frame1')
+
     def _roundtrip(self):
         self.drop_table('test_frame_roundtrip')
         self.pandasSQL.to_sql(self.test_frame1, 'test_frame_roundtrip')
@@ -530,6 +578,23 @@ class _TestSQLApi(PandasSQLTest):
             "SELECT * FROM iris_view", self.conn)
         self._check_iris_loaded_frame(iris_frame)
 
+    def test_read_sql_fetch_batches(self, monkeypatch):
+        # result sets spanning several fetchmany batches are assembled
+        # column by column
+        expected = sql.read_sql_query("SELECT * FROM iris", self.conn)
+
+        monkeypatch.setattr(sql, '_FETCH_BATCH_SIZE', 7)
+        result = sql.read_sql_query("SELECT * FROM iris", self.conn)
+        tm.assert_frame_equal(result, expected)
+        self._check_iris_loaded_frame(result)
+
+    def test_read_sql_empty_result(self):
+        result = sql.read_sql_query(
+            "SELECT * FROM iris WHERE Name = 'unknown'", self.conn)
+        assert len(result) == 0
+        assert list(result.columns) == ['SepalLength', 'SepalWidth',
+                                        'PetalLength', 'PetalWidth', 'Name']
+
     def test_to_sql(self):
         sql.to_sql(self.test_frame1, 'test_frame1', self.conn)
         assert sql.has_table('test_frame1', self.conn)
@@ -1217,6 +1282,15 @@ class _TestSQLAlchemy(SQLAlchemyMixIn, PandasSQLTest):
     def test_to_sql_append(self):
         self._to_sql_append()
 
+    def test_to_sql_method_multi(self):
+        self._to_sql_method_multi()
+
+    def test_to_sql_method_callable(self):
+        self._to_sql_method_callable()
+
+    def test_to_sql_method_invalid(self):
+        self._to_sql_method_invalid()
+
     def test_create_table(self):
         temp_conn = self.connect()
         temp_frame = DataFrame(
@@ -1242,6 +1316,47 @@ class _TestSQLAlchemy(SQLAlchemyMixIn, PandasSQLTest):
 
         assert not temp_conn.has_table('temp_frame')
 
+    def test_metadata_cache(self):
+        temp_frame = DataFrame(
+            {'one': [1., 2., 3., 4.], 'two': [4., 3., 2., 1.]})
+
+        pandasSQL = sql.SQLDatabase(self.conn)
+        pandasSQL.to_sql(temp_frame, 'temp_frame')
+        tbl = pandasSQL.get_table('temp_frame')
+        assert pandasSQL.has_table('temp_frame')
+
+        # appends and reads reuse the cached table
+        pandasSQL.to_sql(temp_frame, 'temp_frame', if_exists='append')
+        result = sql.read_sql_table('temp_frame', pandasSQL)
+        assert len(result) == 2 * len(temp_frame)
+        assert pandasSQL.get_table('temp_frame') is tbl
+
+        # dropping through another object needs explicit invalidation
+        sql.SQLDatabase(self.conn).drop_table('temp_frame')
+        assert pandasSQL.has_table('temp_frame')
+        pandasSQL.invalidate_cache('temp_frame')
+        assert not pandasSQL.has_table('temp_frame')
+        assert pandasSQL.get_table('temp_frame') is None
+
+        pandasSQL.get_table('iris')
+        assert len(pandasSQL.tables)
+        pandasSQL.invalidate_cache()
+        assert not len(pandasSQL.tables)
+
+    def test_drop_table_invalidates_cache(self):
+        temp_frame = DataFrame(
+            {'one': [1., 2., 3., 4.], 'two': [4., 3., 2., 1.]})
+
+        pandasSQL = sql.SQLDatabase(self.conn)
+        pandasSQL.to_sql(temp_frame, 'temp_frame')
+        pandasSQL.drop_table('temp_frame')
+        assert not pandasSQL.has_table('temp_frame')
+
+        pandasSQL.to_sql(temp_frame.iloc[:2], 'temp_frame', if_exists='fail')
+        result = pandasSQL.read_table('temp_frame')
+        assert len(result) == 2
+        pandasSQL.drop_table('temp_frame')
+
     def test_roundtrip(self):
         self._roundtrip()
 
@@ -1775,6 +1890,105 @@ class _TestSQLiteAlchemy(object):
             sql.read_sql_table('test_bigintwarning', self.conn)
             assert len(w) == 0
 
+    @pytest.mark.parametrize('num_partitions', [1, 3, 8, 200])
+    def test_read_sql_partitioned_file(self, num_partitions):
+        # partitions are read concurrently from the engine's pool
+        df = DataFrame({'id': np.arange(100),
+                        'value': np.random.randn(100)})
+        df.loc[5, 'id'] = np.nan
+        df.loc[50, 'id'] = 1000
+
+        with tm.ensure_clean('partitioned.db') as path:
+            engine = sqlalchemy.create_engine('sqlite:///' + path)
+            try:
+                df.to_sql('test_partitioned', engine, index=False)
+                result = sql.read_sql_table(
+                    'test_partitioned', engine, partition_column='id',
+                    lower_bound=0, upper_bound=100,
+                    num_partitions=num_partitions)
+                tm.assert_frame_equal(
+                    result.sort_values('value').reset_index(drop=True),
+                    df.sort_values('value').reset_index(drop=True))
+
+                result = sql.read_sql_query(
+                    'SELECT * FROM test_partitioned WHERE value > ?',
+                    engine, params=(0,), partition_column='id',
+                    lower_bound=0, upper_bound=100,
+                    num_partitions=num_partitions)
+                expected = df[df.value > 0]
+                tm.assert_frame_equal(
+                    result.sort_values('value').reset_index(drop=True),
+                    expected.sort_values('value').reset_index(drop=True))
+            finally:
+                engine.dispose()
+
+    def test_read_sql_partitioned_pool_size(self):
+        # no more partitions are read at once than the pool has connections
+        from sqlalchemy.pool import NullPool, QueuePool
+        df = DataFrame({'id': np.arange(100),
+                        'value': np.random.randn(100)})
+
+        with tm.ensure_clean('partitioned.db') as path:
+            engine = sqlalchemy.create_engine(
+                'sqlite:///' + path, poolclass=QueuePool, pool_size=2,
+                max_overflow=1, pool_timeout=1)
+            try:
+                assert sql.SQLDatabase(engine)._max_workers(20) == 3
+                assert sql.SQLDatabase(engine)._max_workers(2) == 2
+
+                df.to_sql('test_partitioned', engine, index=False)
+                result = sql.read_sql_table(
+                    'test_partitioned', engine, partition_column='id',
+                    lower_bound=0, upper_bound=100, num_partitions=20)
+                tm.assert_frame_equal(
+                    result.sort_values('id').reset_index(drop=True), df)
+            finally:
+                engine.dispose()
+
+            engine = sqlalchemy.create_engine('sqlite:///' + path,
+                                              poolclass=NullPool)
+            try:
+                assert sql.SQLDatabase(engine)._max_workers(20) == 20
+            finally:
+                engine.dispose()
+
+    def test_read_sql_partitioned(self):
+        # in-memory databases and connections are read one partition after
+        # another
+        expected = sql.read_sql_table('types_test_data', self.conn)
+        result = sql.read_sql_table('types_test_data', self.conn,
+                                    partition_column='IntCol',
+                                    lower_bound=-10, upper_bound=10,
+                                    num_partitions=4)
+        tm.assert_frame_equal(
+            result.sort_values('IntCol').reset_index(drop=True),
+            expected.sort_values('IntCol').reset_index(drop=True))
+
+        iris = sqlalchemy.Table('iris', sqlalchemy.MetaData(),
+                                autoload=True, autoload_with=self.conn)
+        query = sqlalchemy.select([iris])
+        result = sql.read_sql_query(query, self.conn,
+                                    partition_column='SepalLength',
+                                    lower_bound=4.5, upper_bound=7.5,
+                                    num_partitions=3)
+        assert len(result) == 150
+        self._check_iris_loaded_frame(result)
+
+    def test_read_sql_partitioned_invalid(self):
+        with pytest.raises(ValueError, match='num_partitions'):
+            sql.read_sql_table('types_test_data', self.conn,
+                               partition_column='IntCol', lower_bound=0,
+                               upper_bound=10, num_partitions=0)
+        with pytest.raises(ValueError, match='smaller than'):
+            sql.read_sql_table('types_test_data', self.conn,
+                               partition_column='IntCol', lower_bound=10,
+                               upper_bound=0, num_partitions=2)
+        with pytest.raises(ValueError, match='chunksize'):
+            sql.read_sql_query('SELECT * FROM iris', self.conn,
+                               partition_column='SepalLength',
+                               lower_bound=0, upper_bound=10,
+                               num_partitions=2, chunksize=10)
+
 
 class _TestMySQLAlchemy(object):
     """
@@ -2011,6 +2225,12 @@ class TestSQLiteFallback(SQLiteMixIn, PandasSQLTest):
     def test_to_sql_append(self):
         self._to_sql_append()
 
+    def test_to_sql_method_multi(self):
+        self._to_sql_method_multi()
+
+    def test_to_sql_method_invalid(self):
+        self._to_sql_method_invalid()
+
     def test_create_and_drop_table(self):
         temp_frame = DataFrame(
             {'one': [1., 2., 3., 4.], 'two': [4., 3., 2., 1.]})
@@ -2189,6 +2409,82 @@ def tquery(query, con=None, cur=None):
         return list(res)
 
 
+class _TypeObject(object):
+    # a DBAPI type object comparing equal to several type codes
+
+    def __init__(self, *codes):
+        self.codes = codes
+
+    def __eq__(self, other):
+        return other in self.codes
+
+
+class TestColumnBuffers(object):
+
+    dbapi = type('dbapi', (object, ), {'NUMBER': _TypeObject(1, 2),
+                                       'DATETIME': _TypeObject(3)})
+
+    def test_column_kinds(self):
+        description = [('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', None)]
+        assert sql._column_kinds(description, self.dbapi) == [
+            'number', 'number', 'datetime', None, None]
+        assert sql._column_kinds(description, None) is None
+        assert sql._column_kinds(None, self.dbapi) is None
+
+    def _read(self, batches, kinds, coerce_float=True):
+        buffers = sql._ColumnBuffers(['a'], kinds=kinds,
+                                     coerce_float=coerce_float, capacity=2)
+        for batch in batches:
+            buffers.append([(value, ) for value in batch])
+        return buffers.to_frame()['a']
+
+    @pytest.mark.parametrize('batches, dtype', [
+        ([[1, 2], [3, 4, 5]], 'int64'),
+        ([[1, 2], [3.5]], 'float64'),
+        ([[1.5], [2, 3]], 'float64'),
+        ([[1, None], [3]], 'float64'),
+        ([[None], [None, 1], [2]], 'float64'),
+        ([[1], [None, None]], 'float64'),
+        ([[True, False], [True]], 'bool'),
+        ([[True], [None]], 'object'),
+        ([[None], [True]], 'object'),
+        ([[True], [1]], 'object'),
+        ([[1], ['x']], 'object'),
+        ([[None], [None]], 'object'),
+        ([[datetime(2018, 1, 1)], [None, datetime(2018, 1, 2)]],
+         'datetime64[ns]'),
+        ([[datetime(2018, 1, 1)], [date(2018, 1, 2)]], 'object'),
+    ])
+    def test_typed_buffers(self, batches, dtype):
+        kind = 'datetime' if dtype.startswith('datetime') else 'number'
+        result = self._read(batches, [kind])
+        expected = self._read(batches, None)
+        assert result.dtype == dtype
+        tm.assert_series_equal(result, expected)
+
+    def test_typed_buffers_decimal(self):
+        from decimal import Decimal
+        batches = [[Decimal('1.5')], [Decimal('2.5')]]
+        result = self._read(batches, ['number'])
+        assert result.dtype == 'float64'
+
+        result = self._read(batches, ['number'], coerce_float=False)
+        expected = self._read(batches, None, coerce_float=False)
+        assert result.dtype == 'object'
+        tm.assert_series_equal(result, expected)
+
+    def test_to_frame_not_consolidated(self):
+        # the column arrays are not stacked into a copy
+        buffers = sql._ColumnBuffers(['a', 'b', 'c'],
+                                     kinds=['number', 'number', None])
+        buffers.append([(1.5, 2.5, 'x'), (3.5, 4.5, 'y')])
+        result = buffers.to_frame()
+        assert len(result._data.blocks) == 3
+        expected = DataFrame({'a': [1.5, 3.5], 'b': [2.5, 4.5],
+                              'c': ['x', 'y']}, columns=['a', 'b', 'c'])
+        tm.assert_frame_equal(result, expected)
+
+
 def _skip_if_no_pymysql():
     try:
         import pymysql  # noqa
@@ -2694,3 +2990,88 @@ class TestXMySQL(MySQLMixIn):
         assert (tquery(sql_select, con=self.conn) ==
                 [(1, 'A'), (2, 'B'), (3, 'C'), (4, 'D'), (5, 'E')])
         clean_up(table_name)
+
+
+@pytest.mark.skipif(not PY36, reason="asynchronous generators need PY36")
+class TestSQLiteAsync(object):
+    """
+    Test the awaitable reader and writer against aiosqlite.
+    """
+
+    @pytest.fixture
+    def con(self):
+        import asyncio
+        aiosqlite = pytest.importorskip('aiosqlite')
+        self.loop = asyncio.new_event_loop()
+        with tm.ensure_clean('async.db') as path:
+            con = self.run(aiosqlite.connect(path))
+            yield con
+            self.run(con.close())
+        self.loop.close()
+
+    def run(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_roundtrip(self, con):
+        df = DataFrame({'A': np.arange(10),
+                        'B': np.random.randn(10),
+                        'C': list('abcdefghij')})
+
+        self.run(df.to_sql_async('test_async', con, index=False))
+        result = self.run(sql.read_sql_query_async('SELECT * FROM test_async',
+                                                   con))
+        tm.assert_frame_equal(result, df)
+
+        with pytest.raises(ValueError, match='already exists'):
+            self.run(df.to_sql_async('test_async', con))
+
+        self.run(df.to_sql_async('test_async', con, index=False,
+                                 if_exists='append', chunksize=3,
+                                 method='multi'))
+        result = self.run(sql.read_sql_query_async(
+            'SELECT * FROM test_async WHERE A < ?', con, params=(5, ),
+            index_col='A'))
+        expected = concat([df, df]).set_index('A')
+        expected = expected[expected.index < 5]
+        tm.assert_frame_equal(result.sort_index(), expected.sort_index())
+
+        self.run(df.iloc[:2].to_sql_async('test_async', con, index=False,
+                                          if_exists='replace'))
+        result = self.run(sql.read_sql_query_async('SELECT * FROM test_async',
+                                                   con))
+        tm.assert_frame_equal(result, df.iloc[:2])
+
+    def test_chunked_read(self, con):
+        df = DataFrame({'A': np.arange(10), 'B': np.random.randn(10)})
+        self.run(df.to_sql_async('test_async', con, index=False))
+
+        it = sql.read_sql_query_async('SELECT * FROM test_async', con,
+                                      chunksize=4)
+        chunks = []
+        while True:
+            try:
+                chunks.append(self.run(it.__anext__()))
+            except StopAsyncIteration:  # noqa:F821
+                break
+
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        tm.assert_frame_equal(concat(chunks, ignore_index=True), df)
+
+    def test_insert_streamed(self, con, monkeypatch):
+        from pandas.io import _sql_async
+        monkeypatch.setattr(_sql_async, '_FETCH_BATCH_SIZE', 3)
+        sizes = []
+
+        def insert(table, cursor, keys, data_iter):
+            # no async def, this module is compiled by older interpreters
+            data = list(data_iter)
+            sizes.append(len(data))
+            return cursor.executemany(table.insert_statement(), data)
+
+        df = DataFrame({'A': np.arange(10), 'B': np.random.randn(10)})
+        self.run(df.to_sql_async('test_async', con, index=False,
+                                 method=insert))
+        assert sizes == [3, 3, 3, 1]
+        result = self.run(sql.read_sql_query_async('SELECT * FROM test_async',
+                                                   con))
+        tm.assert_frame_equal(result, df)
@@ -1151,6 +1151,74 @@ class TestStata(object):
                 tm.assert_frame_equal(from_frame, chunk, check_dtype=False)
                 pos += chunksize
 
+    @pytest.mark.parametrize('file', ['dta3_115', 'dta3_117', 'dta4_117'])
+    def test_read_memory_map(self, file):
+        fname = getattr(self, file)
+        expected = read_stata(fname)
+        result = read_stata(fname, memory_map=True)
+        tm.assert_frame_equal(result, expected)
+
+        columns = list(expected.columns[::-1][:3])
+        result = read_stata(fname, memory_map=True, columns=columns)
+        tm.assert_frame_equal(result, expected[columns])
+
+        with read_stata(fname, chunksize=4, memory_map=True) as itr:
+            from_chunks = pd.concat(itr)
+        tm.assert_frame_equal(from_chunks, expected)
+
+    def test_read_memory_map_buffer(self):
+        # a buffer cannot be mapped, fall back to reading it
+        expected = read_stata(self.dta3_117)
+        with open(self.dta3_117, 'rb') as f:
+            result = read_stata(io.BytesIO(f.read()), memory_map=True)
+        tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('use_threads', [True, 3])
+    @pytest.mark.parametrize('columns', [None, ['quarter', 'cpi', 'm1']])
+    def test_iterator_use_threads(self, use_threads, columns):
+        fname = self.dta3_117
+        expected = read_stata(fname, columns=columns)
+        with read_stata(fname, chunksize=3, columns=columns,
+                        use_threads=use_threads) as itr:
+            chunks = list(itr)
+        assert all(len(chunk) <= 3 for chunk in chunks)
+        tm.assert_frame_equal(pd.concat(chunks), expected)
+
+    def test_iterator_use_threads_date_error(self, monkeypatch):
+        # a failed date conversion closes the reader on the calling thread
+        import threading
+
+        def bad_date(dates, fmt):
+            raise ValueError("Date fmt {fmt} not understood".format(fmt=fmt))
+
+        closed_on = []
+        close = StataReader.close
+
+        def record_close(reader):
+            closed_on.append(threading.current_thread())
+            close(reader)
+
+        monkeypatch.setattr(
+            'pandas.io.stata._stata_elapsed_date_to_datetime_vec', bad_date)
+        monkeypatch.setattr(StataReader, 'close', record_close)
+        with read_stata(self.dta2_117, chunksize=1, use_threads=2) as itr:
+            with pytest.raises(ValueError, match='not understood'):
+                next(itr)
+        assert closed_on
+        assert all(thread is threading.current_thread()
+                   for thread in closed_on)
+
+    def test_iterator_use_threads_categoricals(self):
+        fname = self.dta19_115
+        with read_stata(fname, chunksize=1) as itr:
+            expected = list(itr)
+        with read_stata(fname, chunksize=1, use_threads=2,
+                        memory_map=True) as itr:
+            result = list(itr)
+        assert len(result) == len(expected)
+        for chunk, expected_chunk in zip(result, expected):
+            tm.assert_frame_equal(chunk, expected_chunk)
+
     @pytest.mark.parametrize('version', [114, 117])
     def test_write_variable_labels(self, version):
         # GH 13631, add support for writing variable labels
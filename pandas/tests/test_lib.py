@@ -40,6 +40,35 @@ class TestMisc(object):
         out = lib.fast_unique_multiple_list_gen(gen, sort=False)
         tm.assert_numpy_array_equal(np.array(out), expected)
 
+    def test_decode_fixed_width(self):
+        values = np.array([b'ab\x00x', b'ab  ', b'\x00\x00\x00\x00',
+                           b'\xc3\xa9  '], dtype='S4')
+        values = values.view(np.uint8).reshape(4, 4)
+
+        result = lib.decode_fixed_width(values, 'utf-8')
+        expected = np.array([u'ab\x00x', u'ab  ', u'', u'\xe9  '],
+                            dtype=object)
+        tm.assert_numpy_array_equal(result, expected)
+
+        result = lib.decode_fixed_width(values, 'utf-8', nul_terminated=True,
+                                        strip_spaces=True, blank_missing=True)
+        expected = np.array([u'ab', u'ab', np.nan, u'\xe9'], dtype=object)
+        tm.assert_numpy_array_equal(result, expected)
+        # repeated values share one decoded object
+        assert result[0] is result[1]
+
+        result = lib.decode_fixed_width(values, None, strip_spaces=True)
+        expected = np.array([b'ab\x00x', b'ab', b'', b'\xc3\xa9'],
+                            dtype=object)
+        tm.assert_numpy_array_equal(result, expected)
+
+    def test_decode_fixed_width_strided(self):
+        values = np.frombuffer(b'a b bbc ', dtype=np.uint8).reshape(2, 4)
+        result = lib.decode_fixed_width(values[:, 2:], 'ascii',
+                                        strip_spaces=True)
+        expected = np.array([u'b', u'c'], dtype=object)
+        tm.assert_numpy_array_equal(result, expected)
+
 
 class TestIndexing(object):
 
@@ -392,8 +392,28 @@ class DummyBuildSrc(Command):
         pass
 
 
+# modules using syntax that older interpreters cannot compile, left out of
+# the build (and so of the byte-compilation at install time) on those
+_MIN_PYTHON_MODULES = {('pandas.io', '_sql_async'): (3, 6)}
+
+if 'build_py' in cmdclass:
+    _build_py = cmdclass['build_py']
+else:
+    from setuptools.command.build_py import build_py as _build_py
+
+
+class BuildPy(_build_py):
+
+    def find_package_modules(self, package, package_dir):
+        modules = _build_py.find_package_modules(self, package, package_dir)
+        return [(pkg, module, filename) for pkg, module, filename in modules
+                if sys.version_info >=
+                _MIN_PYTHON_MODULES.get((pkg, module), (0, ))]
+
+
 cmdclass.update({'clean': CleanCommand,
-                 'build': build})
+                 'build': build,
+                 'build_py': BuildPy})
 
 try:
     from wheel.bdist_wheel import bdist_wheel